@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:51
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0003_add_auth0_sub_field"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Auth0KeySet",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="Salute ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("domain", models.CharField(max_length=255, unique=True)),
+                ("keys", models.JSONField(default=dict, help_text="The JSON Web Keys for the domain, by key ID")),
+                ("fetched_at", models.DateTimeField()),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -129,3 +129,17 @@ class DistrictUserRole(BaseModel):
 
     def __str__(self) -> str:
         return f"{self.user} is {self.level} for {self.district}"
+
+
+class Auth0KeySet(BaseModel):
+    """The signing keys for an Auth0 domain, shared between the worker processes.
+
+    Each process keeps its own copy of the keys, which it refreshes from here or from Auth0 in the background.
+    """
+
+    domain = models.CharField(max_length=255, unique=True)
+    keys = models.JSONField(default=dict, help_text="The JSON Web Keys for the domain, by key ID")
+    fetched_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Signing keys for {self.domain}"
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Literal, TypedDict
 
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 
 from salute.accounts.models import User
@@ -29,7 +34,59 @@ class AuthInfo(TypedDict):
     scopes: list[str]
 
 
-def authenticate_user_with_bearer_token(token: str) -> AuthInfo:
+VERIFIED_TOKEN_CACHE_SIZE = 1024
+
+
+class VerifiedTokenCache:
+    """
+    A bounded, in-process cache of the tokens that have passed validation.
+
+    Tokens are keyed by their hash and expire with the token, so a repeated token skips the signature and claim
+    checks. The least recently used token is evicted when the cache is full.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._tokens: OrderedDict[str, Auth0TokenInfo] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Auth0TokenInfo | None:
+        key = self._get_key(token)
+        with self._lock:
+            token_info = self._tokens.get(key)
+            if token_info is None:
+                return None
+            if token_info.expires_at is None or token_info.expires_at <= time.time():
+                del self._tokens[key]
+                return None
+            self._tokens.move_to_end(key)
+            return token_info
+
+    def set(self, token: str, token_info: Auth0TokenInfo) -> None:
+        # Tokens without an expiry can't be removed once they are no longer valid, so are never cached
+        if token_info.expires_at is None:
+            return
+
+        key = self._get_key(token)
+        with self._lock:
+            self._tokens[key] = token_info
+            self._tokens.move_to_end(key)
+            while len(self._tokens) > self.maxsize:
+                self._tokens.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+
+verified_tokens = VerifiedTokenCache(maxsize=VERIFIED_TOKEN_CACHE_SIZE)
+
+
+def _validate_token(token: str) -> Auth0TokenInfo:
     # Handle token validation errors
     try:
         token_info = get_token_info(token)
@@ -52,11 +109,22 @@ def authenticate_user_with_bearer_token(token: str) -> AuthInfo:
     if "salute:user" not in token_info.scopes:
         raise RequestAuthenticationError(errors=[{"message": "Insufficient permissions: 'salute:user' scope required"}])
 
+    return token_info
+
+
+async def authenticate_user_with_bearer_token(token: str) -> AuthInfo:
+    token_info = verified_tokens.get(token)
+    if token_info is None:
+        # Validation may need to fetch the signing keys, so runs in a thread
+        token_info = await sync_to_async(_validate_token)(token)
+        verified_tokens.set(token, token_info)
+
+    # The user is loaded for every request, so changes to the account take effect immediately
     try:
-        user = User.objects.get(auth0_sub=token_info.sub)
+        user = await User.objects.select_related("person").aget(auth0_sub=token_info.sub)
     except User.DoesNotExist:
         try:
-            user = _attempt_to_link_user(token, token_info)
+            user = await sync_to_async(_attempt_to_link_user)(token, token_info)
         except UnableToLinkAccountError as e:
             raise RequestAuthenticationError(errors=[{"message": f"Unable to link account: {e.reason}"}]) from e
         except Exception as e:  # noqa: BLE001
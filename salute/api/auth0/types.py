@@ -7,6 +7,7 @@ class Auth0TokenInfo:
     aud: str
     sub: str
     scopes: list[str]
+    expires_at: int | None = None
 
     def get_google_uid(self) -> str | None:
         if not self.sub.startswith("google-oauth2|"):
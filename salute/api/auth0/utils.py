@@ -1,8 +1,13 @@
+import datetime
+import logging
+import threading
+import time
 from typing import Any
 
 import requests
 from django.conf import settings
-from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
 from joserfc import jwt
 from joserfc.errors import (
     BadSignatureError,
@@ -15,8 +20,19 @@ from joserfc.errors import (
 from joserfc.jwk import JWKRegistry, Key
 from joserfc.jws import CompactSignature
 
+from salute.accounts.models import Auth0KeySet
 from salute.api.auth0.types import Auth0TokenInfo
 
+logger = logging.getLogger(__name__)
+
+# Keys are refreshed in the background once they are this fraction of AUTH0_JWKS_CACHE_TIMEOUT old
+JWKS_REFRESH_AHEAD = 0.8
+# The minimum number of seconds between attempts to refresh the keys
+JWKS_MIN_REFRESH_INTERVAL = 60
+
+# Importing a key is slow, so imported keys are kept by key ID along with the JWK that they were imported from
+_imported_keys: dict[str, tuple[dict[str, Any], Key]] = {}
+
 
 def _fetch_jwks(domain: str) -> list[dict[str, Any]]:
     try:
@@ -26,32 +42,135 @@ def _fetch_jwks(domain: str) -> list[dict[str, Any]]:
         return data.get("keys", [])
     except (requests.RequestException, ValueError):
         # Handle network errors or JSON parsing errors
-        # Log the error for debugging purposes
-        # import logging
-        # logger = logging.getLogger(__name__)
-        # logger.error(f"Error fetching JWKS: {str(e)}")
+        logger.exception("Error fetching JWKS from %s", domain)
         return []
 
 
-def get_jwks() -> dict[str, dict[str, Any]]:
-    auth0_domain = settings.AUTH0_DOMAIN  # type: ignore[misc]
-    jwks_cache_key = f"AUTH0_JWKS__{auth0_domain}"
-
-    # If we have cached keys, return them
-    if keys := cache.get(jwks_cache_key):
-        return keys
+class JWKSStore:
+    """
+    The signing keys for an Auth0 domain.
 
-    new_keys = _fetch_jwks(auth0_domain)
+    Requests are served from an in-process copy of the keys. The copy is refreshed in a background thread before it
+    expires, from the keys in the database if another process has fetched them more recently, or otherwise from Auth0.
+    If Auth0 can't be reached the existing keys continue to be used. Requests only wait for Auth0 when neither this
+    process nor the database has any keys, and until then every request tries to fetch them, one at a time.
+    """
 
-    # If there aren't any keys, do not cache them.
-    if not new_keys:
-        return {}
+    def __init__(self, domain: str) -> None:
+        self.domain = domain
+        self.keys: dict[str, dict[str, Any]] = {}
+        self.fetched_at: datetime.datetime | None = None
+        self._lock = threading.Lock()
+        self._initial_load_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+        self._last_refresh_attempt: float | None = None
+
+    def get_keys(self) -> dict[str, dict[str, Any]]:
+        if self.fetched_at is None:
+            self._load_initial_keys()
+        elif timezone.now() - self.fetched_at >= self._get_refresh_age():
+            self.refresh_in_background()
+        return self.keys
+
+    def refresh_in_background(self) -> None:
+        """Refresh the keys in a background thread, unless they have been refreshed recently."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            if not self._start_refresh_attempt():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_in_thread, name=f"jwks-refresh-{self.domain}", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def refresh(self) -> None:
+        """Load the keys from the database if they are newer than ours, and otherwise fetch them from Auth0."""
+        self._load_from_database()
+        if self.fetched_at is not None and timezone.now() - self.fetched_at < self._get_refresh_age():
+            return
+        self._fetch_from_auth0()
+
+    def _load_from_database(self) -> bool:
+        """Use the keys in the database if they are newer than ours, returning False if there aren't any."""
+        key_set = Auth0KeySet.objects.filter(domain=self.domain).first()
+        if key_set is None:
+            return False
+        if self.fetched_at is None or key_set.fetched_at > self.fetched_at:
+            self._set_keys(key_set.keys, key_set.fetched_at)
+        return True
+
+    def _fetch_from_auth0(self) -> None:
+        new_keys = _fetch_jwks(self.domain)
+
+        # If there aren't any keys, Auth0 is unavailable, so keep the keys that we have
+        if not new_keys:
+            logger.warning("Unable to fetch JWKS for %s, using existing keys", self.domain)
+            return
+
+        # Arrange the keys by Key ID
+        key_dict = {key["kid"]: key for key in new_keys if "kid" in key}
+        fetched_at = timezone.now()
+        Auth0KeySet.objects.update_or_create(domain=self.domain, defaults={"keys": key_dict, "fetched_at": fetched_at})
+        self._set_keys(key_dict, fetched_at)
+
+    def _load_initial_keys(self) -> None:
+        """Load the keys while the request waits, as this process doesn't have any yet.
+
+        Keys in the database are used straight away, even if they are due to be refreshed, as that is done in the
+        background. Otherwise they are fetched from Auth0. Requests that arrive while the keys are being loaded wait
+        for that load rather than starting another one. If it couldn't get any keys, they are returned without any,
+        and the next request tries again.
+        """
+        if not self._initial_load_lock.acquire(blocking=False):
+            with self._initial_load_lock:
+                return
+        try:
+            if self.fetched_at is None:
+                if not self._load_from_database():
+                    self._fetch_from_auth0()
+                elif timezone.now() - self.fetched_at >= self._get_refresh_age():  # type: ignore[operator]
+                    self.refresh_in_background()
+        finally:
+            self._initial_load_lock.release()
+
+    def _refresh_in_thread(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("Unable to refresh JWKS for %s", self.domain)
+        finally:
+            # The thread has its own database connection, which would otherwise be left open
+            connection.close()
+
+    def _start_refresh_attempt(self) -> bool:
+        """Record a refresh attempt, returning False if there has been one too recently."""
+        now = time.monotonic()
+        if self._last_refresh_attempt is not None and now - self._last_refresh_attempt < JWKS_MIN_REFRESH_INTERVAL:
+            return False
+        self._last_refresh_attempt = now
+        return True
+
+    def _get_refresh_age(self) -> datetime.timedelta:
+        return datetime.timedelta(seconds=settings.AUTH0_JWKS_CACHE_TIMEOUT * JWKS_REFRESH_AHEAD)  # type: ignore[misc]
+
+    def _set_keys(self, keys: dict[str, dict[str, Any]], fetched_at: datetime.datetime) -> None:
+        self.keys = keys
+        self.fetched_at = fetched_at
+
+
+_jwks_stores: dict[str, JWKSStore] = {}
+
+
+def get_jwks_store() -> JWKSStore:
+    auth0_domain = settings.AUTH0_DOMAIN  # type: ignore[misc]
+    if auth0_domain not in _jwks_stores:
+        _jwks_stores[auth0_domain] = JWKSStore(auth0_domain)
+    return _jwks_stores[auth0_domain]
 
-    # Arrange the keys by Key ID
-    key_dict = {key["kid"]: key for key in new_keys if "kid" in key}
 
-    cache.set(jwks_cache_key, key_dict, timeout=settings.AUTH0_JWKS_CACHE_TIMEOUT)  # type: ignore[misc]
-    return key_dict
+def get_jwks() -> dict[str, dict[str, Any]]:
+    return get_jwks_store().get_keys()
 
 
 def load_key(obj: CompactSignature) -> Key:
@@ -66,13 +185,21 @@ def load_key(obj: CompactSignature) -> Key:
     valid_keys = get_jwks()
     key = valid_keys.get(key_id)  # type: ignore[arg-type]
     if key is None:
+        # The keys may have been rotated, so fetch them again for later requests
+        get_jwks_store().refresh_in_background()
         raise ValueError(f"Could not find key with ID: {key_id}")
 
+    if (imported := _imported_keys.get(key_id)) and imported[0] == key:  # type: ignore[arg-type]
+        return imported[1]
+
     try:
-        return JWKRegistry.import_key(key)
+        imported_key = JWKRegistry.import_key(key)
     except Exception as e:  # noqa: BLE001
         raise ValueError(f"Invalid key format: {str(e)}") from e
 
+    _imported_keys[key_id] = (key, imported_key)  # type: ignore[index]
+    return imported_key
+
 
 def get_token_info(token: str) -> Auth0TokenInfo:
     """
@@ -102,6 +229,7 @@ def get_token_info(token: str) -> Auth0TokenInfo:
             aud=decoded_token.claims.get("aud", ""),
             sub=decoded_token.claims.get("sub", ""),
             scopes=scopes,
+            expires_at=decoded_token.claims.get("exp"),
         )
     except BadSignatureError as e:
         raise ValueError(f"Invalid token signature: {str(e)}") from e
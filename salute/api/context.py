@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from django.http import HttpRequest
+from strawberry.dataloader import DataLoader
 from strawberry.django.context import StrawberryDjangoContext
 
 from salute.integrations.osm.graphql.data_loaders import create_osm_dataloaders
 from salute.integrations.waiting_list.graphql.data_loaders import create_waiting_list_dataloaders
-from salute.people.graphql.data_loaders import create_people_dataloaders
 from salute.roles.graphql.data_loaders import create_roles_dataloaders
 from salute.stats.graphql.data_loaders import create_stats_dataloaders
 
@@ -18,5 +19,15 @@ class SaluteContext(StrawberryDjangoContext):
         self.roles = create_roles_dataloaders()
         self.osm_dataloaders = create_osm_dataloaders()
         self.stats_dataloaders = create_stats_dataloaders()
-        self.people_dataloaders = create_people_dataloaders()
         self.waiting_list_dataloaders = create_waiting_list_dataloaders()
+
+    def iter_dataloaders(self) -> Iterator[tuple[str, DataLoader]]:
+        """Iterate over every dataloader in the context, with a name that is unique across the groups."""
+        for group_name, dataloaders in (
+            ("roles", self.roles),
+            ("osm", self.osm_dataloaders),
+            ("stats", self.stats_dataloaders),
+            ("waiting_list", self.waiting_list_dataloaders),
+        ):
+            for name, dataloader in dataloaders.items():
+                yield f"{group_name}.{name}", dataloader
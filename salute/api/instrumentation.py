@@ -0,0 +1,148 @@
+"""Per-operation performance metrics for the GraphQL API."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+from graphql import GraphQLResolveInfo
+from strawberry.extensions import SchemaExtension
+from strawberry.utils.await_maybe import AwaitableOrValue
+
+from salute.accounts.models import DistrictUserRoleType
+from salute.api.context import SaluteContext
+
+logger = logging.getLogger(__name__)
+
+SLOWEST_RESOLVER_COUNT = 10
+
+# Strawberry reuses the extension instances from the first operation for resolve(), so resolvers find the
+# extension for the current operation through this instead of self. SQL queries are also attributed to an
+# operation with this, as concurrent operations share a connection.
+_current_extension: ContextVar[InstrumentationExtension | None] = ContextVar("current_extension", default=None)
+
+
+class InstrumentationExtension(SchemaExtension):
+    """Record the SQL queries, dataloader batches and slowest resolvers for each operation.
+
+    The metrics are logged for every operation, and included in the response extensions for admins.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.sql_query_count = 0
+        self.sql_time = 0.0
+        self.dataloader_batch_sizes: defaultdict[str, list[int]] = defaultdict(list)
+        # A min-heap of (duration, path), so the fastest of the slowest resolvers can be replaced
+        self.slowest_resolvers: list[tuple[float, str]] = []
+        self.duration = 0.0
+        self.include_in_response = False
+
+    async def on_operation(self) -> AsyncIterator[None]:
+        context = self.execution_context.context
+        user = await context.request.auser()
+
+        def _start() -> None:
+            # Checking the roles runs a query, so is done before the queries are counted
+            self.include_in_response = user.is_authenticated and (
+                user.is_superuser or DistrictUserRoleType.ADMIN in user.district_role_list
+            )
+            # Sync resolvers for every operation run in the same thread, so this wraps the queries for
+            # concurrent operations too. Only the queries for this operation are counted.
+            connection.execute_wrappers.append(self._record_sql_query)
+
+        def _stop() -> None:
+            connection.execute_wrappers.remove(self._record_sql_query)
+
+        await sync_to_async(_start)()
+        if isinstance(context, SaluteContext):
+            for name, dataloader in context.iter_dataloaders():
+                dataloader.load_fn = self._record_dataloader_batch(name, dataloader.load_fn)
+
+        token = _current_extension.set(self)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.duration = time.perf_counter() - start
+            _current_extension.reset(token)
+            await sync_to_async(_stop)()
+            logger.info(
+                "GraphQL operation %s ran %d SQL queries in %.1fms",
+                self.execution_context.operation_name,
+                self.sql_query_count,
+                self.duration * 1000,
+                extra={"graphql_operation": self.execution_context.operation_name, **self._get_metrics()},
+            )
+
+    def _record_sql_query(self, execute: Callable[..., Any], *args: Any) -> Any:
+        if _current_extension.get() is not self:
+            return execute(*args)
+
+        start = time.perf_counter()
+        try:
+            return execute(*args)
+        finally:
+            self.sql_query_count += 1
+            self.sql_time += time.perf_counter() - start
+
+    def _record_dataloader_batch(
+        self, name: str, load_fn: Callable[[list[Any]], Awaitable[Any]]
+    ) -> Callable[[list[Any]], Awaitable[Any]]:
+        async def _load_fn(keys: list[Any]) -> Any:
+            self.dataloader_batch_sizes[name].append(len(keys))
+            return await load_fn(keys)
+
+        return _load_fn
+
+    def _record_resolver(self, info: GraphQLResolveInfo, start: float) -> None:
+        resolver = (time.perf_counter() - start, ".".join(str(key) for key in info.path.as_list()))
+        if len(self.slowest_resolvers) < SLOWEST_RESOLVER_COUNT:
+            heapq.heappush(self.slowest_resolvers, resolver)
+        else:
+            heapq.heappushpop(self.slowest_resolvers, resolver)
+
+    def resolve(
+        self, _next: Callable, root: Any, info: GraphQLResolveInfo, *args: Any, **kwargs: Any
+    ) -> AwaitableOrValue[object]:
+        extension = _current_extension.get()
+        if extension is None:
+            return _next(root, info, *args, **kwargs)
+
+        start = time.perf_counter()
+        result = _next(root, info, *args, **kwargs)
+        if not isinstance(result, Awaitable):
+            extension._record_resolver(info, start)
+            return result
+
+        async def _await_result() -> Any:
+            try:
+                return await result
+            finally:
+                extension._record_resolver(info, start)
+
+        return _await_result()
+
+    def _get_metrics(self) -> dict[str, Any]:
+        return {
+            "durationMs": round(self.duration * 1000, 1),
+            "sqlQueryCount": self.sql_query_count,
+            "sqlTimeMs": round(self.sql_time * 1000, 1),
+            "dataloaderBatchSizes": dict(self.dataloader_batch_sizes),
+            "slowestResolvers": [
+                {"path": path, "durationMs": round(duration * 1000, 1)}
+                for duration, path in sorted(self.slowest_resolvers, reverse=True)
+            ],
+        }
+
+    def get_results(self) -> dict[str, Any]:
+        if not self.include_in_response:
+            return {}
+        return {"performance": self._get_metrics()}
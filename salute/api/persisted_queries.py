@@ -0,0 +1,53 @@
+"""Automatic persisted queries, using the protocol from Apollo.
+
+A client first sends only the SHA-256 hash of its query. If the query isn't known, the client sends the
+query again with the hash, and it is stored for the next request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import AsyncIterator
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+PERSISTED_QUERY_VERSION = 1
+
+
+def _get_cache_key(sha256_hash: str) -> str:
+    return f"GRAPHQL_PERSISTED_QUERY__{sha256_hash}"
+
+
+class PersistedQueriesExtension(SchemaExtension):
+    """Look up the query for requests that only send a hash, and register queries sent with a hash."""
+
+    async def on_operation(self) -> AsyncIterator[None]:
+        execution_context = self.execution_context
+        persisted_query = (execution_context.operation_extensions or {}).get("persistedQuery")
+        if persisted_query is None:
+            yield
+            return
+
+        sha256_hash = persisted_query.get("sha256Hash")
+        if persisted_query.get("version") != PERSISTED_QUERY_VERSION or not isinstance(sha256_hash, str):
+            raise GraphQLError("PersistedQueryNotSupported", extensions={"code": "PERSISTED_QUERY_NOT_SUPPORTED"})
+
+        if execution_context.query is None:
+            query = await cache.aget(_get_cache_key(sha256_hash))
+            if query is None:
+                # The client will retry with the full query
+                raise GraphQLError("PersistedQueryNotFound", extensions={"code": "PERSISTED_QUERY_NOT_FOUND"})
+            execution_context.query = query
+        else:
+            if hashlib.sha256(execution_context.query.encode()).hexdigest() != sha256_hash:
+                raise GraphQLError("provided sha does not match query", extensions={"code": "BAD_REQUEST"})
+            await cache.aset(
+                _get_cache_key(sha256_hash),
+                execution_context.query,
+                timeout=settings.GRAPHQL_PERSISTED_QUERY_CACHE_TIMEOUT,  # type: ignore[misc]
+            )
+
+        yield
@@ -0,0 +1,156 @@
+"""Static analysis of the cost of GraphQL queries, so that expensive queries can be rejected before execution."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from django.conf import settings
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValidationRule,
+    get_named_type,
+    get_nullable_type,
+)
+from strawberry.types.field import StrawberryField
+
+logger = logging.getLogger(__name__)
+
+# Fields that run extra queries or heavy aggregations, by field name.
+FIELD_WEIGHTS: dict[str, int] = {
+    "censusReturns": 10,
+    "censusTrends": 50,
+    "headcountHistory": 20,
+    "summaryHistory": 20,
+    "totalMemberCount": 20,
+    "waitingListDemand": 10,
+}
+
+# Async fields are usually backed by a dataloader, which runs a query per batch.
+ASYNC_FIELD_WEIGHT = 5
+
+# Relay connections return at most 100 results, unless first or last is given.
+DEFAULT_CONNECTION_SIZE = 100
+
+# The expected number of items in a list field, which aren't paginated.
+DEFAULT_LIST_SIZE = 10
+
+
+def _get_field_weight(name: str, field: GraphQLField, named_type: GraphQLNamedType) -> int:
+    if name in FIELD_WEIGHTS:
+        return FIELD_WEIGHTS[name]
+
+    strawberry_field = field.extensions.get("strawberry-definition")
+    if isinstance(strawberry_field, StrawberryField) and strawberry_field.is_async:
+        return ASYNC_FIELD_WEIGHT
+
+    # Scalars are resolved from the parent object, so are free
+    return 1 if isinstance(named_type, GraphQLObjectType | GraphQLInterfaceType) else 0
+
+
+def _is_connection(named_type: GraphQLNamedType) -> bool:
+    return isinstance(named_type, GraphQLObjectType) and {"edges", "pageInfo"} <= named_type.fields.keys()
+
+
+def _get_page_size(node: FieldNode) -> int:
+    for argument in node.arguments:
+        if argument.name.value in ("first", "last") and isinstance(argument.value, IntValueNode):
+            return min(int(argument.value.value), DEFAULT_CONNECTION_SIZE)
+    return DEFAULT_CONNECTION_SIZE
+
+
+class QueryCostRule(ValidationRule):
+    """Reject operations with a cost above the GRAPHQL_MAX_QUERY_COST setting.
+
+    The cost of a field is its weight, plus the cost of its selections multiplied by the expected number of
+    results. This is an upper bound, as dataloaders batch the queries for fields in a list.
+    """
+
+    def enter_operation_definition(self, node: OperationDefinitionNode, *_args: Any) -> None:
+        root_type = self.context.schema.get_root_type(node.operation)
+        if root_type is None:
+            return
+
+        cost = self._get_selection_set_cost(node.selection_set, root_type, visited_fragments=frozenset())
+        max_cost: int = settings.GRAPHQL_MAX_QUERY_COST  # type: ignore[misc]
+        if cost > max_cost:
+            operation_name = node.name.value if node.name else None
+            logger.warning(
+                "Rejected GraphQL operation %s with cost %d, above the maximum of %d",
+                operation_name,
+                cost,
+                max_cost,
+            )
+            self.report_error(GraphQLError(f"Query cost of {cost} exceeds the maximum of {max_cost}.", node))
+
+    def _get_selection_set_cost(
+        self, selection_set: SelectionSetNode, parent_type: GraphQLNamedType, *, visited_fragments: frozenset[str]
+    ) -> int:
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                cost += self._get_field_cost(selection, parent_type, visited_fragments=visited_fragments)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.context.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type
+                )
+                if fragment_type is not None:
+                    cost += self._get_selection_set_cost(
+                        selection.selection_set, fragment_type, visited_fragments=visited_fragments
+                    )
+            elif isinstance(selection, FragmentSpreadNode):
+                # Cycles are reported by the NoFragmentCycles rule
+                fragment_name = selection.name.value
+                fragment = self.context.get_fragment(fragment_name)
+                if fragment is None or fragment_name in visited_fragments:
+                    continue
+                fragment_type = self.context.schema.get_type(fragment.type_condition.name.value)
+                if fragment_type is not None:
+                    cost += self._get_selection_set_cost(
+                        fragment.selection_set, fragment_type, visited_fragments=visited_fragments | {fragment_name}
+                    )
+        return cost
+
+    def _get_field_cost(
+        self, node: FieldNode, parent_type: GraphQLNamedType, *, visited_fragments: frozenset[str]
+    ) -> int:
+        name = node.name.value
+        if name.startswith("__") or not isinstance(parent_type, GraphQLObjectType | GraphQLInterfaceType):
+            return 0
+
+        # Unknown fields are reported by the FieldsOnCorrectType rule
+        field = parent_type.fields.get(name)
+        if field is None:
+            return 0
+
+        named_type = get_named_type(field.type)
+        selections_cost = (
+            self._get_selection_set_cost(node.selection_set, named_type, visited_fragments=visited_fragments)
+            if node.selection_set
+            else 0
+        )
+
+        if _is_connection(named_type):
+            multiplier = _get_page_size(node)
+        elif _is_connection(parent_type) and name == "edges":
+            # The page size has already been applied to the connection
+            multiplier = 1
+        elif isinstance(get_nullable_type(field.type), GraphQLList):
+            multiplier = DEFAULT_LIST_SIZE
+        else:
+            multiplier = 1
+
+        return _get_field_weight(name, field, named_type) + multiplier * selections_cost
@@ -0,0 +1,82 @@
+"""Caching of GraphQL responses between data changes."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from graphql import ExecutionResult, print_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types.graphql import OperationType
+
+from salute.core.data_epoch import get_data_epoch
+
+if TYPE_CHECKING:
+    from salute.accounts.models import User
+
+
+def get_permission_scope(user: User) -> str:
+    """Get a key for everything that affects what a user is allowed to see.
+
+    Permissions depend on the district roles and superuser status of the user, and fields about the
+    user themselves (e.g. currentUser, or a person's own roles) depend on who they are.
+    """
+    roles = ",".join(sorted(user.district_role_list))
+    return f"{user.pk}:{user.person_id}:{roles}:{user.is_superuser}"
+
+
+class ResponseCacheExtension(SchemaExtension):
+    """Serve repeated queries from the cache until the data epoch is bumped.
+
+    The cache key includes the normalised query document, the variables and the permission scope of the user,
+    so a response is only ever reused for a request that would have produced the same response.
+    Responses with errors, and responses for anonymous users, are not cached.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        cache_key = await self._get_cache_key()
+        if cache_key is not None and (data := await cache.aget(cache_key)) is not None:
+            self.execution_context.result = ExecutionResult(data=data)
+            yield
+            return
+
+        yield
+
+        result = self.execution_context.result
+        if cache_key is not None and isinstance(result, ExecutionResult) and result.data and not result.errors:
+            await cache.aset(
+                cache_key,
+                result.data,
+                timeout=settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,  # type: ignore[misc]
+            )
+
+    async def _get_cache_key(self) -> str | None:
+        execution_context = self.execution_context
+        if execution_context.operation_type != OperationType.QUERY or execution_context.graphql_document is None:
+            return None
+
+        # Anonymous users can't see any data, so there is nothing worth caching
+        user = await execution_context.context.request.auser()
+        if not user.is_authenticated:
+            return None
+
+        def _get_epoch_and_scope() -> tuple[int, str]:
+            return get_data_epoch(), get_permission_scope(user)
+
+        epoch, scope = await sync_to_async(_get_epoch_and_scope)()
+        request_key = json.dumps(
+            [
+                print_ast(execution_context.graphql_document),
+                execution_context.operation_name,
+                execution_context.variables or {},
+                scope,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return f"GRAPHQL_RESPONSE__{epoch}__{hashlib.sha256(request_key.encode()).hexdigest()}"
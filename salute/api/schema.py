@@ -1,11 +1,16 @@
 import strawberry
 from django.conf import settings
 from graphql.validation import NoSchemaIntrospectionCustomRule
+from strawberry.extensions import AddValidationRules, ParserCache, ValidationCache
 from strawberry.tools import merge_types
 from strawberry_django.optimizer import DjangoOptimizerExtension
 from strawberry_django.permissions import IsAuthenticated
 
 from salute.accounts.graphql.schema import AccountsQuery
+from salute.api.instrumentation import InstrumentationExtension
+from salute.api.persisted_queries import PersistedQueriesExtension
+from salute.api.query_cost import QueryCostRule
+from salute.api.response_cache import ResponseCacheExtension
 from salute.hierarchy.graphql.schema import HierarchyQuery
 from salute.locations.graphql.schema import LocationsQuery
 from salute.mailing_groups.graphql.schema import MailingGroupsQuery
@@ -47,7 +52,14 @@ class DisableAnonymousIntrospection(strawberry.extensions.SchemaExtension):
 schema = strawberry.Schema(
     query=merge_types("Query", APP_QUERIES),
     extensions=[
+        InstrumentationExtension,
+        PersistedQueriesExtension,
+        ParserCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),  # type: ignore[misc]
         DjangoOptimizerExtension,
+        # Validation rules depend on the user, so must be set before the validation cache is checked
         DisableAnonymousIntrospection,
+        AddValidationRules([QueryCostRule]),
+        ValidationCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE),  # type: ignore[misc]
+        ResponseCacheExtension,
     ],
 )
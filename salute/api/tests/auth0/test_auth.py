@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Generator
 from unittest import mock
 
 import pytest
 import responses
+from asgiref.sync import async_to_sync
 from django.conf import settings
 
 from salute.accounts.factories import UserFactory
 from salute.api.auth0.auth import (
     RequestAuthenticationError,
     UnableToLinkAccountError,
+    VerifiedTokenCache,
     _attempt_to_link_user,
     authenticate_user_with_bearer_token,
+    verified_tokens,
 )
 from salute.api.auth0.types import Auth0TokenInfo
 from salute.integrations.workspace.factories import WorkspaceAccountFactory
@@ -21,11 +26,18 @@ VALID_SCOPES = ["openid", "email", "salute:user"]
 VALID_AUDIENCE = [settings.AUTH0_AUDIENCE]  # type: ignore[misc]
 
 
+@pytest.fixture(autouse=True)
+def clear_verified_tokens() -> Generator[None, None, None]:
+    verified_tokens.clear()
+    yield
+    verified_tokens.clear()
+
+
 @pytest.mark.django_db
 class TestAuth0TokenVerification:
     def test_bad_token_format(self) -> None:
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "Invalid access token"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -33,7 +45,7 @@ class TestAuth0TokenVerification:
         mock_get_token_info.side_effect = Exception()
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "Server error during token validation"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -41,7 +53,7 @@ class TestAuth0TokenVerification:
         mock_get_token_info.return_value = Auth0TokenInfo(sub="", scopes=VALID_SCOPES, aud=VALID_AUDIENCE)
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "Invalid Access Token: Missing subject"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -51,7 +63,7 @@ class TestAuth0TokenVerification:
         )
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "Invalid Access Token: Audience not valid for this service"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -59,7 +71,7 @@ class TestAuth0TokenVerification:
         mock_get_token_info.return_value = Auth0TokenInfo(sub="subject", scopes=["openid", "email"], aud=VALID_AUDIENCE)
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "Insufficient permissions: 'salute:user' scope required"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -69,7 +81,7 @@ class TestAuth0TokenVerification:
         mock_get_token_info.return_value = Auth0TokenInfo(sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE)
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "User account is inactive"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -78,7 +90,7 @@ class TestAuth0TokenVerification:
         mock_get_token_info.return_value = Auth0TokenInfo(sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE)
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "User account is not linked to a person"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -88,7 +100,7 @@ class TestAuth0TokenVerification:
         mock_get_token_info.return_value = Auth0TokenInfo(sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE)
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "User account is linked to a suspended person"}]
 
     @mock.patch("salute.api.auth0.auth.get_token_info")
@@ -97,7 +109,7 @@ class TestAuth0TokenVerification:
         user = UserFactory(auth0_sub="1234", person=person)
         mock_get_token_info.return_value = Auth0TokenInfo(sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE)
 
-        auth_info = authenticate_user_with_bearer_token("bees")
+        auth_info = async_to_sync(authenticate_user_with_bearer_token)("bees")
 
         assert auth_info["user"] == user
         assert auth_info["scopes"] == VALID_SCOPES
@@ -111,7 +123,7 @@ class TestAuth0TokenVerification:
         mock_attempt_to_link_user.side_effect = UnableToLinkAccountError(reason="a reason")
 
         with pytest.raises(RequestAuthenticationError) as exc_info:
-            authenticate_user_with_bearer_token("bees")
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
         assert exc_info.value.errors == [{"message": "Unable to link account: a reason"}]
 
     @mock.patch("salute.api.auth0.auth._attempt_to_link_user")
@@ -124,11 +136,91 @@ class TestAuth0TokenVerification:
         mock_get_token_info.return_value = Auth0TokenInfo(sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE)
         mock_attempt_to_link_user.return_value = new_user
 
-        auth_info = authenticate_user_with_bearer_token("bees")
+        auth_info = async_to_sync(authenticate_user_with_bearer_token)("bees")
 
         assert auth_info["user"] == new_user
         assert auth_info["scopes"] == VALID_SCOPES
 
+    @mock.patch("salute.api.auth0.auth.get_token_info")
+    def test_verified_token_is_cached(self, mock_get_token_info: mock.Mock) -> None:
+        user = UserFactory(auth0_sub="1234", person=PersonFactory(is_suspended=False))
+        mock_get_token_info.return_value = Auth0TokenInfo(
+            sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE, expires_at=int(time.time()) + 60
+        )
+
+        for _ in range(3):
+            auth_info = async_to_sync(authenticate_user_with_bearer_token)("bees")
+            assert auth_info["user"] == user
+
+        mock_get_token_info.assert_called_once_with("bees")
+
+    @mock.patch("salute.api.auth0.auth.get_token_info")
+    def test_cached_token__user_deactivated(self, mock_get_token_info: mock.Mock) -> None:
+        user = UserFactory(auth0_sub="1234", person=PersonFactory(is_suspended=False))
+        mock_get_token_info.return_value = Auth0TokenInfo(
+            sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE, expires_at=int(time.time()) + 60
+        )
+        async_to_sync(authenticate_user_with_bearer_token)("bees")
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(RequestAuthenticationError) as exc_info:
+            async_to_sync(authenticate_user_with_bearer_token)("bees")
+        assert exc_info.value.errors == [{"message": "User account is inactive"}]
+        mock_get_token_info.assert_called_once_with("bees")
+
+    @mock.patch("salute.api.auth0.auth.get_token_info")
+    def test_invalid_token_is_not_cached(self, mock_get_token_info: mock.Mock) -> None:
+        mock_get_token_info.return_value = Auth0TokenInfo(
+            sub="1234", scopes=["openid"], aud=VALID_AUDIENCE, expires_at=int(time.time()) + 60
+        )
+
+        for _ in range(2):
+            with pytest.raises(RequestAuthenticationError):
+                async_to_sync(authenticate_user_with_bearer_token)("bees")
+
+        assert mock_get_token_info.call_count == 2
+
+
+class TestVerifiedTokenCache:
+    def _token_info(self, *, expires_at: int | None) -> Auth0TokenInfo:
+        return Auth0TokenInfo(sub="1234", scopes=VALID_SCOPES, aud=VALID_AUDIENCE, expires_at=expires_at)
+
+    def test_get_and_set(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        token_info = self._token_info(expires_at=int(time.time()) + 60)
+
+        cache.set("token", token_info)
+
+        assert cache.get("token") == token_info
+        assert cache.get("other-token") is None
+
+    def test_expired_token(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.set("token", self._token_info(expires_at=int(time.time()) - 1))
+
+        assert cache.get("token") is None
+
+    def test_token_without_expiry_is_not_cached(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.set("token", self._token_info(expires_at=None))
+
+        assert cache.get("token") is None
+
+    def test_least_recently_used_token_is_evicted(self) -> None:
+        cache = VerifiedTokenCache(maxsize=2)
+        expires_at = int(time.time()) + 60
+        cache.set("token-1", self._token_info(expires_at=expires_at))
+        cache.set("token-2", self._token_info(expires_at=expires_at))
+        cache.get("token-1")
+
+        cache.set("token-3", self._token_info(expires_at=expires_at))
+
+        assert cache.get("token-1") is not None
+        assert cache.get("token-2") is None
+        assert cache.get("token-3") is not None
+
 
 @pytest.mark.django_db
 class TestAuth0AttemptToLinkUser:
@@ -2,6 +2,8 @@
 Tests for the Auth0 token validation utilities.
 """
 
+import threading
+import time
 from collections.abc import Generator
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -10,8 +12,8 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
-from django.core.cache import cache
 from django.test import override_settings
+from django.utils import timezone
 from joserfc.errors import (
     BadSignatureError,
     DecodeError,
@@ -22,15 +24,18 @@ from joserfc.errors import (
 )
 from joserfc.jws import CompactSignature
 
-from salute.api.auth0.utils import Auth0TokenInfo, _fetch_jwks, get_jwks, get_token_info, load_key
-
-
-@pytest.fixture
-def clear_cache() -> Generator[None, None, None]:
-    """Clear cache before and after test."""
-    cache.clear()
-    yield
-    cache.clear()
+from salute.accounts.models import Auth0KeySet
+from salute.api.auth0.utils import (
+    Auth0TokenInfo,
+    JWKSStore,
+    _fetch_jwks,
+    _imported_keys,
+    _jwks_stores,
+    get_jwks,
+    get_jwks_store,
+    get_token_info,
+    load_key,
+)
 
 
 @pytest.fixture
@@ -106,74 +111,180 @@ class TestFetchJWKS:
         assert result == []
 
 
-class TestGetJWKS:
-    @override_settings(AUTH0_DOMAIN="test-domain.com", AUTH0_JWKS_CACHE_TIMEOUT=60)
+@pytest.fixture
+def jwks_store() -> Generator[JWKSStore, None, None]:
+    _jwks_stores.clear()
+    with override_settings(AUTH0_DOMAIN="test-domain.com", AUTH0_JWKS_CACHE_TIMEOUT=600):
+        yield get_jwks_store()
+    _jwks_stores.clear()
+
+
+@pytest.mark.django_db
+class TestJWKSStore:
     @patch("salute.api.auth0.utils._fetch_jwks")
-    def test_returns_cached_keys(
-        self,
-        mock_fetch_jwks: mock.Mock,
-        clear_cache: Generator[None, None, None],
-    ) -> None:
-        """Test get_jwks returns cached keys if available."""
-        # Set up cache
-        cache.set("AUTH0_JWKS__test-domain.com", {"test-key-id": {"kid": "test-key-id"}}, 60)
+    def test_fetches_and_stores_keys(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys are fetched and stored when there aren't any."""
+        mock_fetch_jwks.return_value = [{"kid": "test-key-id"}]
 
         result = get_jwks()
 
         assert result == {"test-key-id": {"kid": "test-key-id"}}
-        # Verify we didn't fetch new keys
-        mock_fetch_jwks.assert_not_called()
+        mock_fetch_jwks.assert_called_once_with("test-domain.com")
+        assert Auth0KeySet.objects.get(domain="test-domain.com").keys == {"test-key-id": {"kid": "test-key-id"}}
 
-    @override_settings(AUTH0_DOMAIN="test-domain.com", AUTH0_JWKS_CACHE_TIMEOUT=60)
     @patch("salute.api.auth0.utils._fetch_jwks")
-    def test_fetches_and_caches_keys(
-        self,
-        mock_fetch_jwks: mock.Mock,
-        clear_cache: Generator[None, None, None],
-    ) -> None:
-        """Test get_jwks fetches and caches keys when not cached."""
+    def test_filters_keys_without_kid(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys without kid are filtered out."""
+        mock_fetch_jwks.return_value = [
+            {"kid": "test-key-id", "other": "value"},
+            {"other": "value"},  # No kid
+        ]
+
+        result = get_jwks()
+
+        assert result == {"test-key-id": {"kid": "test-key-id", "other": "value"}}
+
+    @patch("salute.api.auth0.utils._fetch_jwks")
+    def test_empty_response_not_stored(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test empty response is not stored."""
+        mock_fetch_jwks.return_value = []
+
+        assert get_jwks() == {}
+
+        mock_fetch_jwks.assert_called_once()
+        assert not Auth0KeySet.objects.exists()
+
+    @patch("salute.api.auth0.utils._fetch_jwks")
+    def test_startup_while_auth0_unavailable(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys are fetched by the next request once Auth0 is available, if there weren't any at startup."""
+        mock_fetch_jwks.return_value = []
+        assert get_jwks() == {}
+
         mock_fetch_jwks.return_value = [{"kid": "test-key-id"}]
+        assert get_jwks() == {"test-key-id": {"kid": "test-key-id"}}
+
+        assert mock_fetch_jwks.call_count == 2
+
+    @patch("salute.api.auth0.utils._fetch_jwks")
+    def test_concurrent_requests_wait_for_initial_load(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test a request that arrives while the keys are first being loaded waits for them."""
+        results = []
+        concurrent_request = threading.Thread(target=lambda: results.append(get_jwks()))
+
+        def fetch_jwks(domain: str) -> list[dict[str, Any]]:
+            concurrent_request.start()
+            time.sleep(0.1)
+            return [{"kid": "test-key-id"}]
+
+        mock_fetch_jwks.side_effect = fetch_jwks
+
+        assert get_jwks() == {"test-key-id": {"kid": "test-key-id"}}
+        concurrent_request.join()
+
+        assert results == [{"test-key-id": {"kid": "test-key-id"}}]
+        mock_fetch_jwks.assert_called_once()
+
+    @patch("salute.api.auth0.utils._fetch_jwks")
+    def test_loads_keys_from_database(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys fetched by another process are used without fetching them again."""
+        Auth0KeySet.objects.create(
+            domain="test-domain.com", keys={"test-key-id": {"kid": "test-key-id"}}, fetched_at=timezone.now()
+        )
 
         result = get_jwks()
 
         assert result == {"test-key-id": {"kid": "test-key-id"}}
-        mock_fetch_jwks.assert_called_once_with("test-domain.com")
-        assert cache.get("AUTH0_JWKS__test-domain.com") == {"test-key-id": {"kid": "test-key-id"}}
+        mock_fetch_jwks.assert_not_called()
 
-    @override_settings(AUTH0_DOMAIN="test-domain.com", AUTH0_JWKS_CACHE_TIMEOUT=60)
     @patch("salute.api.auth0.utils._fetch_jwks")
-    def test_empty_response_not_cached(
-        self,
-        mock_fetch_jwks: mock.Mock,
-        clear_cache: Generator[None, None, None],
+    def test_refreshes_stale_database_keys(self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys in the database are fetched again if they are due to be refreshed."""
+        Auth0KeySet.objects.create(
+            domain="test-domain.com",
+            keys={"old-key-id": {"kid": "old-key-id"}},
+            fetched_at=timezone.now() - timedelta(minutes=9),
+        )
+        mock_fetch_jwks.return_value = [{"kid": "test-key-id"}]
+
+        jwks_store.refresh()
+
+        assert jwks_store.keys == {"test-key-id": {"kid": "test-key-id"}}
+        assert Auth0KeySet.objects.get(domain="test-domain.com").keys == {"test-key-id": {"kid": "test-key-id"}}
+
+    @patch("salute.api.auth0.utils.threading.Thread")
+    @patch("salute.api.auth0.utils._fetch_jwks")
+    def test_stale_database_keys_refreshed_in_background(
+        self, mock_fetch_jwks: mock.Mock, mock_thread: mock.Mock, jwks_store: JWKSStore
     ) -> None:
-        """Test empty response is not cached."""
-        mock_fetch_jwks.return_value = []
+        """Test the first request uses stale keys from the database, rather than waiting for them to be fetched."""
+        Auth0KeySet.objects.create(
+            domain="test-domain.com",
+            keys={"old-key-id": {"kid": "old-key-id"}},
+            fetched_at=timezone.now() - timedelta(minutes=9),
+        )
 
         result = get_jwks()
 
-        assert result == {}
-        assert cache.get("AUTH0_JWKS__test-domain.com") is None
+        assert result == {"old-key-id": {"kid": "old-key-id"}}
+        mock_fetch_jwks.assert_not_called()
+        mock_thread.return_value.start.assert_called_once()
 
-    @override_settings(AUTH0_DOMAIN="test-domain.com", AUTH0_JWKS_CACHE_TIMEOUT=60)
     @patch("salute.api.auth0.utils._fetch_jwks")
-    def test_filters_keys_without_kid(
-        self,
-        mock_fetch_jwks: mock.Mock,
-        clear_cache: Generator[None, None, None],
+    def test_keeps_keys_when_auth0_unavailable(
+        self, mock_fetch_jwks: mock.Mock, jwks_store: JWKSStore, caplog: pytest.LogCaptureFixture
     ) -> None:
-        """Test keys without kid are filtered out."""
-        mock_fetch_jwks.return_value = [
-            {"kid": "test-key-id", "other": "value"},
-            {"other": "value"},  # No kid
-        ]
+        """Test existing keys are still used if they can't be refreshed."""
+        fetched_at = timezone.now() - timedelta(hours=1)
+        Auth0KeySet.objects.create(
+            domain="test-domain.com", keys={"test-key-id": {"kid": "test-key-id"}}, fetched_at=fetched_at
+        )
+        mock_fetch_jwks.return_value = []
+
+        jwks_store.refresh()
+
+        assert jwks_store.keys == {"test-key-id": {"kid": "test-key-id"}}
+        assert jwks_store.fetched_at == fetched_at
+        assert "Unable to fetch JWKS for test-domain.com, using existing keys" in caplog.messages
+
+    @patch("salute.api.auth0.utils.threading.Thread")
+    def test_refreshes_in_background_before_expiry(self, mock_thread: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys that are due to be refreshed are returned while they are refreshed in the background."""
+        jwks_store.keys = {"test-key-id": {"kid": "test-key-id"}}
+        jwks_store.fetched_at = timezone.now() - timedelta(minutes=9)
 
         result = get_jwks()
 
-        assert result == {"test-key-id": {"kid": "test-key-id", "other": "value"}}
+        assert result == {"test-key-id": {"kid": "test-key-id"}}
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch("salute.api.auth0.utils.threading.Thread")
+    def test_fresh_keys_not_refreshed(self, mock_thread: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys are not refreshed before they are due."""
+        jwks_store.keys = {"test-key-id": {"kid": "test-key-id"}}
+        jwks_store.fetched_at = timezone.now() - timedelta(minutes=5)
+
+        get_jwks()
+
+        mock_thread.assert_not_called()
+
+    @patch("salute.api.auth0.utils.threading.Thread")
+    def test_background_refresh_is_rate_limited(self, mock_thread: mock.Mock, jwks_store: JWKSStore) -> None:
+        """Test keys are not refreshed again straight after a refresh."""
+        mock_thread.return_value.is_alive.return_value = False
+
+        jwks_store.refresh_in_background()
+        jwks_store.refresh_in_background()
+
+        mock_thread.return_value.start.assert_called_once()
 
 
 class TestLoadKey:
+    @pytest.fixture(autouse=True)
+    def clear_imported_keys(self) -> Generator[None, None, None]:
+        _imported_keys.clear()
+        yield
+        _imported_keys.clear()
+
     @patch("salute.api.auth0.utils.get_jwks")
     @patch("salute.api.auth0.utils.JWKRegistry.import_key")
     def test_successful_key_load(
@@ -193,14 +304,53 @@ class TestLoadKey:
         mock_import_key.assert_called_once_with({"kid": "test-key-id"})
 
     @patch("salute.api.auth0.utils.get_jwks")
-    def test_key_not_found(self, mock_get_jwks: mock.Mock, mock_compact_sig: mock.Mock) -> None:
-        """Test error when key not found."""
+    @patch("salute.api.auth0.utils.JWKRegistry.import_key")
+    def test_imported_key_is_cached(
+        self,
+        mock_import_key: mock.Mock,
+        mock_get_jwks: mock.Mock,
+        mock_compact_sig: mock.Mock,
+    ) -> None:
+        """Test that keys are only imported once for each key ID."""
+        mock_get_jwks.return_value = {"test-key-id": {"kid": "test-key-id"}}
+        mock_key = MagicMock()
+        mock_import_key.return_value = mock_key
+
+        assert load_key(mock_compact_sig) == mock_key
+        assert load_key(mock_compact_sig) == mock_key
+
+        mock_import_key.assert_called_once_with({"kid": "test-key-id"})
+
+    @patch("salute.api.auth0.utils.get_jwks")
+    @patch("salute.api.auth0.utils.JWKRegistry.import_key")
+    def test_replaced_key_is_imported(
+        self,
+        mock_import_key: mock.Mock,
+        mock_get_jwks: mock.Mock,
+        mock_compact_sig: mock.Mock,
+    ) -> None:
+        """Test that a key is imported again if the JWK for its key ID changes."""
+        mock_get_jwks.return_value = {"test-key-id": {"kid": "test-key-id", "n": "old"}}
+        load_key(mock_compact_sig)
+
+        mock_get_jwks.return_value = {"test-key-id": {"kid": "test-key-id", "n": "new"}}
+        load_key(mock_compact_sig)
+
+        assert mock_import_key.call_count == 2
+
+    @patch("salute.api.auth0.utils.get_jwks")
+    @patch("salute.api.auth0.utils.get_jwks_store")
+    def test_key_not_found(
+        self, mock_get_jwks_store: mock.Mock, mock_get_jwks: mock.Mock, mock_compact_sig: mock.Mock
+    ) -> None:
+        """Test error when key not found, which refreshes the keys in the background."""
         mock_get_jwks.return_value = {}
 
         with pytest.raises(ValueError) as excinfo:
             load_key(mock_compact_sig)
 
         assert "Could not find key with ID: test-key-id" in str(excinfo.value)
+        mock_get_jwks_store.return_value.refresh_in_background.assert_called_once()
 
     @patch("salute.api.auth0.utils.get_jwks")
     @patch("salute.api.auth0.utils.JWKRegistry.import_key")
@@ -243,6 +393,7 @@ class TestGetTokenInfo:
         assert isinstance(result, Auth0TokenInfo)
         assert result.sub == "test-sub"
         assert result.scopes == ["salute:user", "email"]
+        assert result.expires_at == token_claims["exp"]
 
     @override_settings(AUTH0_DOMAIN="test-domain.com", AUTH0_AUDIENCE="test-audience")
     @patch("salute.api.auth0.utils.jwt.decode")
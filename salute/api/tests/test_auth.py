@@ -64,6 +64,8 @@ class TestAPIAuthentication:
                 "email": "admin@example.com",
             }
         }
+        # Extensions that load the user asynchronously also see the authenticated user
+        assert "performance" in data["extensions"]
 
     @mock.patch("salute.api.views.authenticate_user_with_bearer_token")
     def test_auth0_failed(self, mock_auth: mock.Mock, admin_user: User, client: Client) -> None:
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import RequestFactory
+from django.urls import reverse
+from strawberry_django.test.client import Response, TestClient
+
+from salute.accounts.factories import UserFactory
+from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
+from salute.api.context import SaluteContext
+from salute.api.schema import schema
+from salute.hierarchy.factories import DistrictFactory, GroupFactory
+from salute.people.factories import PersonFactory
+
+
+@pytest.mark.django_db
+class TestInstrumentationExtension:
+    url = reverse("graphql")
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        # Cached responses skip execution, so there would be no resolvers to record
+        cache.clear()
+
+    QUERY = """
+    query DistrictGroups {
+        groups {
+            edges {
+                node {
+                    youngPersonCount
+                }
+            }
+        }
+    }
+    """
+
+    def _query(self, level: DistrictUserRoleType) -> Response:
+        district = DistrictFactory()
+        GroupFactory.create_batch(3, district=district)
+        user = UserFactory(person=PersonFactory())
+        DistrictUserRole.objects.create(user=user, district=district, level=level)
+
+        client = TestClient(self.url)
+        with client.login(user):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+        assert result.errors is None
+        return result
+
+    def test_metrics_included_for_admins(self) -> None:
+        result = self._query(DistrictUserRoleType.ADMIN)
+
+        assert result.extensions is not None
+        metrics: dict[str, Any] = result.extensions["performance"]  # type: ignore[assignment]
+        assert metrics["sqlQueryCount"] > 0
+        assert metrics["sqlTimeMs"] >= 0
+        assert list(metrics["dataloaderBatchSizes"]) == ["osm.latest_young_person_count_for_groups"]
+        assert sum(metrics["dataloaderBatchSizes"]["osm.latest_young_person_count_for_groups"]) == 3
+        assert {resolver["path"] for resolver in metrics["slowestResolvers"]} >= {
+            "groups",
+            "groups.edges.0.node.youngPersonCount",
+        }
+
+    def test_metrics_logged_for_everyone(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO, logger="salute.api.instrumentation"):
+            result = self._query(DistrictUserRoleType.MANAGER)
+
+        assert result.extensions is None or "performance" not in result.extensions
+        (record,) = caplog.records
+        assert record.getMessage().startswith("GraphQL operation DistrictGroups ran")
+        assert record.graphql_operation == "DistrictGroups"  # type: ignore[attr-defined]
+        assert record.sqlQueryCount > 0  # type: ignore[attr-defined]
+
+    def _get_context(self, user: User) -> SaluteContext:
+        request = RequestFactory().post(self.url)
+        request.user = user
+
+        async def auser() -> User:
+            return user
+
+        request.auser = auser
+        return SaluteContext(request=request)
+
+    def test_concurrent_operations(self) -> None:
+        district = DistrictFactory()
+        GroupFactory.create_batch(3, district=district)
+        user = UserFactory(person=PersonFactory())
+        DistrictUserRole.objects.create(user=user, district=district, level=DistrictUserRoleType.ADMIN)
+        # Dataloader batches depend on how the operations are scheduled, so this doesn't use any
+        groups_query = "query Groups { groups { edges { node { displayName } } } }"
+        ping_query = "query Ping { ping }"
+
+        async def _execute(query: str) -> int:
+            result = await schema.execute(query, context_value=self._get_context(user))
+            assert result.errors is None
+            assert result.extensions is not None
+            return result.extensions["performance"]["sqlQueryCount"]
+
+        async def _execute_concurrently() -> list[int]:
+            return list(await asyncio.gather(_execute(groups_query), _execute(ping_query)))
+
+        expected_counts = [async_to_sync(_execute)(groups_query), async_to_sync(_execute)(ping_query)]
+        cache.clear()
+
+        # The sync code for both operations runs on the same connection, but each only counts its own queries
+        assert async_to_sync(_execute_concurrently)() == expected_counts
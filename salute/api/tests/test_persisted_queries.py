@@ -0,0 +1,68 @@
+import hashlib
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.test import Client as DjangoTestClient
+from django.urls import reverse
+
+from salute.accounts.models import User
+
+PING_QUERY = "query Ping { ping }"
+PING_QUERY_HASH = hashlib.sha256(PING_QUERY.encode()).hexdigest()
+
+
+@pytest.mark.django_db
+class TestPersistedQueries:
+    url = reverse("graphql")
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        cache.clear()
+
+    def _post(self, client: DjangoTestClient, payload: dict[str, Any]) -> dict[str, Any]:
+        resp = client.post(self.url, payload, content_type="application/json")
+        return resp.json()
+
+    def _persisted_query_extension(self, sha256_hash: str = PING_QUERY_HASH, version: int = 1) -> dict[str, Any]:
+        return {"persistedQuery": {"version": version, "sha256Hash": sha256_hash}}
+
+    def test_unknown_hash(self, client: DjangoTestClient, admin_user: User) -> None:
+        client.force_login(admin_user)
+        data = self._post(client, {"extensions": self._persisted_query_extension()})
+
+        assert data["data"] is None
+        assert data["errors"] == [
+            {"message": "PersistedQueryNotFound", "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}
+        ]
+
+    def test_register_and_use_hash(self, client: DjangoTestClient, admin_user: User) -> None:
+        client.force_login(admin_user)
+        data = self._post(client, {"query": PING_QUERY, "extensions": self._persisted_query_extension()})
+        assert data["data"] == {"ping": "pong"}
+
+        data = self._post(client, {"extensions": self._persisted_query_extension()})
+        assert data["data"] == {"ping": "pong"}
+
+    def test_hash_does_not_match_query(self, client: DjangoTestClient, admin_user: User) -> None:
+        client.force_login(admin_user)
+        data = self._post(
+            client, {"query": PING_QUERY, "extensions": self._persisted_query_extension(sha256_hash="bees")}
+        )
+
+        assert data["errors"] == [
+            {"message": "provided sha does not match query", "extensions": {"code": "BAD_REQUEST"}}
+        ]
+        assert self._post(client, {"extensions": self._persisted_query_extension(sha256_hash="bees")})["errors"]
+
+    def test_unsupported_version(self, client: DjangoTestClient, admin_user: User) -> None:
+        client.force_login(admin_user)
+        data = self._post(client, {"query": PING_QUERY, "extensions": self._persisted_query_extension(version=2)})
+
+        assert data["errors"] == [
+            {"message": "PersistedQueryNotSupported", "extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"}}
+        ]
+
+    def test_without_persisted_query(self, client: DjangoTestClient, admin_user: User) -> None:
+        client.force_login(admin_user)
+        assert self._post(client, {"query": PING_QUERY})["data"] == {"ping": "pong"}
@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+from graphql import parse, validate
+from pytest_django.fixtures import SettingsWrapper
+
+from salute.api.query_cost import QueryCostRule
+from salute.api.schema import schema
+
+GROUP_SECTIONS_QUERY = """
+query GroupSections {
+    groups%s {
+        edges {
+            node {
+                shortcode
+                sections%s {
+                    edges {
+                        node {
+                            unitName
+                        }
+                    }
+                    totalCount
+                }
+            }
+        }
+        totalCount
+    }
+}
+"""
+
+
+def _get_error_messages(query: str) -> list[str]:
+    return [error.message for error in validate(schema._schema, parse(query), [QueryCostRule])]
+
+
+class TestQueryCostRule:
+    def test_query_within_budget(self) -> None:
+        assert _get_error_messages(GROUP_SECTIONS_QUERY % ("", "")) == []
+
+    def test_query_above_budget(self, settings: SettingsWrapper, caplog: pytest.LogCaptureFixture) -> None:
+        settings.GRAPHQL_MAX_QUERY_COST = 20_000
+
+        with caplog.at_level(logging.WARNING, logger="salute.api.query_cost"):
+            assert _get_error_messages(GROUP_SECTIONS_QUERY % ("", "")) == [
+                "Query cost of 20301 exceeds the maximum of 20000."
+            ]
+
+        assert "Rejected GraphQL operation GroupSections with cost 20301" in caplog.text
+
+    def test_page_size_multiplies_cost(self, settings: SettingsWrapper) -> None:
+        settings.GRAPHQL_MAX_QUERY_COST = 0
+
+        assert _get_error_messages(GROUP_SECTIONS_QUERY % ("(first: 5)", "(first: 2)")) == [
+            "Query cost of 36 exceeds the maximum of 0."
+        ]
+
+    def test_weighted_and_async_fields(self, settings: SettingsWrapper) -> None:
+        settings.GRAPHQL_MAX_QUERY_COST = 0
+        query = """
+        query {
+            district {
+                totalWaitingListCount
+                ...DistrictCensus
+            }
+        }
+
+        fragment DistrictCensus on District {
+            censusTrends {
+                year
+            }
+        }
+        """
+
+        # district (1) + totalWaitingListCount (async, 5) + censusTrends (50 + 10 * year (0))
+        assert _get_error_messages(query) == ["Query cost of 56 exceeds the maximum of 0."]
@@ -0,0 +1,93 @@
+import pytest
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from strawberry_django.test.client import Response, TestClient
+
+from salute.accounts.factories import UserFactory
+from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
+from salute.core.data_epoch import bump_data_epoch, get_data_epoch
+from salute.hierarchy.factories import DistrictFactory
+from salute.hierarchy.models import District
+from salute.people.factories import PersonFactory
+
+
+@pytest.mark.django_db
+class TestDataEpoch:
+    def test_bump_data_epoch(self) -> None:
+        epoch = get_data_epoch()
+        bump_data_epoch()
+        bump_data_epoch()
+        assert get_data_epoch() == epoch + 2
+
+    def test_admin_change_bumps_data_epoch(self) -> None:
+        district = DistrictFactory()
+        epoch = get_data_epoch()
+
+        LogEntry.objects.log_actions(
+            user_id=UserFactory().pk,
+            queryset=[district],
+            action_flag=CHANGE,
+        )
+
+        assert get_data_epoch() == epoch + 1
+        assert LogEntry.objects.filter(content_type=ContentType.objects.get_for_model(District)).exists()
+
+
+@pytest.mark.django_db
+class TestResponseCache:
+    url = reverse("graphql")
+
+    QUERY = """
+    query {
+        district {
+            unitName
+        }
+    }
+    """
+
+    def _query_unit_name(self, user: User) -> str:
+        client = TestClient(self.url)
+        with client.login(user):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+        assert result.errors is None
+        return result.data["district"]["unitName"]  # type: ignore[index]
+
+    def test_cached_until_data_epoch_bumped(self) -> None:
+        DistrictFactory(unit_name="Before")
+        user = UserFactory(person=PersonFactory())
+
+        assert self._query_unit_name(user) == "Before"
+
+        District.objects.update(unit_name="After")
+        assert self._query_unit_name(user) == "Before"
+
+        bump_data_epoch()
+        assert self._query_unit_name(user) == "After"
+
+    def test_cache_is_scoped_to_permissions(self) -> None:
+        district = DistrictFactory(unit_name="Before")
+        user = UserFactory(person=PersonFactory())
+        other_user = UserFactory(person=PersonFactory())
+        DistrictUserRole.objects.create(user=other_user, district=district, level=DistrictUserRoleType.MANAGER)
+
+        assert self._query_unit_name(user) == "Before"
+
+        District.objects.update(unit_name="After")
+        assert self._query_unit_name(other_user) == "After"
+
+    def test_errors_are_not_cached(self) -> None:
+        DistrictFactory(unit_name="Before")
+        user = UserFactory(person=None)
+
+        client = TestClient(self.url)
+        with client.login(user):
+            result = client.query(self.QUERY, assert_no_errors=False)
+        assert isinstance(result, Response)
+        assert result.errors is not None
+
+        user.person = PersonFactory()
+        user.save()
+        assert self._query_unit_name(user) == "Before"
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
-from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.http import Http404
 from strawberry.django.views import AsyncGraphQLView
@@ -17,6 +17,8 @@ from salute.api.context import SaluteContext
 if TYPE_CHECKING:
     from django.http import HttpRequest, HttpResponse, HttpResponseBase
 
+    from salute.accounts.models import User
+
 
 class SaluteAsyncGraphQLView(AsyncGraphQLView):
     async def get_context(self, request: HttpRequest, response: HttpResponse) -> SaluteContext:  # type: ignore[override]
@@ -37,19 +39,20 @@ class SaluteAsyncGraphQLView(AsyncGraphQLView):
         *args: Any,
         **kwargs: Any,
     ) -> HttpResponseBase:
-        response_data = await sync_to_async(self._authenticate_request)(request)
+        response_data = await self._authenticate_request(request)
         if response_data is not None:
             return self.create_response(response_data=response_data, sub_response=await self.get_sub_response(request))
 
         return await super().dispatch(request, *args, **kwargs)
 
-    def _authenticate_request(self, request: HttpRequest) -> GraphQLHTTPResponse | None:
+    async def _authenticate_request(self, request: HttpRequest) -> GraphQLHTTPResponse | None:
         """
         Authenticate the request.
 
         :returns: An error response, or None if the request may continue.
         """
-        if request.user.is_authenticated:
+        user = await request.auser()
+        if user.is_authenticated:
             return None
 
         # Check for a Bearer token Authorization header
@@ -57,12 +60,20 @@ class SaluteAsyncGraphQLView(AsyncGraphQLView):
             if header.startswith("Bearer "):
                 token = header.removeprefix("Bearer ")
                 try:
-                    auth_info = authenticate_user_with_bearer_token(token)
+                    auth_info = await authenticate_user_with_bearer_token(token)
                 except RequestAuthenticationError as e:
                     return {"data": None, "errors": e.errors}  # type: ignore[typeddict-item]
 
                 # Mutate the request with the data we need.
                 request.user = auth_info["user"]
+                request.auser = _get_user(auth_info["user"])
                 request.scopes = auth_info["scopes"]  # type: ignore[attr-defined]
 
         return None
+
+
+def _get_user(user: User) -> Callable[[], Awaitable[User]]:
+    async def auser() -> User:
+        return user
+
+    return auser
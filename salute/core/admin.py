@@ -1,10 +1,32 @@
 from typing import Any
 
+from django.contrib import admin
+from django.contrib.admin.actions import delete_selected
+from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.template.response import TemplateResponse
 
+from salute.core.data_epoch import bump_data_epoch
 from salute.core.models import BaseModel
 
 
+@admin.action(permissions=["delete"], description=delete_selected.short_description)  # type: ignore[attr-defined]
+def delete_selected_and_bump_data_epoch(
+    modeladmin: admin.ModelAdmin, request: HttpRequest, queryset: QuerySet
+) -> TemplateResponse | None:
+    """Delete the selected objects, as the built-in action does.
+
+    Deleting several objects logs them with bulk_create, which doesn't send the signal that bumps the data epoch.
+    """
+    response = delete_selected(modeladmin, request, queryset)
+    if response is None:
+        bump_data_epoch()
+    return response
+
+
+admin.site.add_action(delete_selected_and_bump_data_epoch, "delete_selected")
+
+
 class BaseModelAdminMixin:
     FIELDSETS: Any = (
         (
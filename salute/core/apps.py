@@ -20,8 +20,14 @@ class CoreConfig(AppConfig):
     name = "salute.core"
 
     def ready(self) -> None:
+        from django.contrib.admin.models import LogEntry
         from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_save
 
         from . import permissions  # noqa: F401
+        from .data_epoch import on_admin_log_entry_saved
 
         connection_created.connect(on_connection_created)
+
+        # The admin logs every addition, change and deletion, including bulk deletions
+        post_save.connect(on_admin_log_entry_saved, sender=LogEntry)
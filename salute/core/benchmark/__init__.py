@@ -0,0 +1 @@
+"""A non-interactive benchmark of the GraphQL API against a synthetic district."""
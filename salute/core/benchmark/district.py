@@ -0,0 +1,180 @@
+"""Generation of a synthetic district at a configurable scale."""
+
+from __future__ import annotations
+
+import datetime
+import random
+from dataclasses import dataclass
+
+import factory.random
+from django.db import transaction
+from django.utils import timezone
+
+from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
+from salute.hierarchy.constants import GROUP_SECTION_TYPES, SectionType
+from salute.hierarchy.factories import DistrictFactory, DistrictSectionFactory, GroupFactory, GroupSectionFactory
+from salute.hierarchy.models import District, Section
+from salute.integrations.osm.headcounts import rebuild_headcount_rollups, update_latest_headcounts
+from salute.integrations.osm.models import OSMSectionHeadcountRecord
+from salute.locations.factories import SiteFactory
+from salute.people.factories import PersonFactory
+from salute.people.models import Person
+from salute.roles.factories import (
+    DistrictSectionTeamFactory,
+    DistrictSubTeamFactory,
+    DistrictTeamFactory,
+    GroupSectionTeamFactory,
+    GroupSubTeamFactory,
+    GroupTeamFactory,
+    RoleFactory,
+    RoleStatusFactory,
+    RoleTypeFactory,
+    TeamTypeFactory,
+)
+from salute.roles.models import Role, Team, TeamType
+from salute.stats.census import update_census_facts
+from salute.stats.models import SectionCensusReturn
+from salute.stats.summary_records import update_summary_records
+
+BENCHMARK_USER_EMAIL = "benchmark@example.com"
+
+
+@dataclass(frozen=True)
+class DistrictScale:
+    """The number of each kind of object to generate."""
+
+    groups: int = 20
+    sections_per_group: int = 5
+    district_sections: int = 6
+    sub_teams_per_team: int = 2
+    people: int = 2000
+    roles_per_person: int = 2
+    headcount_weeks: int = 104
+    census_years: int = 5
+
+
+@dataclass(frozen=True)
+class SyntheticDistrict:
+    """The generated district, and the objects that the benchmark operations refer to."""
+
+    district: District
+    user: User
+    team: Team
+    section: Section
+
+
+def generate_district(scale: DistrictScale, *, seed: int = 0) -> SyntheticDistrict:
+    """Generate a district with groups, sections, teams, people, roles, OSM headcounts and census returns.
+
+    The units and teams are created with factories, and the bulkier data with bulk queries. The derived tables
+    (role flags, latest headcounts, rollups, census facts and summary records) are then updated as the syncs do.
+    The same seed always generates the same district.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    factory.random.reseed_random(seed)
+    today = timezone.localdate()
+
+    with transaction.atomic():
+        district = DistrictFactory(unit_name="Benchmarkton")
+
+        leadership_team_type = TeamTypeFactory(name="Leadership Team")
+        trustee_board_team_type = TeamTypeFactory(name="Trustee Board")
+        section_team_types: dict[SectionType, TeamType] = {
+            section_type: TeamTypeFactory(name=f"{section_type.label} Section Team")
+            for section_type in SectionType
+            if section_type != SectionType.NETWORK
+        }
+
+        # District teams, with sub-teams under the leadership team
+        leadership_team = DistrictTeamFactory(team_type=leadership_team_type, district=district, allow_sub_team=True)
+        DistrictTeamFactory(team_type=trustee_board_team_type, district=district)
+        for _ in range(scale.sub_teams_per_team):
+            DistrictSubTeamFactory(parent_team=leadership_team)
+
+        sections = []
+        for i in range(scale.district_sections):
+            section_type = SectionType.YOUNG_LEADERS if i == 0 else SectionType.EXPLORERS
+            section = DistrictSectionFactory(district=district, section_type=section_type)
+            DistrictSectionTeamFactory(section=section, team_type=section_team_types[section_type])
+            sections.append(section)
+
+        for _ in range(scale.groups):
+            group = GroupFactory(district=district, primary_site=SiteFactory())
+            group_leadership_team = GroupTeamFactory(team_type=leadership_team_type, group=group, allow_sub_team=True)
+            GroupTeamFactory(team_type=trustee_board_team_type, group=group)
+            for _ in range(scale.sub_teams_per_team):
+                GroupSubTeamFactory(parent_team=group_leadership_team)
+
+            for i in range(scale.sections_per_group):
+                section_type = GROUP_SECTION_TYPES[i % len(GROUP_SECTION_TYPES)]
+                section = GroupSectionFactory(group=group, section_type=section_type)
+                GroupSectionTeamFactory(section=section, team_type=section_team_types[section_type])
+                sections.append(section)
+
+        # People and their roles
+        role_statuses = [RoleStatusFactory(name=name) for name in ("Full", "Provisional")]
+        role_types = [
+            RoleTypeFactory(name="Team Leader", is_member_role=True, included_in_census=True),
+            RoleTypeFactory(name="Team Member", is_member_role=True),
+            RoleTypeFactory(name="Network Member", is_youth_member=True),
+            RoleTypeFactory(name="Supporter"),
+        ]
+        teams = list(Team.objects.all())
+        people = Person.objects.bulk_create(PersonFactory.build_batch(scale.people), batch_size=1000)
+        Role.objects.bulk_create(
+            [
+                RoleFactory.build(
+                    person=person,
+                    team=rng.choice(teams),
+                    role_type=rng.choice(role_types),
+                    status=rng.choice(role_statuses),
+                )
+                for person in people
+                for _ in range(scale.roles_per_person)
+            ],
+            batch_size=1000,
+        )
+        Person.objects.update_role_flags()
+
+        # Weekly OSM headcounts
+        OSMSectionHeadcountRecord.objects.bulk_create(
+            [
+                OSMSectionHeadcountRecord(
+                    section=section,
+                    date=today - datetime.timedelta(weeks=week),
+                    young_person_count=rng.randint(5, 40),
+                    adult_count=rng.randint(2, 10),
+                )
+                for section in sections
+                for week in range(scale.headcount_weeks)
+            ],
+            batch_size=1000,
+        )
+        update_latest_headcounts()
+        rebuild_headcount_rollups()
+
+        # Annual census returns
+        census_returns = SectionCensusReturn.objects.bulk_create(
+            [
+                SectionCensusReturn(
+                    section=section,
+                    year=today.year - year,
+                    data={
+                        "annual_cost": str(rng.randint(100, 300)),
+                        **{f"y_{age}_{gender}": str(rng.randint(0, 8)) for age in range(6, 18) for gender in "mf"},
+                        **{f"l_leader_{gender}": str(rng.randint(0, 4)) for gender in "mf"},
+                    },
+                )
+                for section in sections
+                for year in range(1, scale.census_years + 1)
+            ],
+            batch_size=1000,
+        )
+        update_census_facts(census_returns)
+
+        update_summary_records(today)
+
+        user = User.objects.create_user(email=BENCHMARK_USER_EMAIL, person=people[0] if people else None)
+        DistrictUserRole.objects.create(user=user, district=district, level=DistrictUserRoleType.ADMIN)
+
+    return SyntheticDistrict(district=district, user=user, team=leadership_team, section=sections[-1])
@@ -0,0 +1,217 @@
+"""The corpus of GraphQL operations that are benchmarked, based on the pages of the frontend."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from strawberry.relay import to_base64
+
+from salute.core.benchmark.district import SyntheticDistrict
+
+
+@dataclass(frozen=True)
+class BenchmarkOperation:
+    name: str
+    query: str
+    get_variables: Callable[[SyntheticDistrict], dict[str, Any]] = field(default=lambda _: {})
+
+
+DISTRICT_DASHBOARD = BenchmarkOperation(
+    name="DistrictDashboard",
+    query="""
+    query DistrictDashboard {
+        district {
+            displayName
+            totalGroupsCount
+            totalSectionsCount
+            totalPeopleCount
+            totalMemberCount: totalPeopleCount(isMember: true)
+            totalRolesCount
+            youngPersonCount
+            censusTrends {
+                year
+                district {
+                    sectionCount
+                    totalYoungPeople
+                    totalVolunteers
+                    youngPeopleChange
+                }
+            }
+            summaryHistory(period: MONTH) {
+                periodStart
+                totalPeople
+            }
+        }
+    }
+    """,
+)
+
+GROUP_LIST = BenchmarkOperation(
+    name="GroupList",
+    query="""
+    query GroupList {
+        groups {
+            totalCount
+            edges {
+                node {
+                    id
+                    displayName
+                    groupType
+                    primarySite {
+                        displayName
+                    }
+                    youngPersonCount
+                    totalWaitingListCount
+                    sections {
+                        edges {
+                            node {
+                                id
+                                displayName
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """,
+)
+
+SECTION_LIST = BenchmarkOperation(
+    name="SectionList",
+    query="""
+    query SectionList {
+        sections {
+            totalCount
+            edges {
+                node {
+                    id
+                    displayName
+                    usualWeekday
+                    site {
+                        displayName
+                    }
+                    team {
+                        displayName
+                    }
+                    youngPersonCount
+                    annualSubsCost
+                    totalWaitingListCount
+                }
+            }
+        }
+    }
+    """,
+)
+
+SECTION_DETAIL = BenchmarkOperation(
+    name="SectionDetail",
+    query="""
+    query SectionDetail($sectionId: ID!) {
+        sections(first: 1, filters: {id: {exact: $sectionId}}) {
+            edges {
+                node {
+                    displayName
+                    youngPersonCount
+                    headcountHistory(period: MONTH) {
+                        periodStart
+                        youngPersonCount
+                    }
+                    censusReturns {
+                        year
+                        totalYoungPeople
+                        totalVolunteers
+                    }
+                }
+            }
+        }
+    }
+    """,
+    get_variables=lambda district: {"sectionId": to_base64("DistrictOrGroupSection", district.section.pk)},
+)
+
+PEOPLE_LIST = BenchmarkOperation(
+    name="PeopleList",
+    query="""
+    query PeopleList {
+        people(first: 100, ordering: [{displayName: ASC}]) {
+            totalCount
+            edges {
+                node {
+                    id
+                    displayName
+                    formattedMembershipNumber
+                    isMember
+                    isIncludedInCensus
+                    roles {
+                        edges {
+                            node {
+                                team {
+                                    displayName
+                                }
+                                roleType {
+                                    displayName
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """,
+)
+
+TEAM_DETAIL = BenchmarkOperation(
+    name="TeamDetail",
+    query="""
+    query TeamDetail($teamId: ID!) {
+        teams(first: 1, filters: {id: {exact: $teamId}}) {
+            edges {
+                node {
+                    displayName
+                    teamType {
+                        displayName
+                    }
+                    personCount
+                    subTeams {
+                        displayName
+                        personCount
+                    }
+                    roles(first: 100) {
+                        edges {
+                            node {
+                                person {
+                                    displayName
+                                }
+                                roleType {
+                                    displayName
+                                }
+                                status {
+                                    displayName
+                                }
+                            }
+                        }
+                    }
+                    summaryHistory(period: MONTH) {
+                        periodStart
+                        totalPeople
+                    }
+                }
+            }
+        }
+    }
+    """,
+    get_variables=lambda district: {"teamId": to_base64("Team", district.team.pk)},
+)
+
+BENCHMARK_OPERATIONS = [
+    DISTRICT_DASHBOARD,
+    GROUP_LIST,
+    SECTION_LIST,
+    SECTION_DETAIL,
+    PEOPLE_LIST,
+    TEAM_DETAIL,
+]
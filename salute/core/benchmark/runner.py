@@ -0,0 +1,138 @@
+"""Running the benchmark operations through the schema, and summarising the results."""
+
+from __future__ import annotations
+
+import math
+import statistics
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.test import RequestFactory
+
+from salute.accounts.models import User
+from salute.api.context import SaluteContext
+from salute.api.schema import schema
+from salute.core.benchmark.district import SyntheticDistrict
+from salute.core.benchmark.operations import BenchmarkOperation
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class BenchmarkOperationError(Exception):
+    def __init__(self, operation: BenchmarkOperation, errors: list[Any]) -> None:
+        super().__init__(f"{operation.name} returned errors: {errors}")
+
+
+@dataclass(frozen=True)
+class OperationResult:
+    """The latencies and SQL query counts for every iteration of an operation."""
+
+    name: str
+    durations_ms: list[float]
+    sql_query_counts: list[int]
+    sql_times_ms: list[float]
+
+    def get_summary(self) -> dict[str, Any]:
+        return {
+            "iterations": len(self.durations_ms),
+            "latency_ms": {
+                "min": round(min(self.durations_ms), 2),
+                "mean": round(statistics.fmean(self.durations_ms), 2),
+                **{f"p{p}": round(get_percentile(self.durations_ms, p), 2) for p in PERCENTILES},
+                "max": round(max(self.durations_ms), 2),
+            },
+            "sql_query_count": {
+                "min": min(self.sql_query_counts),
+                "max": max(self.sql_query_counts),
+            },
+            "sql_time_ms": {
+                "mean": round(statistics.fmean(self.sql_times_ms), 2),
+                "p50": round(get_percentile(self.sql_times_ms, 50), 2),
+            },
+        }
+
+
+def get_percentile(values: list[float], percentile: float) -> float:
+    """Get a percentile of some values using the nearest-rank method."""
+    ordered = sorted(values)
+    rank = math.ceil(percentile / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def _get_request(user: User) -> HttpRequest:
+    request = RequestFactory().post("/graphql/")
+    request.user = user
+
+    async def auser() -> User:
+        return user
+
+    request.auser = auser
+    return request
+
+
+def run_operation(
+    operation: BenchmarkOperation,
+    district: SyntheticDistrict,
+    *,
+    iterations: int,
+    warmup: int = 1,
+    clear_cache: bool = True,
+) -> OperationResult:
+    """Execute an operation through the schema, recording the latency and SQL queries for each iteration.
+
+    The warm-up iterations fill the parser and validation caches, and are not recorded.
+    The SQL metrics come from the instrumentation extension, so the benchmark user must be a district admin.
+    """
+    variables = operation.get_variables(district)
+    execute = async_to_sync(schema.execute)
+
+    durations_ms = []
+    sql_query_counts = []
+    sql_times_ms = []
+    for iteration in range(warmup + iterations):
+        # Otherwise every iteration after the first would be served from the response cache.
+        # The cache is local to the process, so this doesn't affect any running servers.
+        if clear_cache:
+            cache.clear()
+
+        context = SaluteContext(request=_get_request(district.user))
+        start = time.perf_counter()
+        result = execute(operation.query, variable_values=variables, context_value=context)
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        if result.errors:
+            raise BenchmarkOperationError(operation, result.errors)
+
+        if iteration < warmup:
+            continue
+
+        performance = (result.extensions or {}).get("performance", {})
+        durations_ms.append(duration_ms)
+        sql_query_counts.append(performance.get("sqlQueryCount", 0))
+        sql_times_ms.append(performance.get("sqlTimeMs", 0.0))
+
+    return OperationResult(
+        name=operation.name,
+        durations_ms=durations_ms,
+        sql_query_counts=sql_query_counts,
+        sql_times_ms=sql_times_ms,
+    )
+
+
+def run_benchmark(
+    operations: Iterable[BenchmarkOperation],
+    district: SyntheticDistrict,
+    *,
+    iterations: int,
+    warmup: int = 1,
+    clear_cache: bool = True,
+) -> list[OperationResult]:
+    return [
+        run_operation(operation, district, iterations=iterations, warmup=warmup, clear_cache=clear_cache)
+        for operation in operations
+    ]
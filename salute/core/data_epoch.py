@@ -0,0 +1,34 @@
+"""The global data epoch, used to invalidate caches when the data changes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models import F
+from django.utils import timezone
+
+from salute.core.models import DataEpoch
+
+
+def get_data_epoch() -> int:
+    """Get the current data epoch."""
+    value = DataEpoch.objects.filter(id=DataEpoch.SINGLETON_ID).values_list("value", flat=True).first()
+    return value or 0
+
+
+def bump_data_epoch() -> None:
+    """Increment the data epoch, invalidating anything cached under the previous epoch.
+
+    This should be called at the end of every command that syncs or imports data.
+    """
+    # update() doesn't set auto_now fields, so updated_at is set explicitly
+    updated = DataEpoch.objects.filter(id=DataEpoch.SINGLETON_ID).update(
+        value=F("value") + 1, updated_at=timezone.now()
+    )
+    if not updated:
+        DataEpoch.objects.get_or_create(id=DataEpoch.SINGLETON_ID, defaults={"value": 1})
+
+
+def on_admin_log_entry_saved(sender: Any, **kwargs: Any) -> None:
+    """Bump the data epoch when anything is added, changed or deleted in the admin."""
+    bump_data_epoch()
@@ -0,0 +1,127 @@
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from django.utils import timezone
+
+from salute.core.benchmark.district import DistrictScale, generate_district
+from salute.core.benchmark.operations import BENCHMARK_OPERATIONS
+from salute.core.benchmark.runner import BenchmarkOperationError, run_benchmark
+from salute.hierarchy.models import District
+
+
+class Command(BaseCommand):
+    help = """Benchmark the GraphQL API against a synthetic district.
+
+The district is generated inside a transaction that is rolled back at the end, so the database must not
+contain a district already. The latency percentiles and SQL query counts for each operation are written
+to a JSON file, so runs can be compared over time."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        for scale_field in dataclasses.fields(DistrictScale):
+            parser.add_argument(
+                f"--{scale_field.name.replace('_', '-')}",
+                type=int,
+                default=scale_field.default,
+                help=f"Number of {scale_field.name.replace('_', ' ')} to generate (default: {scale_field.default})",
+            )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Number of times each operation is run (default: 20)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=1,
+            help="Number of unrecorded runs of each operation before the iterations (default: 1)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed for the generated data (default: 0)",
+        )
+        parser.add_argument(
+            "--operation",
+            action="append",
+            choices=[operation.name for operation in BENCHMARK_OPERATIONS],
+            help="Only run this operation. May be repeated (default: all operations)",
+        )
+        parser.add_argument(
+            "--keep-response-cache",
+            action="store_true",
+            help="Serve repeated operations from the response cache, instead of clearing it for each iteration",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default="benchmark-results.json",
+            help="Path to write the results to (default: benchmark-results.json)",
+        )
+
+    def handle(self, *args: str, **options: Any) -> None:
+        scale = DistrictScale(
+            **{scale_field.name: int(options[scale_field.name]) for scale_field in dataclasses.fields(DistrictScale)}
+        )
+        if scale.groups < 1 or scale.sections_per_group < 1:
+            raise CommandError("At least one group with one section is needed.")
+
+        iterations = int(options["iterations"])
+        if iterations < 1:
+            raise CommandError("At least one iteration is needed.")
+
+        if District.objects.exists():
+            raise CommandError("There is already a district in the database. Please use an empty database.")
+
+        operations = [
+            operation
+            for operation in BENCHMARK_OPERATIONS
+            if not options["operation"] or operation.name in options["operation"]
+        ]
+        output = Path(str(options["output"]))
+        started_at = timezone.now()
+
+        with transaction.atomic():
+            self.stdout.write(f"Generating district: {scale}")
+            district = generate_district(scale, seed=int(options["seed"]))
+
+            self.stdout.write(f"Running {len(operations)} operation(s) {iterations} time(s) each")
+            try:
+                results = run_benchmark(
+                    operations,
+                    district,
+                    iterations=iterations,
+                    warmup=max(int(options["warmup"]), 0),
+                    clear_cache=not options["keep_response_cache"],
+                )
+            except BenchmarkOperationError as exc:
+                raise CommandError(str(exc)) from exc
+            finally:
+                transaction.set_rollback(True)
+
+        summaries = {result.name: result.get_summary() for result in results}
+        for name, summary in summaries.items():
+            latency = summary["latency_ms"]
+            self.stdout.write(
+                f"{name}: p50={latency['p50']}ms p95={latency['p95']}ms max={latency['max']}ms "
+                f"sql_queries={summary['sql_query_count']['max']}"
+            )
+
+        output.write_text(
+            json.dumps(
+                {
+                    "started_at": started_at.isoformat(),
+                    "seed": int(options["seed"]),
+                    "scale": dataclasses.asdict(scale),
+                    "response_cache": bool(options["keep_response_cache"]),
+                    "operations": summaries,
+                },
+                indent=2,
+            )
+        )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
@@ -1,4 +1,5 @@
 import uuid
+from typing import Self
 
 from django.db import models
 
@@ -13,6 +14,19 @@ class BaseModel(models.Model):
         abstract = True
 
 
+class LatestPerParentQuerySet(models.QuerySet):
+    def latest_per_parent(self, parent_field: str, order_field: str) -> Self:
+        """Get the latest row for each parent, ordered by order_field, using DISTINCT ON.
+
+        This replaces any existing ordering, and is a single index scan if the model
+        has an index on (parent_field, -order_field).
+        """
+        return self.order_by(parent_field, f"-{order_field}").distinct(parent_field)
+
+
+LatestPerParentManager = models.Manager.from_queryset(LatestPerParentQuerySet)
+
+
 class Taxonomy(BaseModel):
     name = models.CharField(max_length=255)
 
@@ -22,3 +36,19 @@ class Taxonomy(BaseModel):
 
     def __str__(self) -> str:
         return self.name
+
+
+class DataEpoch(models.Model):
+    """A counter that is incremented whenever the data is changed by a sync or in the admin.
+
+    There is only a single row. Cached data that includes the epoch in its key is invalidated by a bump.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID, editable=False)
+    value = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Data epoch {self.value}"
@@ -5,6 +5,7 @@ from salute.accounts.models import DistrictUserRoleType
 from salute.core.predicates import (
     can_list_workspace_accounts,
     can_view_accreditation,
+    can_view_district_summary_data,
     can_view_group_summary_data,
     can_view_person,
     can_view_person_pii,
@@ -22,15 +23,20 @@ from salute.core.predicates import (
 # Hierarchy
 rules.add_perm("district.view", user_has_related_person)
 rules.add_perm("district.view_young_person_count", user_has_related_person)
+rules.add_perm("district.view_summary_history", can_view_district_summary_data)
+rules.add_perm("district.view_census_trends", can_view_district_summary_data)
+rules.add_perm("district.view_waiting_list_demand", can_view_district_summary_data)
 
 rules.add_perm("group.list", user_has_related_person)
 rules.add_perm("group.view", user_has_related_person)
 rules.add_perm("group.view_young_person_count", can_view_group_summary_data)
+rules.add_perm("group.view_summary_history", can_view_group_summary_data)
 
 rules.add_perm("section.list", user_has_related_person)
 rules.add_perm("section.view", user_has_related_person)
 rules.add_perm("section.view_young_person_count", can_view_section_summary_data)
 rules.add_perm("section.view_census_returns", can_view_section_summary_data)
+rules.add_perm("section.view_summary_history", can_view_section_summary_data)
 
 rules.add_perm("section_type.list", user_has_related_person)
 
@@ -69,6 +75,7 @@ rules.add_perm("team_type.view", user_has_related_person)
 rules.add_perm("team.list", user_has_related_person)
 rules.add_perm("team.view", user_has_related_person)
 rules.add_perm("team.view_person_count", can_view_team_person_count)
+rules.add_perm("team.view_summary_history", can_view_team_person_count)
 
 # Locations
 rules.add_perm("site.list", user_has_related_person)
@@ -78,6 +78,10 @@ can_view_site_tenure_type = has_district_role(DistrictUserRoleType.MANAGER) | ha
     DistrictUserRoleType.ADMIN
 )
 
+can_view_district_summary_data = has_district_role(DistrictUserRoleType.MANAGER) | has_district_role(
+    DistrictUserRoleType.ADMIN
+)
+
 can_view_group_summary_data = has_district_role(DistrictUserRoleType.MANAGER) | has_district_role(
     DistrictUserRoleType.ADMIN
 )
@@ -0,0 +1,73 @@
+import json
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from salute.core.benchmark.operations import BENCHMARK_OPERATIONS
+from salute.core.benchmark.runner import get_percentile
+from salute.hierarchy.factories import DistrictFactory
+from salute.hierarchy.models import District
+from salute.people.models import Person
+
+SMALL_SCALE = {
+    "groups": 2,
+    "sections_per_group": 2,
+    "district_sections": 2,
+    "sub_teams_per_team": 1,
+    "people": 10,
+    "roles_per_person": 2,
+    "headcount_weeks": 3,
+    "census_years": 2,
+}
+
+
+@pytest.mark.django_db
+class TestBenchmarkGraphQLCommand:
+    def test_benchmark(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.json"
+        stdout = StringIO()
+
+        call_command("benchmark_graphql", iterations=2, output=str(output), stdout=stdout, **SMALL_SCALE)
+
+        results = json.loads(output.read_text())
+        assert results["scale"] == SMALL_SCALE
+        assert results["operations"].keys() == {operation.name for operation in BENCHMARK_OPERATIONS}
+        for summary in results["operations"].values():
+            assert summary["iterations"] == 2
+            assert summary["latency_ms"].keys() == {"min", "mean", "p50", "p90", "p95", "p99", "max"}
+            assert summary["sql_query_count"]["min"] > 0
+
+        # The generated data is rolled back
+        assert not District.objects.exists()
+        assert not Person.objects.exists()
+
+    def test_benchmark__single_operation(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.json"
+
+        call_command(
+            "benchmark_graphql",
+            iterations=1,
+            operation=["GroupList"],
+            output=str(output),
+            stdout=StringIO(),
+            **SMALL_SCALE,
+        )
+
+        assert json.loads(output.read_text())["operations"].keys() == {"GroupList"}
+
+    def test_benchmark__existing_district(self, tmp_path: Path) -> None:
+        DistrictFactory()
+
+        with pytest.raises(CommandError, match="There is already a district in the database"):
+            call_command("benchmark_graphql", output=str(tmp_path / "results.json"), stdout=StringIO())
+
+
+class TestGetPercentile:
+    @pytest.mark.parametrize(
+        ("percentile", "expected"),
+        [(1, 1.0), (50, 5.0), (90, 9.0), (99, 10.0), (100, 10.0)],
+    )
+    def test_get_percentile(self, percentile: float, expected: float) -> None:
+        assert get_percentile([float(value) for value in range(10, 0, -1)], percentile) == expected
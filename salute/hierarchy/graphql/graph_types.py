@@ -9,18 +9,22 @@ from typing import TYPE_CHECKING, Annotated
 
 import strawberry as sb
 import strawberry_django as sd
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.db.models import Case, Count, OrderBy, QuerySet, Value, When
+from django.db.models import Case, Count, OrderBy, Prefetch, QuerySet, Value, When
 from strawberry import auto
 from strawberry_django.permissions import HasPerm
 
 from salute.hierarchy import models
 from salute.hierarchy.constants import SECTION_TYPE_INFO, SectionOperatingCategory, SectionType, Weekday
 from salute.integrations.osm.graphql.graph_types import HeadcountAggregationPeriod, HeadcountDataPoint
+from salute.integrations.waiting_list.demand import get_postcode_area_demand
+from salute.integrations.waiting_list.graphql.graph_types import WaitingListPostcodeAreaDemand
 from salute.mailing_groups import models as mailing_groups_models
-from salute.people.models import Person
-from salute.roles.models import Role
+from salute.roles import models as roles_models
+from salute.stats.graphql.graphql_types import CensusYearTrend, SummaryDataPoint
 from salute.stats.graphql.graphql_types import SectionCensusReturn as SectionCensusReturnType
+from salute.stats.graphql.resolvers import resolve_census_trends, summary_history_field
 
 from .graph_filters import GroupFilter, SectionFilter
 
@@ -29,6 +33,8 @@ if TYPE_CHECKING:
     from salute.mailing_groups.graphql.graph_types import SystemMailingGroup
     from salute.roles.graphql.graph_types import DistrictTeam, GroupTeam, SectionTeam
 
+LEADERSHIP_TEAM_TYPE_TSA_ID = "c30f4d78-a1f8-ed11-8f6d-6045bdd0ed08"
+
 
 @sb.interface
 class Unit:
@@ -60,9 +66,11 @@ class District(Unit, sb.relay.Node):
 
     @sd.field(
         description="Count of all people in this district, including in groups",
+        only=["pk"],
     )
-    def total_people_count(
+    async def total_people_count(
         self,
+        info: sb.Info,
         *,
         is_member: bool | None = sb.UNSET,
         is_included_in_census: bool | None = sb.UNSET,
@@ -72,26 +80,24 @@ class District(Unit, sb.relay.Node):
 
         Assumes only one district in the database.
         """
-        qs = Person.objects.all()
-
-        if is_member is not sb.UNSET:
-            qs = qs.annotate_is_member().filter(is_member=is_member)
-
-        if is_included_in_census is not sb.UNSET:
-            qs = qs.annotate_is_included_in_census().filter(is_included_in_census=is_included_in_census)
-
-        return qs.count()
+        statistics = await info.context.stats_dataloaders["statistics_for_districts"].load(self.pk)  # type: ignore[attr-defined]
+        return statistics.count_people(
+            is_member=None if is_member is sb.UNSET else is_member,
+            is_included_in_census=None if is_included_in_census is sb.UNSET else is_included_in_census,
+        )
 
     @sd.field(
         description="Count of all people in this district, including in groups",
+        only=["pk"],
     )
-    def total_roles_count(self) -> int:
+    async def total_roles_count(self, info: sb.Info) -> int:
         """
         Count of all roles in this district, including in groups.
 
         Assumes only one district in the database.
         """
-        return Role.objects.count()
+        statistics = await info.context.stats_dataloaders["statistics_for_districts"].load(self.pk)  # type: ignore[attr-defined]
+        return statistics.total_roles_count
 
     @sd.field(
         description="Count of all sections in this district, including both direct district sections and sections in groups within the district",  # noqa: E501
@@ -159,18 +165,7 @@ class District(Unit, sb.relay.Node):
         - Young people (from OSM data)
         - Unique people with youth member roles (is_youth_member=True roles)
         """
-        from asgiref.sync import sync_to_async
-
-        # Count adult members (distinct people with is_member_role=True roles)
-        def _count_adult_members() -> int:
-            return Person.objects.annotate_is_included_in_census().filter(is_included_in_census=True).count()
-
-        # Count unique people with youth member roles (is_youth_member=True)
-        def _count_youth_members() -> int:
-            return Person.objects.annotate_is_youth_member().filter(is_youth_member=True).count()
-
-        adult_member_count = await sync_to_async(_count_adult_members)()
-        youth_member_count = await sync_to_async(_count_youth_members)()
+        statistics = await info.context.stats_dataloaders["statistics_for_districts"].load(self.pk)  # type: ignore[attr-defined]
         young_person_count_result = await info.context.osm_dataloaders["total_young_person_count_for_district"].load(
             (self.pk, True)  # type: ignore[attr-defined]
         )
@@ -178,7 +173,11 @@ class District(Unit, sb.relay.Node):
         if young_person_count_result is None:
             return None
 
-        return adult_member_count + young_person_count_result + youth_member_count
+        return (
+            statistics.count_people(is_included_in_census=True)
+            + young_person_count_result
+            + statistics.youth_member_count
+        )
 
     @sd.field(
         description="The total waiting list count for the district.",
@@ -187,6 +186,53 @@ class District(Unit, sb.relay.Node):
     async def total_waiting_list_count(self, info: sb.Info) -> int | None:
         return await info.context.waiting_list_dataloaders["total_waiting_list_count_for_districts"].load(self.pk)  # type: ignore[attr-defined]
 
+    @sd.field(
+        description="The number of people on the waiting list in each postcode area, by target section.",
+        only=["pk"],
+        extensions=[
+            HasPerm(
+                "district.view_waiting_list_demand",
+                message="You don't have permission to view the waiting list demand for this district.",
+                fail_silently=True,
+            )
+        ],
+    )
+    async def waiting_list_demand(self) -> list[WaitingListPostcodeAreaDemand]:
+        demand = await sync_to_async(get_postcode_area_demand)()
+        return [
+            WaitingListPostcodeAreaDemand(
+                outward_code=area.outward_code,
+                target_section=area.target_section,
+                waiting_list_count=area.waiting_list_count,
+            )
+            for area in demand
+        ]
+
+    @sd.field(
+        description=(
+            "Census totals for the district and its groups for each year with returns, "
+            "with changes from the previous year and group rankings."
+        ),
+        only=["pk"],
+        extensions=[
+            HasPerm(
+                "district.view_census_trends",
+                message="You don't have permission to view the census trends for this district.",
+                fail_silently=True,
+            )
+        ],
+    )
+    async def census_trends(
+        self, info: sb.Info, *, start_year: int | None = sb.UNSET, end_year: int | None = sb.UNSET
+    ) -> list[CensusYearTrend]:
+        return await resolve_census_trends(
+            self.pk,  # type: ignore[attr-defined]
+            start_year=None if start_year is sb.UNSET else start_year,
+            end_year=None if end_year is sb.UNSET else end_year,
+        )
+
+    summary_history: list[SummaryDataPoint] = summary_history_field("district", with_sub_units=True)
+
 
 @sd.order_type(models.Group)
 class GroupOrder:
@@ -234,17 +280,33 @@ class Group(Unit, sb.relay.Node):
     @sd.field(
         description="The system mailing groups that are important for this group. Only returns fully configured mailing groups.",  # noqa: E501
         deprecation_reason="Use system_mailing_groups with a filter instead.",
+        prefetch_related=[
+            Prefetch(
+                "teams",
+                queryset=roles_models.Team.objects.filter(team_type__tsa_id=LEADERSHIP_TEAM_TYPE_TSA_ID)
+                .order_by("pk")
+                .prefetch_related(
+                    Prefetch(
+                        "system_mailing_groups",
+                        queryset=mailing_groups_models.SystemMailingGroup.objects.filter(
+                            workspace_group__isnull=False
+                        ).order_by("name"),
+                        to_attr="configured_system_mailing_groups",
+                    )
+                ),
+                to_attr="leadership_teams",
+            )
+        ],
     )
     def system_mailing_groups(
         self,
     ) -> list[Annotated[SystemMailingGroup, sb.lazy("salute.mailing_groups.graphql.graph_types")]]:
-        leadership_team = self.teams.filter(team_type__tsa_id="c30f4d78-a1f8-ed11-8f6d-6045bdd0ed08").first()  # type: ignore[attr-defined]
+        # A group should only have one leadership team
+        leadership_team = next(iter(self.leadership_teams), None)  # type: ignore[attr-defined]
         if leadership_team is None:
             return []
 
-        return mailing_groups_models.SystemMailingGroup.objects.filter(
-            teams=leadership_team, workspace_group__isnull=False
-        ).order_by("name")  # type: ignore[return-value]
+        return leadership_team.configured_system_mailing_groups
 
     @sd.field(
         description="The total waiting list count for the group.",
@@ -253,6 +315,8 @@ class Group(Unit, sb.relay.Node):
     async def total_waiting_list_count(self, info: sb.Info) -> int | None:
         return await info.context.waiting_list_dataloaders["total_waiting_list_count_for_groups"].load(self.pk)  # type: ignore[attr-defined]
 
+    summary_history: list[SummaryDataPoint] = summary_history_field("group", with_sub_units=True)
+
 
 @sb.type
 class TimeRange:
@@ -299,7 +363,15 @@ class SectionOrder:
 class Section(Unit, sb.relay.Node):
     display_name: str = sd.field(
         description="Formatted name for the unit",
-        only=["usual_weekday", "section_type", "nickname"],
+        # The group and district fields are listed, so that they aren't deferred when another field
+        # selects related fields from the group (e.g. site)
+        only=[
+            "usual_weekday",
+            "section_type",
+            "nickname",
+            "group__local_unit_number",
+            "district__unit_name",
+        ],
         select_related=["group", "district"],
     )
     section_type: sb.Private[models.SectionType]
@@ -316,13 +388,12 @@ class Section(Unit, sb.relay.Node):
 
     @sd.field(
         description="Get the site for the section",
-        select_related=["site"],
+        select_related=["site", "group__primary_site"],
     )
     def site(self, info: sb.Info) -> Annotated[Site, sb.lazy("salute.locations.graphql.graph_types")] | None:
         if self.site is not None:
             return self.site
 
-        # TODO: Optimise this query
         if self.group is not None:  # type: ignore[attr-defined]
             return self.group.primary_site  # type: ignore[attr-defined]
 
@@ -331,12 +402,19 @@ class Section(Unit, sb.relay.Node):
 
     @sd.field(
         description="Get the team for the section",
-        prefetch_related=["teams"],
+        prefetch_related=[
+            Prefetch(
+                "teams",
+                queryset=roles_models.Team.objects.select_related(
+                    "team_type", "section__group", "section__district"
+                ).order_by("pk"),
+            )
+        ],
         extensions=[HasPerm("team.list", message="You don't have permission to view teams.")],
     )
     def team(self, info: sb.Info) -> Annotated[SectionTeam, sb.lazy("salute.roles.graphql.graph_types")]:
-        # A section should only have one team.
-        return self.teams.first()  # type: ignore[attr-defined]
+        # A section should only have one team. all() uses the prefetched teams, where first() would query again.
+        return next(iter(self.teams.all()), None)  # type: ignore[attr-defined, arg-type]
 
     @sd.field
     def section_type_info(self) -> SectionTypeInfo:
@@ -398,6 +476,8 @@ class Section(Unit, sb.relay.Node):
             period: Aggregation period (week, month, or year). Defaults to week.
             start_date: Optional start date to filter results (inclusive).
             end_date: Optional end date to filter results (inclusive).
+
+        Periods that overlap the start or end date are included in full.
         """
         # Convert UNSET to None for the dataloader
         start = None if start_date is sb.UNSET else start_date
@@ -452,6 +532,8 @@ class Section(Unit, sb.relay.Node):
     async def total_waiting_list_count(self, info: sb.Info) -> int | None:
         return await info.context.waiting_list_dataloaders["total_waiting_list_count_for_sections"].load(self.pk)  # type: ignore[attr-defined]
 
+    summary_history: list[SummaryDataPoint] = summary_history_field("section")
+
 
 @sd.type(
     models.Section,
@@ -1,11 +1,16 @@
 import pytest
+from django.core.cache import cache
 from django.urls import reverse
 from strawberry_django.test.client import Response, TestClient
 
 from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
 from salute.hierarchy.factories import DistrictFactory, DistrictSectionFactory, GroupFactory, GroupSectionFactory
 from salute.integrations.osm.factories import OSMSectionHeadcountRecordFactory
+from salute.integrations.osm.headcounts import update_latest_headcounts
+from salute.integrations.waiting_list.models import WaitingListPostcodeAreaRecord
+from salute.people.models import Person
 from salute.roles.factories import DistrictTeamFactory, RoleFactory
+from salute.stats.models import SectionCensusReturn
 
 
 @pytest.mark.django_db
@@ -106,6 +111,7 @@ class TestDistrictQuery:
         }
 
     def test_query__summary_stats(self, user_with_person: User) -> None:
+        cache.clear()
         district = DistrictFactory()
 
         GroupSectionFactory.create_batch(size=5, group__district=district)
@@ -139,6 +145,45 @@ class TestDistrictQuery:
             }
         }
 
+    def test_query__member_counts(self, user_with_person: User) -> None:
+        cache.clear()
+        district = DistrictFactory()
+        section = DistrictSectionFactory(district=district)
+        OSMSectionHeadcountRecordFactory(section=section, young_person_count=10)
+        update_latest_headcounts()
+        RoleFactory.create_batch(
+            size=3, team__district=district, role_type__is_member_role=True, role_type__included_in_census=True
+        )
+        RoleFactory.create_batch(size=2, team__district=district, role_type__is_youth_member=True)
+        Person.objects.update_role_flags()
+
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            results = client.query(
+                """
+                {
+                    district {
+                        totalPeopleCount
+                        members: totalPeopleCount(isMember: true)
+                        censusMembers: totalPeopleCount(isIncludedInCensus: true)
+                        totalMemberCount
+                    }
+                }
+                """
+            )
+
+        assert isinstance(results, Response)
+
+        assert results.errors is None
+        assert results.data == {
+            "district": {
+                "totalPeopleCount": 6,
+                "members": 3,
+                "censusMembers": 3,
+                "totalMemberCount": 15,
+            }
+        }
+
 
 @pytest.mark.django_db
 class TestDistrictTSADetailsLinkQuery:
@@ -235,6 +280,8 @@ class TestDistrictYoungPersonCountQuery:
         sections = DistrictSectionFactory.create_batch(size=5, district=district)
         for section in sections:
             OSMSectionHeadcountRecordFactory(section=section, young_person_count=10)
+        update_latest_headcounts()
+
         client = TestClient(self.url)
         with client.login(user_with_person):
             result = client.query(self.QUERY)
@@ -253,6 +300,8 @@ class TestDistrictYoungPersonCountQuery:
         sections = GroupSectionFactory.create_batch(size=5, group__district=district)
         for section in sections:
             OSMSectionHeadcountRecordFactory(section=section, young_person_count=10)
+        update_latest_headcounts()
+
         client = TestClient(self.url)
         with client.login(user_with_person):
             result = client.query(self.QUERY)
@@ -530,3 +579,125 @@ class TestDistrictJoinTeamsQuery:
                 "teams": [{"displayName": t.display_name} for t in sorted(teams, key=lambda t: t.team_type.name)],
             }
         }
+
+
+@pytest.mark.django_db
+class TestDistrictCensusTrendsQuery:
+    url = reverse("graphql")
+
+    QUERY = """
+    query {
+        district {
+            censusTrends(startYear: 2021) {
+                year
+                district {
+                    sectionCount
+                    totalYoungPeople
+                    youngPeopleChange
+                }
+                groups {
+                    group {
+                        shortcode
+                    }
+                    youngPeopleRank
+                    totalYoungPeople
+                }
+            }
+        }
+    }
+    """
+
+    def test_query_census_trends__no_permission(self, user_with_person: User) -> None:
+        DistrictFactory()
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+
+        assert result.errors is None
+        assert result.data == {"district": {"censusTrends": []}}
+
+    def test_query_census_trends(self, user_with_person: User) -> None:
+        district = DistrictFactory()
+        DistrictUserRole.objects.create(user=user_with_person, district=district, level=DistrictUserRoleType.MANAGER)
+        section1 = GroupSectionFactory(group__district=district)
+        section2 = GroupSectionFactory(group__district=district)
+        SectionCensusReturn.objects.create(section=section1, year=2020, data={"y_8_m": "4"})
+        SectionCensusReturn.objects.create(section=section1, year=2021, data={"y_8_m": "6"})
+        SectionCensusReturn.objects.create(section=section2, year=2021, data={"y_8_m": "8"})
+
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+
+        assert result.errors is None
+        assert result.data == {
+            "district": {
+                "censusTrends": [
+                    {
+                        "year": 2021,
+                        "district": {"sectionCount": 2, "totalYoungPeople": 14, "youngPeopleChange": 10},
+                        "groups": [
+                            {
+                                "group": {"shortcode": section2.group.shortcode},
+                                "youngPeopleRank": 1,
+                                "totalYoungPeople": 8,
+                            },
+                            {
+                                "group": {"shortcode": section1.group.shortcode},
+                                "youngPeopleRank": 2,
+                                "totalYoungPeople": 6,
+                            },
+                        ],
+                    }
+                ]
+            }
+        }
+
+
+@pytest.mark.django_db
+class TestDistrictWaitingListDemandQuery:
+    url = reverse("graphql")
+
+    QUERY = """
+    query {
+        district {
+            waitingListDemand {
+                outwardCode
+                targetSection
+                waitingListCount
+            }
+        }
+    }
+    """
+
+    def test_query_waiting_list_demand__no_permission(self, user_with_person: User) -> None:
+        DistrictFactory()
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+
+        assert result.errors is None
+        assert result.data == {"district": {"waitingListDemand": []}}
+
+    def test_query_waiting_list_demand(self, user_with_person: User) -> None:
+        cache.clear()
+        district = DistrictFactory()
+        DistrictUserRole.objects.create(user=user_with_person, district=district, level=DistrictUserRoleType.MANAGER)
+        WaitingListPostcodeAreaRecord.objects.create(outward_code="SO17", target_section="CUBS", waiting_list_count=3)
+
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+
+        assert result.errors is None
+        assert result.data == {
+            "district": {"waitingListDemand": [{"outwardCode": "SO17", "targetSection": "CUBS", "waitingListCount": 3}]}
+        }
@@ -1,4 +1,7 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from strawberry.relay import to_base64
 from strawberry_django.test.client import Response, TestClient
@@ -6,6 +9,13 @@ from strawberry_django.test.client import Response, TestClient
 from salute.accounts.models import User
 from salute.hierarchy.constants import GroupType
 from salute.hierarchy.factories import DistrictFactory, GroupFactory, GroupSectionFactory
+from salute.hierarchy.graphql.graph_types import LEADERSHIP_TEAM_TYPE_TSA_ID
+from salute.hierarchy.models import District
+from salute.integrations.workspace.factories import WorkspaceGroupFactory
+from salute.mailing_groups.factories import SystemMailingGroupFactory
+from salute.mailing_groups.models import SystemMailingGroup
+from salute.roles.factories import GroupTeamFactory, TeamTypeFactory
+from salute.roles.models import TeamType
 
 
 @pytest.mark.django_db
@@ -355,3 +365,63 @@ class TestGroupJoinSectionsQuery:
                 "totalCount": 1,
             }
         }
+
+
+@pytest.mark.django_db
+class TestGroupSystemMailingGroupsQuery:
+    url = reverse("graphql")
+
+    QUERY = """
+    query {
+        groups {
+            edges {
+                node {
+                    systemMailingGroups {
+                        displayName
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    def _query(self, user: User) -> tuple[Response, int]:
+        # Responses are cached, so the query would not run again for the same user
+        cache.clear()
+        client = TestClient(self.url)
+        with client.login(user), CaptureQueriesContext(connection) as context:
+            result = client.query(self.QUERY, assert_no_errors=False)
+
+        assert isinstance(result, Response)
+        assert result.errors is None
+        return result, len(context.captured_queries)
+
+    def _create_group(self, district: District, leadership_team_type: TeamType) -> SystemMailingGroup:
+        team = GroupTeamFactory(group__district=district, team_type=leadership_team_type)
+        mailing_group = SystemMailingGroupFactory(display_name="Configured")
+        WorkspaceGroupFactory(system_mailing_group=mailing_group)
+        SystemMailingGroupFactory(display_name="Not configured").teams.add(team)
+        mailing_group.teams.add(team)
+        return mailing_group
+
+    def test_query(self, user_with_person: User) -> None:
+        district = DistrictFactory()
+        self._create_group(district, TeamTypeFactory(tsa_id=LEADERSHIP_TEAM_TYPE_TSA_ID))
+        GroupFactory(district=district)
+
+        result, _ = self._query(user_with_person)
+
+        assert sorted(result.data["groups"]["edges"], key=lambda edge: len(edge["node"]["systemMailingGroups"])) == [  # type: ignore[index]
+            {"node": {"systemMailingGroups": []}},
+            {"node": {"systemMailingGroups": [{"displayName": "Configured"}]}},
+        ]
+
+    def test_query_count_does_not_depend_on_group_count(self, user_with_person: User) -> None:
+        district = DistrictFactory()
+        leadership_team_type = TeamTypeFactory(tsa_id=LEADERSHIP_TEAM_TYPE_TSA_ID)
+        self._create_group(district, leadership_team_type)
+        _, query_count = self._query(user_with_person)
+
+        for _ in range(3):
+            self._create_group(district, leadership_team_type)
+        assert self._query(user_with_person)[1] == query_count
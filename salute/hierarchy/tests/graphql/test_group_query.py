@@ -1,3 +1,4 @@
+import datetime
 from uuid import UUID
 
 import pytest
@@ -7,8 +8,12 @@ from strawberry_django.test.client import Response, TestClient
 
 from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
 from salute.hierarchy.factories import DistrictFactory, GroupFactory, GroupSectionFactory
+from salute.hierarchy.models import Group
 from salute.integrations.osm.factories import OSMSectionHeadcountRecordFactory
-from salute.roles.factories import GroupTeamFactory
+from salute.integrations.osm.headcounts import update_latest_headcounts
+from salute.roles.factories import GroupTeamFactory, RoleTypeFactory
+from salute.roles.models import RoleType
+from salute.stats.models import GroupSummaryRecord
 
 
 @pytest.mark.django_db
@@ -180,6 +185,7 @@ class TestGroupYoungPersonCountQuery:
         sections = GroupSectionFactory.create_batch(size=5, group=group)
         for section in sections:
             OSMSectionHeadcountRecordFactory(section=section, young_person_count=10)
+        update_latest_headcounts()
 
         group_id = to_base64("Group", group.id)
         client = TestClient(self.url)
@@ -365,3 +371,118 @@ class TestGroupJoinTeamsQuery:
                 "teams": [{"displayName": t.display_name} for t in sorted(teams, key=lambda t: t.team_type.name)],
             }
         }
+
+
+@pytest.mark.django_db
+class TestGroupSummaryHistoryQuery:
+    url = reverse("graphql")
+
+    QUERY = """
+    query getGroupSummaryHistory($groupId: ID!, $roleTypes: [ID!]) {
+        group(groupId: $groupId) {
+            summaryHistory(period: MONTH, roleTypes: $roleTypes, includeSubUnits: true) {
+                periodStart
+                recordDate
+                totalPeople
+                roleTypeCounts {
+                    roleTypeId
+                    count
+                }
+            }
+        }
+    }
+    """
+
+    def _create_record(self, group: Group, day: datetime.date, count: int, role_type: RoleType) -> None:
+        GroupSummaryRecord.objects.create(
+            group=group,
+            date=day,
+            total_people=count,
+            count_by_role_type={},
+            count_by_role_status={},
+            count_by_accreditation_type={},
+            total_people_with_sub_units=count + 1,
+            count_by_role_type_with_sub_units={str(role_type.id): count},
+            count_by_role_status_with_sub_units={},
+            count_by_accreditation_type_with_sub_units={},
+        )
+
+    def test_query_summary_history__no_permission(self, user_with_person: User) -> None:
+        group = GroupFactory()
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(self.QUERY, variables={"groupId": to_base64("Group", group.id)})  # type: ignore[dict-item]
+
+        assert isinstance(result, Response)
+
+        assert result.errors is None
+        assert result.data == {"group": {"summaryHistory": []}}
+
+    def test_query_summary_history(self, user_with_person: User) -> None:
+        district = DistrictFactory()
+        DistrictUserRole.objects.create(user=user_with_person, district=district, level=DistrictUserRoleType.MANAGER)
+        group = GroupFactory(district=district)
+        role_type = RoleTypeFactory()
+        role_type_id = to_base64("RoleType", role_type.id)
+        self._create_record(group, datetime.date(2025, 3, 1), 4, role_type)
+        self._create_record(group, datetime.date(2025, 3, 8), 5, role_type)
+
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(
+                self.QUERY,
+                variables={"groupId": to_base64("Group", group.id), "roleTypes": [role_type_id]},  # type: ignore[dict-item]
+            )
+
+        assert isinstance(result, Response)
+
+        assert result.errors is None
+        assert result.data == {
+            "group": {
+                "summaryHistory": [
+                    {
+                        "periodStart": "2025-03-01",
+                        "recordDate": "2025-03-08",
+                        "totalPeople": 6,
+                        "roleTypeCounts": [{"roleTypeId": role_type_id, "count": 5}],
+                    }
+                ]
+            }
+        }
+
+    @pytest.mark.parametrize(
+        ("role_type_id", "message"),
+        [
+            pytest.param(to_base64("Group", UUID(int=0)), "Expected a RoleType ID, got a Group ID.", id="wrong-type"),
+            pytest.param(
+                to_base64("RoleType", "not-a-uuid"),
+                f"Invalid RoleType ID: {to_base64('RoleType', 'not-a-uuid')}",
+                id="malformed",
+            ),
+        ],
+    )
+    def test_query_summary_history__invalid_role_type_id(
+        self, user_with_person: User, role_type_id: str, message: str
+    ) -> None:
+        district = DistrictFactory()
+        DistrictUserRole.objects.create(user=user_with_person, district=district, level=DistrictUserRoleType.MANAGER)
+        group = GroupFactory(district=district)
+
+        client = TestClient(self.url)
+        with client.login(user_with_person):
+            result = client.query(
+                self.QUERY,
+                variables={"groupId": to_base64("Group", group.id), "roleTypes": [role_type_id]},  # type: ignore[dict-item]
+                assert_no_errors=False,
+            )
+
+        assert isinstance(result, Response)
+
+        assert result.data is None
+        assert result.errors == [
+            {
+                "message": message,
+                "locations": [{"line": 4, "column": 13}],
+                "path": ["group", "summaryHistory"],
+            }
+        ]
@@ -1,12 +1,17 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from strawberry.relay import to_base64
 from strawberry_django.test.client import Response, TestClient
 
-from salute.accounts.models import User
+from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
 from salute.hierarchy.constants import DISTRICT_SECTION_TYPES, GROUP_SECTION_TYPES, SectionType, Weekday
 from salute.hierarchy.factories import DistrictFactory, DistrictSectionFactory, GroupSectionFactory
-from salute.hierarchy.models import Section
+from salute.hierarchy.models import District, Section
+from salute.locations.factories import SiteFactory
+from salute.roles.factories import GroupSectionTeamFactory
 
 
 @pytest.mark.django_db
@@ -522,3 +527,52 @@ class TestSectionListQuery:
                 ],
             }
         }
+
+
+@pytest.mark.django_db
+class TestSectionListQueryCount:
+    url = reverse("graphql")
+
+    QUERY = """
+    query {
+        sections {
+            edges {
+                node {
+                    displayName
+                    site {
+                        displayName
+                    }
+                    team {
+                        displayName
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    def _count_queries(self, user: User) -> int:
+        # Responses are cached, so the query would not run again for the same user
+        cache.clear()
+        client = TestClient(self.url)
+        with client.login(user), CaptureQueriesContext(connection) as context:
+            result = client.query(self.QUERY, assert_no_errors=False)
+
+        assert isinstance(result, Response)
+        assert result.errors is None
+        return len(context.captured_queries)
+
+    def _create_sections(self, district: District, count: int) -> None:
+        for _ in range(count):
+            section = GroupSectionFactory(group__district=district, group__primary_site=SiteFactory())
+            GroupSectionTeamFactory(section=section)
+
+    def test_query_count_does_not_depend_on_section_count(self, user_with_person: User) -> None:
+        district = DistrictFactory()
+        DistrictUserRole.objects.create(user=user_with_person, district=district, level=DistrictUserRoleType.MANAGER)
+
+        self._create_sections(district, 2)
+        query_count = self._count_queries(user_with_person)
+
+        self._create_sections(district, 5)
+        assert self._count_queries(user_with_person) == query_count
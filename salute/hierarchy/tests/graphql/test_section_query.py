@@ -9,6 +9,7 @@ from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
 from salute.hierarchy.constants import SectionType
 from salute.hierarchy.factories import DistrictFactory, DistrictSectionFactory, GroupSectionFactory
 from salute.integrations.osm.factories import OSMSectionHeadcountRecordFactory
+from salute.integrations.osm.headcounts import update_latest_headcounts
 from salute.roles.factories import GroupSectionTeamFactory
 
 
@@ -205,6 +206,7 @@ class TestSectionYoungPersonCountQuery:
         DistrictUserRole.objects.create(user=user_with_person, district=district, level=DistrictUserRoleType.MANAGER)
         section = GroupSectionFactory(group__district=district)
         OSMSectionHeadcountRecordFactory(section=section, young_person_count=10)
+        update_latest_headcounts()
         section_id = to_base64("DistrictOrGroupSection", section.id)
         client = TestClient(self.url)
         with client.login(user_with_person):
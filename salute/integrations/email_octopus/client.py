@@ -1,18 +1,23 @@
 import time
+from collections.abc import Iterator
 from typing import Any
 
 import requests
+from pydantic import BaseModel
 
 from .schemata import (
     BulkUpdateContactsRequest,
     Contact,
-    ContactsResponse,
+    ContactsPage,
     ContactStatus,
+    ContactSummary,
     CreateContactRequest,
     UpdateContactItem,
 )
 
 EO_BASE_URL = "https://api.emailoctopus.com"
+CONTACTS_PAGE_SIZE = 100
+ALL_CONTACT_STATUSES: tuple[ContactStatus, ...] = ("pending", "subscribed", "unsubscribed")
 
 
 class EmailOctopusClient:
@@ -72,57 +77,105 @@ class EmailOctopusClient:
         response.raise_for_status()
         return response
 
-    def get_all_contacts_for_status(self, list_id: str, *, status: ContactStatus = "subscribed") -> list[Contact]:
-        """Get all contacts from a list, handling pagination automatically.
+    def _iter_contact_pages[T: BaseModel](
+        self,
+        list_id: str,
+        *,
+        status: ContactStatus,
+        schema: type[T],
+    ) -> Iterator[list[T]]:
+        """Lazily fetch pages of contacts from a list, following the pagination cursor.
+
+        Each page is only requested once the previous page has been consumed.
 
         Args:
             list_id: The Email Octopus list ID
-            status: Optional status to filter contacts by
+            status: Status to filter contacts by
+            schema: The schema to validate each contact against
 
-        Returns:
-            A list of all validated Contact objects from the list
+        Yields:
+            A list of validated contacts for each page
 
         Raises:
             requests.exceptions.HTTPError: If the API request fails
             pydantic.ValidationError: If the API response is not valid
         """
-        contacts = []
+        url = f"/lists/{list_id}/contacts"
         starting_after = None
 
         while True:
-            url = f"/lists/{list_id}/contacts"
-            params: dict[str, Any] = {"limit": 100, "status": status}
+            params: dict[str, Any] = {"limit": CONTACTS_PAGE_SIZE, "status": status}
             if starting_after:
                 params["starting_after"] = starting_after
 
             response = self._request("GET", url, params=params)
-            response_data = response.json()
-
-            contacts_response = ContactsResponse.model_validate(response_data)
-            contacts.extend(contacts_response.data)
+            page = ContactsPage[schema].model_validate(response.json())  # type: ignore[valid-type]
+            yield page.data
 
-            next_page = contacts_response.paging.get("next", {})
+            next_page = page.paging.get("next") or {}
             starting_after = next_page.get("starting_after")
 
             if not starting_after:
                 break
 
-        return contacts
+    def iter_contacts_for_status(self, list_id: str, *, status: ContactStatus = "subscribed") -> Iterator[Contact]:
+        """Lazily iterate over the contacts in a list with a given status.
 
-    def get_all_contacts(self, list_id: str) -> list[Contact]:
-        """Get all contacts from a list, regardless of status.
+        Only a single page of contacts is held in memory at a time.
 
         Args:
             list_id: The Email Octopus list ID
-        Returns:
-            A list of all validated Contact objects from the list
+            status: Optional status to filter contacts by
+
+        Yields:
+            Validated Contact objects from the list
+
+        Raises:
+            requests.exceptions.HTTPError: If the API request fails
+            pydantic.ValidationError: If the API response is not valid
+        """
+        for page in self._iter_contact_pages(list_id, status=status, schema=Contact):
+            yield from page
+
+    def iter_contacts(self, list_id: str) -> Iterator[Contact]:
+        """Lazily iterate over all contacts in a list, regardless of status.
+
+        Args:
+            list_id: The Email Octopus list ID
+
+        Yields:
+            Validated Contact objects from the list
+        """
+        for status in ALL_CONTACT_STATUSES:
+            yield from self.iter_contacts_for_status(list_id, status=status)
+
+    def iter_contact_summaries(self, list_id: str) -> Iterator[ContactSummary]:
+        """Lazily iterate over the ID, email address and status of all contacts in a list.
+
+        This skips validating the custom fields and tags of each contact, so is cheaper than
+        iter_contacts when only those values are needed.
+
+        Args:
+            list_id: The Email Octopus list ID
+
+        Yields:
+            A ContactSummary for each contact in the list
+        """
+        for status in ALL_CONTACT_STATUSES:
+            for page in self._iter_contact_pages(list_id, status=status, schema=ContactSummary):
+                yield from page
+
+    def iter_contact_ids(self, list_id: str) -> Iterator[str]:
+        """Lazily iterate over the IDs of all contacts in a list, regardless of status.
+
+        Args:
+            list_id: The Email Octopus list ID
+
+        Yields:
+            The ID of each contact in the list
         """
-        all_contacts = []
-        all_statuses: list[ContactStatus] = ["pending", "subscribed", "unsubscribed"]
-        for status in all_statuses:
-            contacts_for_status = self.get_all_contacts_for_status(list_id, status=status)
-            all_contacts.extend(contacts_for_status)
-        return all_contacts
+        for summary in self.iter_contact_summaries(list_id):
+            yield summary.id
 
     def get_contact(self, list_id: str, contact_id: str) -> Contact:
         """Get a single contact by ID.
@@ -64,9 +64,7 @@ class Command(BaseCommand):
 
     def _get_people_to_sync(self) -> PersonQuerySet:
         """Get a list of people to sync."""
-        people_qs = cast(PersonQuerySet, Person.objects.all())
-        people_qs = people_qs.annotate_is_member()
-        return people_qs
+        return cast(PersonQuerySet, Person.objects.all())
 
     def get_deduplicated_people_by_email(self, people: PersonQuerySet) -> PersonQuerySet:
         """Deduplicate people by email address, keeping the person with the lowest UUID.
@@ -138,12 +136,19 @@ class Command(BaseCommand):
             return deleted_orphaned
 
     def _cleanup_unknown_eo_contacts(self, client: EmailOctopusClient, list_id: str, *, dry_run: bool) -> int:
-        eo_contacts = client.get_all_contacts(list_id)
-        eo_contact_ids = {str(contact.id) for contact in eo_contacts}
         db_contact_ids = {str(rec.contact_id) for rec in EmailOctopusContact.objects.all()}
 
+        # Stream the contact IDs from EO, so that we only ever hold IDs we know about or need to delete.
+        seen_db_contact_ids: set[str] = set()
+        contacts_in_eo_not_in_db: list[str] = []
+        for eo_contact_id in client.iter_contact_ids(list_id):
+            if eo_contact_id in db_contact_ids:
+                seen_db_contact_ids.add(eo_contact_id)
+            else:
+                contacts_in_eo_not_in_db.append(eo_contact_id)
+
         # Quickly double check the previous step
-        contacts_in_db_not_in_eo = db_contact_ids - eo_contact_ids
+        contacts_in_db_not_in_eo = db_contact_ids - seen_db_contact_ids
         if contacts_in_db_not_in_eo:
             self.stdout.write(
                 self.style.WARNING(
@@ -157,7 +162,6 @@ class Command(BaseCommand):
                 self.style.SUCCESS(f"Deleted {len(contacts_in_db_not_in_eo)} orphaned records from database")
             )
 
-        contacts_in_eo_not_in_db = eo_contact_ids - db_contact_ids
         if not contacts_in_eo_not_in_db:
             self.stdout.write("No unknown contacts to delete")
             return 0
@@ -195,7 +199,7 @@ class Command(BaseCommand):
 
         :returns: Set of person IDs that were added (or would be added in dry run)
         """
-        people_without_contacts = people.filter(email_octopus_contact__isnull=True).annotate_is_member()
+        people_without_contacts = people.filter(email_octopus_contact__isnull=True)
         if not people_without_contacts:
             self.stdout.write("No people missing in EO to add")
             return set()
@@ -262,7 +266,7 @@ class Command(BaseCommand):
                 f"MembershipNumber: '{contact.fields.membership_number}' → '{person.formatted_membership_number}'"
             )
 
-        expected_is_member = "Yes" if person.is_member else "No"  # type: ignore
+        expected_is_member = "Yes" if person.is_member else "No"
         if contact.fields.is_member != expected_is_member:
             differences.append(f"IsMember: '{contact.fields.is_member}' → '{expected_is_member}'")
 
@@ -294,7 +298,7 @@ class Command(BaseCommand):
     def _sync_existing_contacts(
         self, client: EmailOctopusClient, list_id: str, people: PersonQuerySet, *, dry_run: bool
     ) -> int:
-        people = people.select_related("email_octopus_contact").annotate_is_member()
+        people = people.select_related("email_octopus_contact")
 
         if people.filter(email_octopus_contact__isnull=True).exists():
             self.stdout.write(
@@ -303,20 +307,16 @@ class Command(BaseCommand):
                 )
             )
 
-        eo_contacts = client.get_all_contacts(list_id)
-        eo_contacts_by_id = {str(contact.id): contact for contact in eo_contacts}
+        people_by_contact_id = {
+            str(person.email_octopus_contact.contact_id): person
+            for person in people.filter(email_octopus_contact__isnull=False)
+        }
 
         bulk_update_data: list[UpdateContactItem] = []
 
-        for person in people.filter(email_octopus_contact__isnull=False):
-            contact = eo_contacts_by_id.get(str(person.email_octopus_contact.contact_id))
-
-            if not contact:
-                self.stdout.write(
-                    self.style.WARNING(
-                        f"  SKIP: {person.contact_email} - EO contact not found, should have been added in previous step"  # noqa: E501
-                    )
-                )
+        for contact in client.iter_contacts(list_id):
+            person = people_by_contact_id.pop(contact.id, None)
+            if person is None:
                 continue
 
             differences = self._compare_contact_to_person(contact, person)
@@ -348,6 +348,13 @@ class Command(BaseCommand):
 
             bulk_update_data.append(UpdateContactItem.model_validate(data))
 
+        for person in people_by_contact_id.values():
+            self.stdout.write(
+                self.style.WARNING(
+                    f"  SKIP: {person.contact_email} - EO contact not found, should have been added in previous step"  # noqa: E501
+                )
+            )
+
         if not bulk_update_data:
             self.stdout.write("  No contacts need updates")
         elif dry_run:
@@ -407,26 +414,28 @@ class Command(BaseCommand):
         )
 
         stepper.step_heading("Updating subscription status in Salute based on EO unsubscribes")
-        eo_contacts = client.get_all_contacts(list_id)
-        eo_contact_status_by_id = {str(contact.id): contact.status for contact in eo_contacts}
 
-        # Get all database records that have corresponding EO contacts
+        # Get all database records, so that they can be matched against the streamed EO contacts
+        db_contacts_by_id = {
+            str(db_contact.contact_id): db_contact
+            for db_contact in EmailOctopusContact.objects.select_related("person")
+        }
         db_contacts_to_update = []
-        status_updates_count = 0
+        eo_contact_count = 0
 
-        for db_contact in EmailOctopusContact.objects.all():
-            eo_status = eo_contact_status_by_id.get(str(db_contact.contact_id))
-            if eo_status is None:
-                # Contact not found in EO - this shouldn't happen after cleanup steps
+        for eo_contact in client.iter_contact_summaries(list_id):
+            eo_contact_count += 1
+            db_contact = db_contacts_by_id.get(eo_contact.id)
+            if db_contact is None:
+                # Contact not found in database - this shouldn't happen after cleanup steps
                 continue
 
-            if db_contact.status != eo_status:
-                db_contact.status = EmailOctopusStatus(eo_status)
-                db_contacts_to_update.append(db_contact)
-                status_updates_count += 1
+            if db_contact.status != eo_contact.status:
                 self.stdout.write(
-                    f"  UPDATE STATUS: {db_contact.person.display_name if db_contact.person else 'Unknown'} - {db_contact.status} → {eo_status}"  # noqa: E501
+                    f"  UPDATE STATUS: {db_contact.person.display_name if db_contact.person else 'Unknown'} - {db_contact.status} → {eo_contact.status}"  # noqa: E501
                 )  # noqa: E501
+                db_contact.status = EmailOctopusStatus(eo_contact.status)
+                db_contacts_to_update.append(db_contact)
 
         if db_contacts_to_update:
             if not is_dry_run:
@@ -457,5 +466,5 @@ class Command(BaseCommand):
         self.stdout.write(f"Total people in filter: {len(people)}")
 
         self.stdout.write(
-            f"Total contacts in Email Octopus (after sync): {len(eo_contacts) - deleted_unknown if not is_dry_run else 'N/A (dry run)'}"  # noqa: E501
+            f"Total contacts in Email Octopus (after sync): {eo_contact_count - deleted_unknown if not is_dry_run else 'N/A (dry run)'}"  # noqa: E501
         )
@@ -49,10 +49,18 @@ class Contact(BaseModel):
     last_updated_at: datetime | None = None
 
 
-class ContactsResponse(BaseModel):
-    """Schema for the Email Octopus contacts list response."""
+class ContactSummary(BaseModel):
+    """Projection of an Email Octopus contact, for when the fields and tags are not needed."""
 
-    data: list[Contact]
+    id: str
+    email_address: str
+    status: ContactStatus
+
+
+class ContactsPage[T: BaseModel](BaseModel):
+    """Schema for a single page of the Email Octopus contacts list response."""
+
+    data: list[T]
     paging: dict[str, Any]
 
 
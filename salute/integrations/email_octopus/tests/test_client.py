@@ -0,0 +1,92 @@
+from typing import Any
+from unittest.mock import Mock, patch
+
+from salute.integrations.email_octopus.client import EmailOctopusClient
+from salute.integrations.email_octopus.schemata import Contact, ContactSummary
+
+
+def _contact_data(contact_id: str, status: str = "subscribed") -> dict[str, Any]:
+    return {
+        "id": contact_id,
+        "email_address": f"{contact_id}@example.com",
+        "fields": {"FirstName": "Test"},
+        "tags": [],
+        "status": status,
+        "created_at": "2025-01-01T00:00:00+00:00",
+    }
+
+
+def _page_response(contact_ids: list[str], starting_after: str | None, status: str = "subscribed") -> Mock:
+    paging: dict[str, Any] = {"next": {"starting_after": starting_after}} if starting_after else {"next": None}
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.json.return_value = {"data": [_contact_data(cid, status) for cid in contact_ids], "paging": paging}
+    return response
+
+
+class TestEmailOctopusClientPaging:
+    def test_iter_contacts_for_status_is_lazy(self) -> None:
+        client = EmailOctopusClient("test-key")
+        responses = [_page_response(["a", "b"], "b"), _page_response(["c"], None)]
+
+        with patch.object(client.session, "request", side_effect=responses) as mock_request:
+            contacts = client.iter_contacts_for_status("list-id")
+            assert mock_request.call_count == 0
+
+            first = next(contacts)
+            assert isinstance(first, Contact)
+            assert first.id == "a"
+            assert mock_request.call_count == 1
+
+            assert [contact.id for contact in contacts] == ["b", "c"]
+            assert mock_request.call_count == 2
+
+        assert mock_request.call_args_list[0].kwargs["params"] == {"limit": 100, "status": "subscribed"}
+        assert mock_request.call_args_list[1].kwargs["params"] == {
+            "limit": 100,
+            "status": "subscribed",
+            "starting_after": "b",
+        }
+
+    def test_iter_contact_summaries(self) -> None:
+        client = EmailOctopusClient("test-key")
+        responses = [
+            _page_response(["a"], None, "pending"),
+            _page_response(["b"], None, "subscribed"),
+            _page_response(["c"], None, "unsubscribed"),
+        ]
+
+        with patch.object(client.session, "request", side_effect=responses):
+            summaries = list(client.iter_contact_summaries("list-id"))
+
+        assert summaries == [
+            ContactSummary(id="a", email_address="a@example.com", status="pending"),
+            ContactSummary(id="b", email_address="b@example.com", status="subscribed"),
+            ContactSummary(id="c", email_address="c@example.com", status="unsubscribed"),
+        ]
+
+    def test_iter_contact_ids(self) -> None:
+        client = EmailOctopusClient("test-key")
+        responses = [
+            _page_response(["a", "b"], "b", "pending"),
+            _page_response(["c"], None, "pending"),
+            _page_response([], None, "subscribed"),
+            _page_response(["d"], None, "unsubscribed"),
+        ]
+
+        with patch.object(client.session, "request", side_effect=responses):
+            assert list(client.iter_contact_ids("list-id")) == ["a", "b", "c", "d"]
+
+    def test_iter_contacts(self) -> None:
+        client = EmailOctopusClient("test-key")
+        responses = [
+            _page_response(["a"], None, "pending"),
+            _page_response(["b"], None, "subscribed"),
+            _page_response([], None, "unsubscribed"),
+        ]
+
+        with patch.object(client.session, "request", side_effect=responses):
+            contacts = list(client.iter_contacts("list-id"))
+
+        assert [contact.id for contact in contacts] == ["a", "b"]
@@ -1,7 +1,7 @@
 from django.contrib import admin
 
 from salute.core.admin import BaseModelAdminMixin
-from salute.integrations.osm.models import OSMSectionHeadcountRecord, OSMSyncLog
+from salute.integrations.osm.models import OSMSectionHeadcountRecord, OSMSectionLatestHeadcount, OSMSyncLog
 
 
 @admin.register(OSMSyncLog)
@@ -16,3 +16,10 @@ class OSMSectionHeadcountRecordAdmin(BaseModelAdminMixin, admin.ModelAdmin):
     list_display = ("section", "date", "young_person_count", "adult_count", "sync_log")
     list_filter = ("date", "section__group", "section__section_type")
     raw_id_fields = ("section", "sync_log")
+
+
+@admin.register(OSMSectionLatestHeadcount)
+class OSMSectionLatestHeadcountAdmin(BaseModelAdminMixin, admin.ModelAdmin):
+    list_display = ("section", "date", "young_person_count", "adult_count")
+    list_filter = ("date", "section__group", "section__section_type")
+    raw_id_fields = ("section",)
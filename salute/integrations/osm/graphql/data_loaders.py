@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import date
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
-from django.db.models import F, Max, Q, Sum
-from django.db.models.functions import TruncMonth, TruncWeek, TruncYear
+from django.db.models import Q, Sum
 from strawberry.dataloader import DataLoader
 
 from salute.integrations.osm.graphql.graph_types import HeadcountAggregationPeriod
-from salute.integrations.osm.models import OSMSectionHeadcountRecord
+from salute.integrations.osm.headcounts import get_period_start
+from salute.integrations.osm.models import (
+    HeadcountRollupPeriod,
+    OSMSectionHeadcountRecord,
+    OSMSectionHeadcountRollup,
+    OSMSectionLatestHeadcount,
+)
 
 
 async def load_total_young_person_count_for_district(keys: list[tuple[UUID, bool]]) -> list[int]:
@@ -37,23 +44,7 @@ async def load_total_young_person_count_for_district(keys: list[tuple[UUID, bool
             else:
                 section_filter = Q(section__district_id=district_id, section__group__isnull=True)
 
-            # Get the latest records for each section
-            latest_dates = (
-                OSMSectionHeadcountRecord.objects.filter(section_filter)
-                .values("section_id")
-                .annotate(latest_date=Max("date"))
-            )
-
-            # Get the total count using a join to the latest dates
-            result = (
-                OSMSectionHeadcountRecord.objects.filter(section_filter)
-                .filter(
-                    id__in=OSMSectionHeadcountRecord.objects.filter(
-                        section_id__in=latest_dates.values("section_id")
-                    ).filter(date__in=latest_dates.values("latest_date"))
-                )
-                .aggregate(total=Sum("young_person_count"))
-            )
+            result = OSMSectionLatestHeadcount.objects.filter(section_filter).aggregate(total=Sum("young_person_count"))
 
             results[(district_id, include_group_sections)] = result["total"] or 0
 
@@ -70,21 +61,8 @@ async def load_latest_young_person_count_for_groups(pks: list[UUID]) -> list[int
     """Load the latest young person count for each group."""
 
     def _get_group_counts(pks: list[UUID]) -> dict[UUID, int]:
-        # Get the latest records for each section
-        latest_dates = (
-            OSMSectionHeadcountRecord.objects.filter(section__group_id__in=pks)
-            .values("section_id")
-            .annotate(latest_date=Max("date"))
-        )
-
-        # Get the total count for each group using a join to the latest dates
         group_sums = (
-            OSMSectionHeadcountRecord.objects.filter(section__group_id__in=pks)
-            .filter(
-                id__in=OSMSectionHeadcountRecord.objects.filter(
-                    section_id__in=latest_dates.values("section_id")
-                ).filter(date__in=latest_dates.values("latest_date"))
-            )
+            OSMSectionLatestHeadcount.objects.filter(section__group_id__in=pks)
             .values("section__group_id")
             .annotate(total_count=Sum("young_person_count"))
             .values_list("section__group_id", "total_count")
@@ -101,24 +79,9 @@ async def load_latest_young_person_count_for_groups(pks: list[UUID]) -> list[int
 async def load_latest_young_person_count_for_sections(pks: list[UUID]) -> list[int | None]:
     """Load the latest young person count for each section."""
 
-    # Get the latest records using sync_to_async since distinct() is sync-only
     def _get_section_counts(pks: list[UUID]) -> dict[UUID, int]:
-        # Get the latest records for each section
-        latest_dates = (
-            OSMSectionHeadcountRecord.objects.filter(section_id__in=pks)
-            .values("section_id")
-            .annotate(latest_date=Max("date"))
-        )
-
-        # Get the latest count for each section
-        section_counts = (
-            OSMSectionHeadcountRecord.objects.filter(section_id__in=pks)
-            .filter(
-                id__in=OSMSectionHeadcountRecord.objects.filter(
-                    section_id__in=latest_dates.values("section_id")
-                ).filter(date__in=latest_dates.values("latest_date"))
-            )
-            .values_list("section_id", "young_person_count")
+        section_counts = OSMSectionLatestHeadcount.objects.filter(section_id__in=pks).values_list(
+            "section_id", "young_person_count"
         )
 
         return dict(section_counts)
@@ -137,60 +100,48 @@ def headcount_for_sections(
 ) -> dict[UUID, list[dict]]:
     """Load aggregated headcount data for multiple sections.
 
-    This is the actual query function that fetches and aggregates data from the database.
+    This is the actual query function that fetches data from the database.
     It's called by the DataLoader wrapper.
 
+    Weekly, monthly and yearly data is read from the pre-aggregated rollups. Any period that
+    overlaps the date range is included, using the maximum count over the whole period.
+
     Args:
         section_ids: List of section UUIDs to fetch data for
         start_date: Optional start date filter (inclusive)
         end_date: Optional end date filter (inclusive)
-        period: Aggregation period (week, month, or year)
+        period: Aggregation period (day, week, month, or year)
 
     Returns:
         Dictionary mapping section_id to list of data points
     """
-    # Build query with date filters applied at the database level
-    query = OSMSectionHeadcountRecord.objects.filter(section_id__in=section_ids)
+    data: Iterable[tuple[UUID, date, int]]
 
-    if start_date is not None:
-        query = query.filter(date__gte=start_date)
-    if end_date is not None:
-        query = query.filter(date__lte=end_date)
-
-    # Choose the appropriate truncation function based on period
-    # For DAY, we don't need truncation - just use the date directly
+    # For DAY, there is at most one record per day, so no aggregation is needed.
     if period == HeadcountAggregationPeriod.DAY:
-        aggregated_data = (
-            query.annotate(period_start=F("date"))
-            .values("section_id", "period_start")
-            .annotate(
-                young_person_count=Max("young_person_count"),
-            )
-            .order_by("section_id", "period_start")
-        )
+        query = OSMSectionHeadcountRecord.objects.filter(section_id__in=section_ids)
+        if start_date is not None:
+            query = query.filter(date__gte=start_date)
+        if end_date is not None:
+            query = query.filter(date__lte=end_date)
+
+        data = query.order_by("section_id", "date").values_list("section_id", "date", "young_person_count")
     else:
-        trunc_functions = {
-            HeadcountAggregationPeriod.WEEK: TruncWeek,
-            HeadcountAggregationPeriod.MONTH: TruncMonth,
-            HeadcountAggregationPeriod.YEAR: TruncYear,
-        }
-        trunc_func = trunc_functions[period]
-
-        # Aggregate at the database level
-        aggregated_data = (
-            query.annotate(period_start=trunc_func("date"))
-            .values("section_id", "period_start")
-            .annotate(
-                young_person_count=Max("young_person_count"),
-            )
-            .order_by("section_id", "period_start")
+        rollup_period = HeadcountRollupPeriod(period.value)
+        rollup_query = OSMSectionHeadcountRollup.objects.filter(section_id__in=section_ids, period=rollup_period)
+        if start_date is not None:
+            rollup_query = rollup_query.filter(period_start__gte=get_period_start(start_date, rollup_period))
+        if end_date is not None:
+            rollup_query = rollup_query.filter(period_start__lte=end_date)
+
+        data = rollup_query.order_by("section_id", "period_start").values_list(
+            "section_id", "period_start", "young_person_count"
         )
 
     # Group results by section_id
     results: dict[UUID, list[dict]] = {sid: [] for sid in section_ids}
-    for record in aggregated_data:
-        section_id = record.pop("section_id")
-        results[section_id].append(record)
+    for section_id, period_start, young_person_count in data:
+        results[section_id].append({"period_start": period_start, "young_person_count": young_person_count})
 
     return results
 
@@ -202,23 +153,32 @@ async def load_headcount_for_sections(
 
     Args:
         keys: List of tuples containing (section_id, start_date, end_date, period).
-            All keys in a batch are expected to have the same start_date, end_date, and period.
+            Keys in a batch may have different date ranges and periods, and are
+            loaded with one query per distinct (start_date, end_date, period).
 
     Returns:
         A list of lists, where each inner list contains dictionaries with
         period_start and young_person_count for that section.
     """
-    # Extract section IDs and parameters (all keys have the same date range and period)
-    section_ids = [key[0] for key in keys]
-    start_date = keys[0][1] if keys else None
-    end_date = keys[0][2] if keys else None
-    period = keys[0][3] if keys else HeadcountAggregationPeriod.WEEK
+    # Group the section IDs by the parameters they were requested with
+    section_ids_by_params: defaultdict[tuple[date | None, date | None, HeadcountAggregationPeriod], list[UUID]] = (
+        defaultdict(list)
+    )
+    for section_id, start_date, end_date, period in keys:
+        section_ids_by_params[(start_date, end_date, period)].append(section_id)
+
+    def _get_headcounts() -> dict[tuple[UUID, date | None, date | None, HeadcountAggregationPeriod], list[dict]]:
+        results = {}
+        for (start_date, end_date, period), section_ids in section_ids_by_params.items():
+            data_dict = headcount_for_sections(section_ids, start_date, end_date, period)
+            for section_id in section_ids:
+                results[(section_id, start_date, end_date, period)] = data_dict[section_id]
+        return results
 
-    # Call the actual query function
-    data_dict = await sync_to_async(lambda: headcount_for_sections(section_ids, start_date, end_date, period))()
+    data_by_key = await sync_to_async(_get_headcounts)()
 
     # Return results in the same order as input keys
-    return [data_dict[key[0]] for key in keys]
+    return [data_by_key[key] for key in keys]
 
 
 def create_osm_dataloaders() -> dict[str, DataLoader]:
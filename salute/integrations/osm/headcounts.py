@@ -0,0 +1,180 @@
+"""Maintenance of the tables derived from OSM section headcount records."""
+
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import date, timedelta
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.functions import TruncMonth, TruncWeek, TruncYear
+
+from salute.hierarchy.models import Section
+from salute.integrations.osm.models import (
+    HeadcountRollupPeriod,
+    OSMSectionHeadcountRecord,
+    OSMSectionHeadcountRollup,
+    OSMSectionLatestHeadcount,
+    OSMSyncLog,
+)
+from salute.integrations.osm.schemata import OSMCountsResponse, OSMSection
+
+ROLLUP_TRUNC_FUNCTIONS = {
+    HeadcountRollupPeriod.WEEK: TruncWeek,
+    HeadcountRollupPeriod.MONTH: TruncMonth,
+    HeadcountRollupPeriod.YEAR: TruncYear,
+}
+
+
+@dataclass
+class HeadcountIngestResult:
+    section_ids: list[UUID]
+    unmatched_sections: list[OSMSection]
+
+
+def get_period_start(day: date, period: HeadcountRollupPeriod) -> date:
+    """Get the start of the period containing a date, matching the database truncation functions."""
+    match period:
+        case HeadcountRollupPeriod.WEEK:
+            return day - timedelta(days=day.weekday())
+        case HeadcountRollupPeriod.MONTH:
+            return day.replace(day=1)
+        case HeadcountRollupPeriod.YEAR:
+            return day.replace(month=1, day=1)
+
+
+def ingest_headcounts(
+    response: OSMCountsResponse,
+    *,
+    day: date,
+    sync_log: OSMSyncLog | None,
+    replace_existing: bool = False,
+) -> HeadcountIngestResult:
+    """Write the headcount records for a day from an OSM counts response.
+
+    Sections are matched on their OSM ID, and all records are upserted in a single query.
+    The derived headcount tables are not updated.
+
+    Args:
+        response: The counts response from OSM
+        day: The date of the headcount records
+        sync_log: The sync log that the response was stored on
+        replace_existing: If True, remove any existing records for the day that are not in the response
+
+    Returns:
+        The IDs of the sections that records were written for, and any OSM sections that could not be matched.
+    """
+    osm_sections = list(response.iter_sections())
+    section_ids_by_osm_id = dict(
+        Section.objects.filter(osm_id__in=[osm_section.section_id for osm_section in osm_sections]).values_list(
+            "osm_id", "id"
+        )
+    )
+
+    # Key the records by section, as a section can only have one record per day
+    records: dict[UUID, OSMSectionHeadcountRecord] = {}
+    unmatched_sections = []
+    for osm_section in osm_sections:
+        section_id = section_ids_by_osm_id.get(osm_section.section_id)
+        if section_id is None:
+            unmatched_sections.append(osm_section)
+            continue
+
+        records[section_id] = OSMSectionHeadcountRecord(
+            section_id=section_id,
+            date=day,
+            young_person_count=osm_section.young_person_count,
+            adult_count=osm_section.adult_count or 0,
+            sync_log=sync_log,
+        )
+
+    with transaction.atomic():
+        if replace_existing:
+            OSMSectionHeadcountRecord.objects.filter(date=day).exclude(section_id__in=records.keys()).delete()
+
+        OSMSectionHeadcountRecord.objects.bulk_create(
+            records.values(),
+            update_conflicts=True,
+            unique_fields=["section", "date"],
+            update_fields=["young_person_count", "adult_count", "sync_log", "updated_at"],
+        )
+
+    return HeadcountIngestResult(section_ids=list(records.keys()), unmatched_sections=unmatched_sections)
+
+
+def update_latest_headcounts(section_ids: Collection[UUID] | None = None) -> None:
+    """Update the latest headcount for sections from their headcount records.
+
+    Args:
+        section_ids: The sections to update. If None, all sections are updated.
+    """
+    records = OSMSectionHeadcountRecord.objects.all()
+    latest_headcounts = OSMSectionLatestHeadcount.objects.all()
+    if section_ids is not None:
+        records = records.filter(section_id__in=section_ids)
+        latest_headcounts = latest_headcounts.filter(section_id__in=section_ids)
+
+    latest_records = records.latest_per_parent("section_id", "date").values(
+        "section_id", "date", "young_person_count", "adult_count"
+    )
+
+    with transaction.atomic():
+        OSMSectionLatestHeadcount.objects.bulk_create(
+            [OSMSectionLatestHeadcount(**record) for record in latest_records],
+            update_conflicts=True,
+            unique_fields=["section"],
+            update_fields=["date", "young_person_count", "adult_count", "updated_at"],
+        )
+
+        # Remove the latest headcount for any sections that no longer have records
+        latest_headcounts.exclude(section_id__in=records.values("section_id")).delete()
+
+
+def update_headcount_rollups(section_ids: Collection[UUID] | None = None, *, since: date | None = None) -> None:
+    """Update the weekly, monthly and yearly headcount rollups from the headcount records.
+
+    Rollups are only ever added or updated, so use rebuild_headcount_rollups if records have been removed.
+
+    Args:
+        section_ids: The sections to update. If None, all sections are updated.
+        since: Only update periods that end on or after this date. If None, all periods are updated.
+    """
+    records = OSMSectionHeadcountRecord.objects.all()
+    if section_ids is not None:
+        records = records.filter(section_id__in=section_ids)
+
+    with transaction.atomic():
+        for period, trunc_func in ROLLUP_TRUNC_FUNCTIONS.items():
+            period_records = records
+            if since is not None:
+                # Recalculate the whole of the period containing since, as its maximum may have changed
+                period_records = period_records.filter(date__gte=get_period_start(since, period))
+
+            aggregated_records = (
+                period_records.annotate(period_start=trunc_func("date"))
+                .values("section_id", "period_start")
+                .annotate(young_person_count=Max("young_person_count"))
+                .order_by()
+            )
+
+            OSMSectionHeadcountRollup.objects.bulk_create(
+                [OSMSectionHeadcountRollup(period=period, **record) for record in aggregated_records],
+                update_conflicts=True,
+                unique_fields=["section", "period", "period_start"],
+                update_fields=["young_person_count", "updated_at"],
+            )
+
+
+def rebuild_headcount_rollups(section_ids: Collection[UUID] | None = None) -> None:
+    """Rebuild the headcount rollups from scratch.
+
+    Args:
+        section_ids: The sections to rebuild. If None, all sections are rebuilt.
+    """
+    rollups = OSMSectionHeadcountRollup.objects.all()
+    if section_ids is not None:
+        rollups = rollups.filter(section_id__in=section_ids)
+
+    with transaction.atomic():
+        rollups.delete()
+        update_headcount_rollups(section_ids)
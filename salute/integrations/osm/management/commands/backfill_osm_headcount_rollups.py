@@ -0,0 +1,19 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from salute.core.data_epoch import bump_data_epoch
+from salute.integrations.osm.headcounts import rebuild_headcount_rollups, update_latest_headcounts
+from salute.integrations.osm.models import OSMSectionHeadcountRollup
+
+
+class Command(BaseCommand):
+    help = "Rebuild the latest headcounts and weekly, monthly and yearly headcount rollups from OSM headcount records"
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        update_latest_headcounts()
+        rebuild_headcount_rollups()
+        bump_data_epoch()
+
+        rollup_count = OSMSectionHeadcountRollup.objects.count()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rollup_count} headcount rollups"))
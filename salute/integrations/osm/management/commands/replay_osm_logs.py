@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from uuid import UUID
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+from pydantic import ValidationError
+from tqdm import tqdm
+
+from salute.core.data_epoch import bump_data_epoch
+from salute.integrations.osm.headcounts import (
+    HeadcountIngestResult,
+    ingest_headcounts,
+    rebuild_headcount_rollups,
+    update_latest_headcounts,
+)
+from salute.integrations.osm.models import OSMSyncLog
+from salute.integrations.osm.schemata import OSMCountsResponse
+
+
+class Command(BaseCommand):
+    help = "Rebuild OSM section headcount records from the data stored on the OSM sync logs"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of log days to replay in parallel (default: 4)",
+        )
+
+    def _replay_log(self, log_id: UUID) -> HeadcountIngestResult:
+        try:
+            log = OSMSyncLog.objects.get(id=log_id)
+            response = OSMCountsResponse.model_validate_sync_log_data(log.data)
+            return ingest_headcounts(response, day=log.date, sync_log=log, replace_existing=True)
+        finally:
+            # Each worker thread has its own database connection
+            connections.close_all()
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        workers = max(int(options["workers"]), 1)
+        log_ids = list(OSMSyncLog.objects.order_by("date").values_list("id", flat=True))
+        if not log_ids:
+            self.stdout.write(self.style.WARNING("No OSM sync logs found to replay."))
+            return
+
+        self.stdout.write(f"Replaying {len(log_ids)} OSM sync log(s) with {workers} worker(s)")
+
+        record_count = 0
+        error_count = 0
+        unmatched_osm_ids: set[str] = set()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {log_id: executor.submit(self._replay_log, log_id) for log_id in log_ids}
+            for log_id, future in tqdm(futures.items(), "Replaying logs"):
+                try:
+                    result = future.result()
+                except ValidationError as exc:
+                    error_count += 1
+                    self.stderr.write(self.style.ERROR(f"Invalid data on OSM sync log {log_id}: {exc}"))
+                    continue
+
+                record_count += len(result.section_ids)
+                for osm_section in result.unmatched_sections:
+                    if osm_section.section_id not in unmatched_osm_ids:
+                        unmatched_osm_ids.add(osm_section.section_id)
+                        self.stderr.write(
+                            self.style.ERROR(
+                                f'Section "{osm_section.name}" with OSM ID {osm_section.section_id} not found'
+                            )
+                        )
+
+        update_latest_headcounts()
+        rebuild_headcount_rollups()
+        bump_data_epoch()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Finished: records={record_count}, logs={len(log_ids)}, errors={error_count}")
+        )
@@ -1,13 +1,13 @@
 from typing import Any
 
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from salute.hierarchy.models import Section
+from salute.core.data_epoch import bump_data_epoch
 from salute.integrations.osm.client import OSMClient, get_access_token
-from salute.integrations.osm.models import OSMSectionHeadcountRecord, OSMSyncLog
+from salute.integrations.osm.headcounts import ingest_headcounts, update_headcount_rollups, update_latest_headcounts
+from salute.integrations.osm.models import OSMSyncLog
 
 
 class Command(BaseCommand):
@@ -30,24 +30,16 @@ class Command(BaseCommand):
         )
 
         # Update section headcount records
-        for osm_section in response.iter_sections():
-            try:
-                section = Section.objects.get(osm_id=osm_section.section_id)
-            except ObjectDoesNotExist:
-                self.stderr.write(
-                    self.style.ERROR(f'Section "{osm_section.name}" with OSM ID {osm_section.section_id} not found')
-                )
-                continue
-
-            OSMSectionHeadcountRecord.objects.update_or_create(
-                section_id=section.id,
-                date=today,
-                defaults={
-                    "young_person_count": osm_section.young_person_count,
-                    "adult_count": osm_section.adult_count or 0,
-                    "sync_log": log,
-                },
+        result = ingest_headcounts(response, day=today, sync_log=log)
+        for osm_section in result.unmatched_sections:
+            self.stderr.write(
+                self.style.ERROR(f'Section "{osm_section.name}" with OSM ID {osm_section.section_id} not found')
             )
 
+        update_latest_headcounts(result.section_ids)
+        update_headcount_rollups(result.section_ids, since=today)
+
         log.success = True
         log.save()
+
+        bump_data_epoch()
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:46
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def populate_latest_headcounts(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    OSMSectionHeadcountRecord = apps.get_model("osm", "OSMSectionHeadcountRecord")
+    OSMSectionLatestHeadcount = apps.get_model("osm", "OSMSectionLatestHeadcount")
+
+    latest_records = (
+        OSMSectionHeadcountRecord.objects.order_by("section_id", "-date")
+        .distinct("section_id")
+        .values("section_id", "date", "young_person_count", "adult_count")
+    )
+    OSMSectionLatestHeadcount.objects.bulk_create(OSMSectionLatestHeadcount(**record) for record in latest_records)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hierarchy", "0006_add_osm_id_field"),
+        ("osm", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OSMSectionLatestHeadcount",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="Salute ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                ("young_person_count", models.IntegerField()),
+                ("adult_count", models.IntegerField()),
+                (
+                    "section",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="osm_latest_headcount",
+                        to="hierarchy.section",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "OSM section latest headcount",
+            },
+        ),
+        migrations.RunPython(
+            populate_latest_headcounts,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
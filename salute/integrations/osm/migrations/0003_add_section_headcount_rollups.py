@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 03:50
+
+import uuid
+
+import django.db.models.deletion
+import django_choices_field.fields
+from django.db import migrations, models
+
+import salute.integrations.osm.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hierarchy", "0006_add_osm_id_field"),
+        ("osm", "0002_add_section_latest_headcount"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OSMSectionHeadcountRollup",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="Salute ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "period",
+                    django_choices_field.fields.TextChoicesField(  # type: ignore[call-overload]
+                        choices=[("week", "Week"), ("month", "Month"), ("year", "Year")],
+                        choices_enum=salute.integrations.osm.models.HeadcountRollupPeriod,
+                        max_length=5,
+                    ),
+                ),
+                ("period_start", models.DateField()),
+                ("young_person_count", models.IntegerField()),
+                (
+                    "section",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="osm_headcount_rollups",
+                        to="hierarchy.section",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("period_start",),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("section", "period", "period_start"), name="unique_section_period_period_start"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hierarchy", "0006_add_osm_id_field"),
+        ("osm", "0003_add_section_headcount_rollups"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="osmsectionheadcountrecord",
+            index=models.Index(fields=["section", "-date"], name="idx_osm_headcount_latest"),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
+from django_choices_field import TextChoicesField
 
-from salute.core.models import BaseModel
+from salute.core.models import BaseModel, LatestPerParentManager
 from salute.hierarchy.models import Section
 
 
@@ -27,9 +28,65 @@ class OSMSectionHeadcountRecord(BaseModel):
     young_person_count = models.IntegerField()
     adult_count = models.IntegerField()
 
+    objects = LatestPerParentManager()
+
     class Meta:
         ordering = ("date",)
         constraints = [models.UniqueConstraint(fields=["section", "date"], name="unique_section_date")]
+        indexes = [models.Index(fields=["section", "-date"], name="idx_osm_headcount_latest")]
+
+    def __str__(self) -> str:
+        return f"{self.section.display_name} - {self.date} - {self.young_person_count}"
+
+
+class OSMSectionLatestHeadcount(BaseModel):
+    """
+    The most recent headcount for each section.
+
+    This is derived from OSMSectionHeadcountRecord and maintained by sync_osm,
+    so that the latest count can be read without searching the headcount history.
+    """
+
+    section = models.OneToOneField(Section, on_delete=models.CASCADE, related_name="osm_latest_headcount")
+    date = models.DateField()
+
+    young_person_count = models.IntegerField()
+    adult_count = models.IntegerField()
+
+    class Meta:
+        verbose_name = "OSM section latest headcount"
 
     def __str__(self) -> str:
         return f"{self.section.display_name} - {self.date} - {self.young_person_count}"
+
+
+class HeadcountRollupPeriod(models.TextChoices):
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+class OSMSectionHeadcountRollup(BaseModel):
+    """
+    The maximum headcount for a section over a week, month or year.
+
+    This is derived from OSMSectionHeadcountRecord and maintained by sync_osm,
+    so that headcount history does not need to be aggregated at query time.
+    """
+
+    section = models.ForeignKey(Section, on_delete=models.CASCADE, related_name="osm_headcount_rollups")
+    period = TextChoicesField(choices_enum=HeadcountRollupPeriod)
+    period_start = models.DateField()
+
+    young_person_count = models.IntegerField()
+
+    class Meta:
+        ordering = ("period_start",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["section", "period", "period_start"], name="unique_section_period_period_start"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.section.display_name} - {self.period} {self.period_start} - {self.young_person_count}"
@@ -41,3 +41,8 @@ class OSMCountsResponse(BaseModel):
         # Filter out any non-district keys (like 'categories')
         districts = {k: v for k, v in data.items() if k != "categories"}
         return cls(districts=districts)
+
+    @classmethod
+    def model_validate_sync_log_data(cls, data: dict) -> "OSMCountsResponse":
+        """Validate the data stored on an OSMSyncLog, which is dumped by field name rather than alias."""
+        return cls.model_validate(data, by_alias=True, by_name=True)
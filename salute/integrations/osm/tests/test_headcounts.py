@@ -0,0 +1,183 @@
+"""Tests for maintaining the tables derived from headcount records."""
+
+from datetime import date
+
+import pytest
+
+from salute.hierarchy.factories import GroupSectionFactory
+from salute.integrations.osm.factories import OSMSectionHeadcountRecordFactory
+from salute.integrations.osm.headcounts import (
+    get_period_start,
+    ingest_headcounts,
+    rebuild_headcount_rollups,
+    update_headcount_rollups,
+    update_latest_headcounts,
+)
+from salute.integrations.osm.models import (
+    HeadcountRollupPeriod,
+    OSMSectionHeadcountRecord,
+    OSMSectionHeadcountRollup,
+    OSMSectionLatestHeadcount,
+    OSMSyncLog,
+)
+from salute.integrations.osm.schemata import OSMCountsResponse
+
+
+@pytest.mark.django_db
+class TestUpdateLatestHeadcounts:
+    def test_uses_latest_record_for_each_section(self) -> None:
+        section1 = GroupSectionFactory()
+        section2 = GroupSectionFactory()
+
+        # The sections have different latest dates
+        OSMSectionHeadcountRecordFactory(section=section1, date=date(2024, 1, 1), young_person_count=10)
+        OSMSectionHeadcountRecordFactory(section=section1, date=date(2024, 1, 2), young_person_count=12)
+        OSMSectionHeadcountRecordFactory(section=section2, date=date(2024, 1, 1), young_person_count=20)
+
+        update_latest_headcounts()
+
+        latest = {lh.section_id: (lh.date, lh.young_person_count) for lh in OSMSectionLatestHeadcount.objects.all()}
+        assert latest == {
+            section1.id: (date(2024, 1, 2), 12),
+            section2.id: (date(2024, 1, 1), 20),
+        }
+
+    def test_only_updates_given_sections(self) -> None:
+        section1 = GroupSectionFactory()
+        section2 = GroupSectionFactory()
+        OSMSectionHeadcountRecordFactory(section=section1, date=date(2024, 1, 1), young_person_count=10)
+        OSMSectionHeadcountRecordFactory(section=section2, date=date(2024, 1, 1), young_person_count=20)
+        update_latest_headcounts()
+
+        OSMSectionHeadcountRecord.objects.update(young_person_count=30)
+        update_latest_headcounts([section1.id])
+
+        assert OSMSectionLatestHeadcount.objects.get(section=section1).young_person_count == 30
+        assert OSMSectionLatestHeadcount.objects.get(section=section2).young_person_count == 20
+
+    def test_removes_sections_without_records(self) -> None:
+        record = OSMSectionHeadcountRecordFactory()
+        update_latest_headcounts()
+        assert OSMSectionLatestHeadcount.objects.filter(section=record.section).exists()
+
+        record.delete()
+        update_latest_headcounts([record.section_id])
+
+        assert not OSMSectionLatestHeadcount.objects.exists()
+
+
+@pytest.mark.django_db
+class TestHeadcountRollups:
+    def test_rollups_use_maximum_for_each_period(self) -> None:
+        section = GroupSectionFactory()
+        # 2024-01-01 is a Monday
+        OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 1), young_person_count=10)
+        OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 3), young_person_count=14)
+        OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 8), young_person_count=12)
+
+        update_headcount_rollups()
+
+        rollups = {
+            (rollup.period, rollup.period_start): rollup.young_person_count
+            for rollup in OSMSectionHeadcountRollup.objects.filter(section=section)
+        }
+        assert rollups == {
+            (HeadcountRollupPeriod.WEEK, date(2024, 1, 1)): 14,
+            (HeadcountRollupPeriod.WEEK, date(2024, 1, 8)): 12,
+            (HeadcountRollupPeriod.MONTH, date(2024, 1, 1)): 14,
+            (HeadcountRollupPeriod.YEAR, date(2024, 1, 1)): 14,
+        }
+
+    def test_update_since_only_touches_later_periods(self) -> None:
+        section = GroupSectionFactory()
+        OSMSectionHeadcountRecordFactory(section=section, date=date(2023, 6, 1), young_person_count=10)
+        OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 6, 5), young_person_count=20)
+        update_headcount_rollups()
+
+        OSMSectionHeadcountRecord.objects.update(young_person_count=30)
+        update_headcount_rollups([section.id], since=date(2024, 6, 5))
+
+        rollups = OSMSectionHeadcountRollup.objects.filter(section=section, period=HeadcountRollupPeriod.YEAR)
+        assert {rollup.period_start.year: rollup.young_person_count for rollup in rollups} == {2023: 10, 2024: 30}
+
+    def test_rebuild_removes_stale_rollups(self) -> None:
+        record = OSMSectionHeadcountRecordFactory(date=date(2024, 1, 1))
+        OSMSectionHeadcountRecordFactory(section=record.section, date=date(2025, 1, 1))
+
+        record.delete()
+        rebuild_headcount_rollups()
+
+        assert set(OSMSectionHeadcountRollup.objects.values_list("period_start", flat=True)) == {
+            date(2024, 12, 30),  # Week containing 2025-01-01
+            date(2025, 1, 1),
+        }
+
+    @pytest.mark.parametrize(
+        ("period", "expected"),
+        [
+            (HeadcountRollupPeriod.WEEK, date(2024, 2, 12)),
+            (HeadcountRollupPeriod.MONTH, date(2024, 2, 1)),
+            (HeadcountRollupPeriod.YEAR, date(2024, 1, 1)),
+        ],
+    )
+    def test_get_period_start(self, period: HeadcountRollupPeriod, expected: date) -> None:
+        assert get_period_start(date(2024, 2, 15), period) == expected
+
+
+def _counts_response(*sections: tuple[str, int]) -> OSMCountsResponse:
+    return OSMCountsResponse.model_validate_api_response(
+        {
+            "district1": {
+                "byGroup": {
+                    "group1": {
+                        "sections": [
+                            {"sectionid": osm_id, "name": f"Section {osm_id}", "numscouts": count, "numleaders": None}
+                            for osm_id, count in sections
+                        ]
+                    }
+                }
+            }
+        }
+    )
+
+
+@pytest.mark.django_db
+class TestIngestHeadcounts:
+    def test_writes_records_for_matched_sections(self) -> None:
+        section1 = GroupSectionFactory(osm_id="1")
+        section2 = GroupSectionFactory(osm_id="2")
+        log = OSMSyncLog.objects.create(date=date(2024, 1, 1), data={}, success=False)
+
+        result = ingest_headcounts(
+            _counts_response(("1", 10), ("2", 20), ("3", 30)), day=date(2024, 1, 1), sync_log=log
+        )
+
+        assert set(result.section_ids) == {section1.id, section2.id}
+        assert [osm_section.section_id for osm_section in result.unmatched_sections] == ["3"]
+        assert set(
+            OSMSectionHeadcountRecord.objects.values_list("section_id", "date", "young_person_count", "adult_count")
+        ) == {
+            (section1.id, date(2024, 1, 1), 10, 0),
+            (section2.id, date(2024, 1, 1), 20, 0),
+        }
+
+    def test_updates_existing_records(self) -> None:
+        section = GroupSectionFactory(osm_id="1")
+        OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 1), young_person_count=5)
+
+        ingest_headcounts(_counts_response(("1", 10)), day=date(2024, 1, 1), sync_log=None)
+
+        assert list(OSMSectionHeadcountRecord.objects.values_list("young_person_count", flat=True)) == [10]
+
+    def test_replace_existing_removes_records_not_in_response(self) -> None:
+        section1 = GroupSectionFactory(osm_id="1")
+        section2 = GroupSectionFactory(osm_id=None)
+        OSMSectionHeadcountRecordFactory(section=section2, date=date(2024, 1, 1))
+        OSMSectionHeadcountRecordFactory(section=section2, date=date(2024, 1, 2))
+
+        ingest_headcounts(_counts_response(("1", 10)), day=date(2024, 1, 1), sync_log=None, replace_existing=True)
+
+        assert set(OSMSectionHeadcountRecord.objects.values_list("section_id", "date")) == {
+            (section1.id, date(2024, 1, 1)),
+            (section2.id, date(2024, 1, 2)),
+        }
@@ -102,3 +102,20 @@ def test_osm_counts_response_validation() -> None:
                 }
             }
         )
+
+
+def test_osm_counts_response_sync_log_data() -> None:
+    """Test that OSMCountsResponse can be validated from the data stored on a sync log."""
+    response = OSMCountsResponse.model_validate_api_response(
+        {
+            "district1": {
+                "byGroup": {
+                    "group1": {
+                        "sections": [{"sectionid": "123", "name": "Test Section", "numscouts": 10, "numleaders": 2}]
+                    }
+                }
+            }
+        }
+    )
+
+    assert OSMCountsResponse.model_validate_sync_log_data(response.model_dump()) == response
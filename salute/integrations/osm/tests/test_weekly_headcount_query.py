@@ -3,11 +3,13 @@
 from datetime import date, timedelta
 
 import pytest
+from asgiref.sync import async_to_sync
 
 from salute.hierarchy.factories import GroupSectionFactory
 from salute.integrations.osm.factories import OSMSectionHeadcountRecordFactory
-from salute.integrations.osm.graphql.data_loaders import headcount_for_sections
+from salute.integrations.osm.graphql.data_loaders import headcount_for_sections, load_headcount_for_sections
 from salute.integrations.osm.graphql.graph_types import HeadcountAggregationPeriod
+from salute.integrations.osm.headcounts import update_headcount_rollups
 
 
 @pytest.mark.django_db
@@ -21,6 +23,7 @@ class TestHeadcountForSections:
 
         OSMSectionHeadcountRecordFactory(section=section, date=base_date, young_person_count=20)
         OSMSectionHeadcountRecordFactory(section=section, date=base_date + timedelta(days=2), young_person_count=22)
+        update_headcount_rollups()
 
         result = headcount_for_sections(
             section_ids=[section.id],
@@ -41,6 +44,7 @@ class TestHeadcountForSections:
 
         OSMSectionHeadcountRecordFactory(section=section1, date=base_date, young_person_count=20)
         OSMSectionHeadcountRecordFactory(section=section2, date=base_date, young_person_count=30)
+        update_headcount_rollups()
 
         result = headcount_for_sections(
             section_ids=[section1.id, section2.id],
@@ -62,6 +66,7 @@ class TestHeadcountForSections:
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 15), young_person_count=20)
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 2, 15), young_person_count=25)
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 3, 15), young_person_count=22)
+        update_headcount_rollups()
 
         # Query only February
         result = headcount_for_sections(
@@ -130,6 +135,7 @@ class TestHeadcountForSections:
         OSMSectionHeadcountRecordFactory(section=section, date=monday, young_person_count=20)
         OSMSectionHeadcountRecordFactory(section=section, date=monday + timedelta(days=1), young_person_count=25)
         OSMSectionHeadcountRecordFactory(section=section, date=monday + timedelta(days=3), young_person_count=22)
+        update_headcount_rollups()
 
         result = headcount_for_sections(
             section_ids=[section.id],
@@ -150,6 +156,7 @@ class TestHeadcountForSections:
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 5), young_person_count=20)
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 1, 15), young_person_count=25)
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 2, 10), young_person_count=22)
+        update_headcount_rollups()
 
         result = headcount_for_sections(
             section_ids=[section.id],
@@ -171,6 +178,7 @@ class TestHeadcountForSections:
         OSMSectionHeadcountRecordFactory(section=section, date=date(2023, 6, 15), young_person_count=20)
         OSMSectionHeadcountRecordFactory(section=section, date=date(2023, 12, 10), young_person_count=25)
         OSMSectionHeadcountRecordFactory(section=section, date=date(2024, 3, 5), young_person_count=22)
+        update_headcount_rollups()
 
         result = headcount_for_sections(
             section_ids=[section.id],
@@ -183,3 +191,35 @@ class TestHeadcountForSections:
         assert len(result[section.id]) == 2
         assert result[section.id][0]["young_person_count"] == 25  # Max in 2023
         assert result[section.id][1]["young_person_count"] == 22  # Max in 2024
+
+
+@pytest.mark.django_db
+class TestLoadHeadcountForSections:
+    """Test the DataLoader wrapper for headcount data."""
+
+    def test_keys_with_different_parameters(self) -> None:
+        """Test that a batch with different date ranges and periods returns the right data for each key."""
+        section1 = GroupSectionFactory()
+        section2 = GroupSectionFactory()
+        OSMSectionHeadcountRecordFactory(section=section1, date=date(2024, 1, 1), young_person_count=10)
+        OSMSectionHeadcountRecordFactory(section=section1, date=date(2024, 1, 2), young_person_count=12)
+        OSMSectionHeadcountRecordFactory(section=section2, date=date(2024, 1, 1), young_person_count=20)
+        update_headcount_rollups()
+
+        keys = [
+            (section1.id, None, None, HeadcountAggregationPeriod.DAY),
+            (section1.id, date(2024, 1, 2), None, HeadcountAggregationPeriod.DAY),
+            (section2.id, None, None, HeadcountAggregationPeriod.DAY),
+            (section1.id, None, None, HeadcountAggregationPeriod.MONTH),
+        ]
+        result = async_to_sync(load_headcount_for_sections)(keys)
+
+        assert result == [
+            [
+                {"period_start": date(2024, 1, 1), "young_person_count": 10},
+                {"period_start": date(2024, 1, 2), "young_person_count": 12},
+            ],
+            [{"period_start": date(2024, 1, 2), "young_person_count": 12}],
+            [{"period_start": date(2024, 1, 1), "young_person_count": 20}],
+            [{"period_start": date(2024, 1, 1), "young_person_count": 12}],
+        ]
@@ -10,6 +10,7 @@ from django.db.models import Count, F, Q
 from django.utils.timezone import get_current_timezone
 from pydantic import BaseModel, TypeAdapter
 
+from salute.core.data_epoch import bump_data_epoch
 from salute.hierarchy.constants import Weekday
 from salute.hierarchy.models import District, Group, Section
 from salute.integrations.tsa.client import MembershipAPIClient
@@ -378,6 +379,9 @@ class Command(BaseCommand):
             )
             people_without_roles_or_accreditations.delete()
 
+        updated_people_count = Person.objects.update_role_flags()
+        print(f"Updated role flags for {updated_people_count} people")
+
         # Finally, let's sync up Team Types if we're reading extra data
         if read_extra_data:
             with Path("data/team_types.csv").open("r") as fh:
@@ -391,4 +395,5 @@ class Command(BaseCommand):
                     tt.included_in_all_members = data["included_in_all_members"] == "T"
                     tt.save()
 
+        bump_data_epoch()
         self.stdout.write(self.style.SUCCESS(str(sync_reports)))
@@ -11,8 +11,10 @@ from salute.hierarchy.constants import SectionType
 from salute.integrations.waiting_list.models import (
     TargetSection,
     WaitingListEntry,
+    WaitingListPostcodeAreaRecord,
     WaitingListSectionRecord,
     WaitingListSectionTypeRecord,
+    WaitingListSyncLog,
     WaitingListUnit,
 )
 
@@ -58,7 +60,7 @@ class TargetSectionFilter(SimpleListFilter):
     def queryset(self, request: HttpRequest, queryset: QuerySet[WaitingListEntry]) -> QuerySet[WaitingListEntry]:
         """Filter the queryset based on the selected value."""
         if self.value():
-            return queryset.filter(target_section=self.value())  # type: ignore[misc]
+            return queryset.filter(target_section=self.value())
         return queryset
 
 
@@ -93,8 +95,8 @@ class WaitingListEntryAdmin(BaseModelAdminMixin, admin.ModelAdmin):
 
     @admin.display(description="Target Section")
     def target_section(self, obj: WaitingListEntry) -> str:
-        """Display the target section based on age."""
-        if hasattr(obj, "target_section") and obj.target_section:
+        """Display the stored target section."""
+        if obj.target_section:
             # Try to match to SectionType first
             for section_type in SectionType:
                 if obj.target_section == section_type.value:
@@ -108,7 +110,7 @@ class WaitingListEntryAdmin(BaseModelAdminMixin, admin.ModelAdmin):
         return "-"
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[WaitingListEntry]:
-        return super().get_queryset(request).with_age(timezone.now()).with_target_section(timezone.now())  # type: ignore[attr-defined]
+        return super().get_queryset(request).with_age(timezone.now())  # type: ignore[attr-defined]
 
 
 @admin.register(WaitingListSectionRecord)
@@ -127,3 +129,19 @@ class WaitingListSectionTypeRecordAdmin(BaseModelAdminMixin, admin.ModelAdmin):
     search_fields = ("section_type",)
     ordering = ("-date",)
     readonly_fields = ("section_type", "date", "waiting_list_count")
+
+
+@admin.register(WaitingListPostcodeAreaRecord)
+class WaitingListPostcodeAreaRecordAdmin(BaseModelAdminMixin, admin.ModelAdmin):
+    list_display = ("outward_code", "target_section", "waiting_list_count")
+    list_filter = ("target_section",)
+    search_fields = ("outward_code",)
+    readonly_fields = ("outward_code", "target_section", "waiting_list_count")
+
+
+@admin.register(WaitingListSyncLog)
+class WaitingListSyncLogAdmin(BaseModelAdminMixin, admin.ModelAdmin):
+    list_display = ("started_at", "is_full_sync", "entry_count", "deleted_count")
+    list_filter = ("is_full_sync",)
+    ordering = ("-started_at",)
+    readonly_fields = ("started_at", "is_full_sync", "entry_count", "deleted_count")
@@ -1,5 +1,6 @@
 import time
-from datetime import date, datetime
+from datetime import UTC, date, datetime
+from typing import Any
 
 import requests
 from pydantic import BaseModel, Field
@@ -66,7 +67,12 @@ class AirTableClient:
         )
         self._last_request_time: float | None = None
 
-    def _get_page(self, offset: str | None = None) -> AirTableWaitingListResponse:
+    # Only request the fields that we use
+    _FIELDS = [field.alias for field in AirTableWaitingListEntryFields.model_fields.values()]
+
+    def _get_page(
+        self, offset: str | None = None, *, modified_since: datetime | None = None
+    ) -> AirTableWaitingListResponse:
         # Rate limiting: ensure at least 250ms between requests
         if self._last_request_time is not None:
             elapsed = time.time() - self._last_request_time
@@ -74,18 +80,27 @@ class AirTableClient:
                 time.sleep(self._MIN_REQUEST_INTERVAL - elapsed)
 
         url = f"https://api.airtable.com/v0/{self.base_id}/{self.table_id}"
+        params: dict[str, Any] = {"fields[]": self._FIELDS}
+        if modified_since is not None:
+            timestamp = modified_since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+            params["filterByFormula"] = f"IS_AFTER(LAST_MODIFIED_TIME(), '{timestamp}')"
         if offset is not None:
-            url += f"?offset={offset}"
-        response = self.session.get(url)
+            params["offset"] = offset
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         self._last_request_time = time.time()
         return AirTableWaitingListResponse.model_validate(response.json())
 
-    def get_waiting_list(self) -> list[WaitingListEntry]:
+    def get_waiting_list(self, *, modified_since: datetime | None = None) -> list[WaitingListEntry]:
+        """Get the entries on the waiting list.
+
+        Args:
+            modified_since: If set, only get the entries that have been modified since this time.
+        """
         all_records = []
         offset = None
         while True:
-            response = self._get_page(offset)
+            response = self._get_page(offset, modified_since=modified_since)
             all_records.extend(response.records)
             offset = response.offset
             if offset is None:
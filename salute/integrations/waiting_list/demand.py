@@ -0,0 +1,77 @@
+"""Waiting list demand by postcode area."""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from salute.core.data_epoch import get_data_epoch
+from salute.integrations.waiting_list.models import WaitingListEntry, WaitingListPostcodeAreaRecord
+
+# The inward code is always a digit and two letters, so the outward code is everything before it
+POSTCODE_RE = re.compile(r"^(?P<outward_code>[A-Z]{1,2}[0-9][A-Z0-9]?)\s*[0-9][A-Z]{2}$")
+
+
+@dataclass(frozen=True)
+class PostcodeAreaDemand:
+    outward_code: str
+    target_section: str
+    waiting_list_count: int
+
+
+def get_outward_code(postcode: str) -> str | None:
+    """Get the outward code of a postcode, e.g. SO17 for SO17 1BJ, or None if it is not a valid postcode."""
+    if match := POSTCODE_RE.match(postcode.strip().upper()):
+        return match.group("outward_code")
+    return None
+
+
+def update_postcode_area_records() -> None:
+    """Replace the postcode area records with the current number of people waiting in each area.
+
+    The target sections of the entries must be up to date before this is called.
+    """
+    counts: Counter[tuple[str, str]] = Counter()
+    for postcode, target_section in (
+        WaitingListEntry.objects.filter(successfully_transferred=False)
+        .values_list("postcode", "target_section")
+        .order_by()
+    ):
+        if outward_code := get_outward_code(postcode):
+            counts[(outward_code, target_section)] += 1
+
+    with transaction.atomic():
+        WaitingListPostcodeAreaRecord.objects.all().delete()
+        WaitingListPostcodeAreaRecord.objects.bulk_create(
+            [
+                WaitingListPostcodeAreaRecord(
+                    outward_code=outward_code, target_section=target_section, waiting_list_count=count
+                )
+                for (outward_code, target_section), count in counts.items()
+            ]
+        )
+
+
+def get_postcode_area_demand() -> list[PostcodeAreaDemand]:
+    """Get the number of people waiting in each postcode area for each target section.
+
+    The records only change when the waiting list is synced or the target sections are updated, which both bump
+    the data epoch, so they are cached until the epoch changes.
+    """
+    cache_key = f"WAITING_LIST_POSTCODE_AREA_DEMAND__{get_data_epoch()}"
+
+    demand: list[PostcodeAreaDemand] | None = cache.get(cache_key)
+    if demand is None:
+        demand = [
+            PostcodeAreaDemand(outward_code=outward_code, target_section=target_section, waiting_list_count=count)
+            for outward_code, target_section, count in WaitingListPostcodeAreaRecord.objects.values_list(
+                "outward_code", "target_section", "waiting_list_count"
+            )
+        ]
+        cache.set(cache_key, demand, timeout=settings.WAITING_LIST_DEMAND_CACHE_TIMEOUT)  # type: ignore[misc]
+    return demand
@@ -79,8 +79,6 @@ async def load_total_waiting_list_count_for_sections(pks: list[UUID]) -> list[in
         # Both also filter by target_section matching section.section_type.name
         # Optimized to avoid N+1 queries by doing bulk queries for each section type
 
-        from django.utils import timezone
-
         sections = Section.objects.filter(id__in=pks).select_related("group")
         section_counts: dict[UUID, int] = {}
 
@@ -88,8 +86,8 @@ async def load_total_waiting_list_count_for_sections(pks: list[UUID]) -> list[in
         group_sections = [s for s in sections if s.group is not None]
         district_sections = [s for s in sections if s.group is None]
 
-        # Base queryset with target_section annotation
-        base_qs = WaitingListEntry.objects.with_target_section(timezone.now()).filter(successfully_transferred=False)
+        # The stored target_section is indexed for entries that are still waiting
+        base_qs = WaitingListEntry.objects.filter(successfully_transferred=False)
 
         # Process group sections in bulk
         if group_sections:
@@ -24,3 +24,12 @@ class HeadcountDataPoint:
 
     period_start: date = sb.field(description="The start date of the aggregation period")
     young_person_count: int = sb.field(description="The maximum young person count for that period")
+
+
+@sb.type
+class WaitingListPostcodeAreaDemand:
+    """The number of people waiting in a postcode area for a target section."""
+
+    outward_code: str = sb.field(description="The outward code of the postcode area, e.g. SO17")
+    target_section: str = sb.field(description="The section type the people are old enough for, TOO_YOUNG or TOO_OLD")
+    waiting_list_count: int = sb.field(description="The number of people waiting")
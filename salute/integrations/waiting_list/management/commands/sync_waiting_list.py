@@ -1,20 +1,23 @@
+from datetime import timedelta
 from typing import Any
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db import transaction
 from django.utils import timezone
 
-from salute.hierarchy.models import Section
+from salute.core.data_epoch import bump_data_epoch
 from salute.integrations.waiting_list.client import AirTableClient
-from salute.integrations.waiting_list.models import (
-    WaitingListEntry,
-    WaitingListSectionRecord,
-    WaitingListSectionType,
-    WaitingListSectionTypeRecord,
-    WaitingListUnit,
+from salute.integrations.waiting_list.demand import update_postcode_area_records
+from salute.integrations.waiting_list.models import WaitingListSyncLog
+from salute.integrations.waiting_list.sync import (
+    delete_missing_waiting_list_entries,
+    sync_waiting_list_entries,
+    update_waiting_list_records,
 )
 
+# Deleted records can only be found by fetching the whole table, so do that regularly
+FULL_SYNC_INTERVAL = timedelta(days=7)
+
 
 class Command(BaseCommand):
     help = "Sync waiting list entries from Airtable into the database"
@@ -25,6 +28,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Fetch data from Airtable but don't write to the database",
         )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Fetch every entry and delete any that are no longer in Airtable",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         api_key = settings.AIRTABLE_API_KEY  # type: ignore[misc]
@@ -33,8 +41,23 @@ class Command(BaseCommand):
 
         client = AirTableClient(api_key=api_key, base_id=base_id, table_id=table_id)
 
-        self.stdout.write("Fetching waiting list entries from Airtable...")
-        entries = client.get_waiting_list()
+        started_at = timezone.now()
+        last_sync = WaitingListSyncLog.objects.first()
+        is_full_sync = (
+            options["full"]
+            or last_sync is None
+            or not WaitingListSyncLog.objects.filter(
+                is_full_sync=True, started_at__gte=started_at - FULL_SYNC_INTERVAL
+            ).exists()
+        )
+
+        if is_full_sync:
+            self.stdout.write("Fetching all waiting list entries from Airtable...")
+            entries = client.get_waiting_list()
+        else:
+            assert last_sync is not None
+            self.stdout.write(f"Fetching waiting list entries modified since {last_sync.started_at} from Airtable...")
+            entries = client.get_waiting_list(modified_since=last_sync.started_at)
         self.stdout.write(self.style.SUCCESS(f"Fetched {len(entries)} entries"))
 
         if options["dry_run"]:
@@ -43,67 +66,29 @@ class Command(BaseCommand):
                 self.stdout.write(f"  - {entry.external_id}: {len(entry.groups_of_interest)} groups")
             return
 
-        with transaction.atomic():
-            synced_count = 0
-            created_count = 0
-            updated_count = 0
-
-            for entry in entries:
-                # Get or create WaitingListUnit objects for each group of interest
-                units = []
-                for group_name in entry.groups_of_interest:
-                    unit, _created = WaitingListUnit.objects.get_or_create(name=group_name)
-                    units.append(unit)
-
-                joined_at = entry.joined_waiting_list_at
-                if timezone.is_naive(joined_at):
-                    joined_at = timezone.make_aware(joined_at)
-
-                db_entry, created = WaitingListEntry.objects.update_or_create(
-                    external_id=entry.external_id,
-                    defaults={
-                        "date_of_birth": entry.date_of_birth,
-                        "postcode": entry.postcode or "",
-                        "joined_waiting_list_at": joined_at,
-                        "successfully_transferred": entry.successfully_transferred,
-                    },
-                )
-
-                # Update the many-to-many relationship
-                db_entry.units.set(units)
-
-                synced_count += 1
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Sync complete: {synced_count} entries synced ({created_count} created, {updated_count} updated)"
-                )
-            )
-
-        for section in Section.objects.all():
-            qs = WaitingListEntry.objects.with_target_section(timezone.now()).filter(successfully_transferred=False)
-            if section.group is not None:
-                qs = qs.filter(units__group=section.group, target_section=section.section_type.name)
-            else:
-                qs = qs.filter(units__section=section, target_section=section.section_type.name)
-            WaitingListSectionRecord.objects.update_or_create(
-                section=section,
-                date=timezone.now().date(),
-                defaults={"waiting_list_count": qs.count()},
+        result = sync_waiting_list_entries(entries)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sync complete: {len(entries)} entries synced "
+                f"({result.created_count} created, {result.updated_count} updated)"
             )
+        )
 
-        for section_type in WaitingListSectionType:
-            qs = WaitingListEntry.objects.with_target_section(timezone.now()).filter(
-                successfully_transferred=False, target_section=section_type.value
-            )
-            WaitingListSectionTypeRecord.objects.update_or_create(
-                section_type=section_type.value,
-                date=timezone.now().date(),
-                defaults={"waiting_list_count": qs.count()},
-            )
+        deleted_count = 0
+        if is_full_sync:
+            deleted_count = delete_missing_waiting_list_entries({entry.external_id for entry in entries})
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted_count} entries no longer in Airtable"))
 
+        update_waiting_list_records(timezone.now())
         self.stdout.write(self.style.SUCCESS("Waiting list section records updated"))
+
+        update_postcode_area_records()
+        self.stdout.write(self.style.SUCCESS("Waiting list postcode area records updated"))
+
+        WaitingListSyncLog.objects.create(
+            started_at=started_at,
+            is_full_sync=is_full_sync,
+            entry_count=len(entries),
+            deleted_count=deleted_count,
+        )
+        bump_data_epoch()
@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from salute.core.data_epoch import bump_data_epoch
+from salute.integrations.waiting_list.demand import update_postcode_area_records
+from salute.integrations.waiting_list.models import WaitingListEntry
+
+
+class Command(BaseCommand):
+    help = "Recalculate the target section of waiting list entries that have moved into a different age range"
+
+    def handle(self, *args: tuple[str, ...], **options: dict[str, Any]) -> None:
+        updated_count = WaitingListEntry.objects.update_target_sections(timezone.now())
+        self.stdout.write(self.style.SUCCESS(f"Updated the target section of {updated_count} entries"))
+
+        if updated_count:
+            update_postcode_area_records()
+            self.stdout.write(self.style.SUCCESS("Waiting list postcode area records updated"))
+            bump_data_epoch()
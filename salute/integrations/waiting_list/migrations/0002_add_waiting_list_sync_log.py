@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:15
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("waiting_list", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WaitingListSyncLog",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="Salute ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("started_at", models.DateTimeField()),
+                ("is_full_sync", models.BooleanField()),
+                ("entry_count", models.IntegerField()),
+                ("deleted_count", models.IntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-started_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:17
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
+from django.utils import timezone
+
+# The age range of each section in days, as (section type name, min days, max days exclusive), at the time of
+# this migration. Later changes to the age ranges are applied by the daily recalculation.
+SECTION_AGE_RANGES_IN_DAYS = [
+    ("SQUIRRELS", 1461, 2191),
+    ("BEAVERS", 2191, 3287),
+    ("CUBS", 2922, 4200),
+    ("SCOUTS", 3835, 5478),
+    ("EXPLORERS", 5113, 6939),
+    ("NETWORK", 6574, 9496),
+]
+
+
+def populate_target_sections(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    WaitingListEntry = apps.get_model("waiting_list", "WaitingListEntry")
+    age_days = models.Func(
+        models.Value("day"),
+        models.Value(timezone.now().date()) - models.F("date_of_birth"),
+        function="DATE_PART",
+        template="%(function)s(%(expressions)s)",
+        output_field=models.IntegerField(),
+    )
+    WaitingListEntry.objects.update(
+        target_section=models.Case(
+            models.When(LessThan(age_days, SECTION_AGE_RANGES_IN_DAYS[0][1]), then=models.Value("TOO_YOUNG")),
+            *[
+                models.When(
+                    GreaterThanOrEqual(age_days, min_days) & LessThan(age_days, max_days),
+                    then=models.Value(section_type),
+                )
+                for section_type, min_days, max_days in SECTION_AGE_RANGES_IN_DAYS
+            ],
+            default=models.Value("TOO_OLD"),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("waiting_list", "0002_add_waiting_list_sync_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="waitinglistentry",
+            name="target_section",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Section type name, TOO_YOUNG or TOO_OLD. Recalculated daily from the date of birth.",
+                max_length=16,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="waitinglistentry",
+            index=models.Index(
+                condition=models.Q(("successfully_transferred", False)),
+                fields=["target_section"],
+                name="idx_waitinglist_target_section",
+            ),
+        ),
+        migrations.RunPython(
+            populate_target_sections,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
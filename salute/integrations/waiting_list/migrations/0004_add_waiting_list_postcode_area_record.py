@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("waiting_list", "0003_add_waiting_list_entry_target_section"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WaitingListPostcodeAreaRecord",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="Salute ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("outward_code", models.CharField(max_length=4)),
+                ("target_section", models.CharField(max_length=16)),
+                ("waiting_list_count", models.IntegerField()),
+            ],
+            options={
+                "ordering": ["outward_code", "target_section"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("outward_code", "target_section"), name="unique_waiting_list_postcode_area_record"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -4,6 +4,7 @@ from typing import Self
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Case, F, Value, When
+from django.db.models.lookups import GreaterThanOrEqual, LessThan
 
 from salute.core.models import BaseModel
 from salute.hierarchy.constants import SECTION_TYPE_INFO, SectionType
@@ -48,13 +49,14 @@ class WaitingListEntryQuerySet(models.QuerySet):
         today = now.date()
         return self.annotate(age=Value(today) - F("date_of_birth"))
 
-    def with_target_section(self, now: datetime.datetime) -> Self:
-        """Annotate queryset with target_section based on age."""
+    @staticmethod
+    def target_section_expression(now: datetime.datetime) -> Case:
+        """Build an expression for the target section of an entry, based on their age."""
         today = now.date()
         age_interval = Value(today) - F("date_of_birth")
 
         # Extract days from the interval using DATE_PART
-        age_days_expr = models.Func(
+        age_days = models.Func(
             Value("day"),
             age_interval,
             function="DATE_PART",
@@ -62,9 +64,6 @@ class WaitingListEntryQuerySet(models.QuerySet):
             output_field=models.IntegerField(),
         )
 
-        # First annotate age_days, then use it in Case/When
-        queryset = self.annotate(_age_days=age_days_expr)
-
         # Build Case/When conditions for each section type using numeric ages
         when_conditions = []
 
@@ -90,8 +89,7 @@ class WaitingListEntryQuerySet(models.QuerySet):
 
             when_conditions.append(
                 When(
-                    _age_days__gte=min_days,
-                    _age_days__lt=max_days_exclusive,
+                    GreaterThanOrEqual(age_days, min_days) & LessThan(age_days, max_days_exclusive),
                     then=Value(section_type.name),
                 )
             )
@@ -100,16 +98,18 @@ class WaitingListEntryQuerySet(models.QuerySet):
         youngest_min = SECTION_TYPE_INFO[section_order[0]]["min_age_numeric"]
         when_conditions.insert(
             0,
-            When(_age_days__lt=int(youngest_min * 365.25), then=Value(TargetSection.TOO_YOUNG.value)),
+            When(LessThan(age_days, int(youngest_min * 365.25)), then=Value(TargetSection.TOO_YOUNG.value)),
         )
 
-        # Add TOO_OLD (older than oldest section)
-        oldest_max = SECTION_TYPE_INFO[section_order[-1]]["max_age_numeric"]
-        when_conditions.append(
-            When(_age_days__gt=int(oldest_max * 365.25), then=Value(TargetSection.TOO_OLD.value)),
-        )
+        return Case(*when_conditions, default=Value(TargetSection.TOO_OLD.value))
+
+    def update_target_sections(self, now: datetime.datetime) -> int:
+        """Recalculate the stored target section, returning the number of entries that have changed.
 
-        return queryset.annotate(target_section=Case(*when_conditions, default=Value(TargetSection.TOO_OLD.value)))
+        Only entries that have moved into a different age range are written, so this is cheap to run daily.
+        """
+        target_section = self.target_section_expression(now)
+        return self.exclude(target_section=target_section).update(target_section=target_section)
 
 
 class WaitingListEntry(BaseModel):
@@ -122,6 +122,13 @@ class WaitingListEntry(BaseModel):
 
     successfully_transferred = models.BooleanField()
 
+    target_section = models.CharField(
+        max_length=16,
+        blank=True,
+        editable=False,
+        help_text="Section type name, TOO_YOUNG or TOO_OLD. Recalculated daily from the date of birth.",
+    )
+
     objects = WaitingListEntryQuerySet.as_manager()
 
     class Meta:
@@ -130,6 +137,11 @@ class WaitingListEntry(BaseModel):
             models.Index(fields=["date_of_birth"]),
             models.Index(fields=["postcode"]),
             models.Index(fields=["successfully_transferred"]),
+            models.Index(
+                fields=["target_section"],
+                condition=models.Q(successfully_transferred=False),
+                name="idx_waitinglist_target_section",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -175,3 +187,40 @@ class WaitingListSectionTypeRecord(BaseModel):
         constraints = [
             models.UniqueConstraint(fields=["section_type", "date"], name="unique_waiting_list_section_type_date"),
         ]
+
+
+class WaitingListSyncLog(BaseModel):
+    """A successful sync of the waiting list from Airtable.
+
+    Incremental syncs only fetch the entries modified since the start of the previous sync.
+    """
+
+    started_at = models.DateTimeField()
+    is_full_sync = models.BooleanField()
+    entry_count = models.IntegerField()
+    deleted_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["-started_at"]
+
+    def __str__(self) -> str:
+        return f"{self.started_at} - {'full' if self.is_full_sync else 'incremental'}"
+
+
+class WaitingListPostcodeAreaRecord(BaseModel):
+    """The number of people waiting in a postcode area for a target section, as of the last sync."""
+
+    outward_code = models.CharField(max_length=4)
+    target_section = models.CharField(max_length=16)
+    waiting_list_count = models.IntegerField()
+
+    class Meta:
+        ordering = ["outward_code", "target_section"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["outward_code", "target_section"], name="unique_waiting_list_postcode_area_record"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.outward_code} - {self.target_section} - {self.waiting_list_count}"
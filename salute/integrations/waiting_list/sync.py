@@ -0,0 +1,180 @@
+"""Writing waiting list data from Airtable into the database."""
+
+from __future__ import annotations
+
+import datetime
+from collections import Counter
+from dataclasses import dataclass
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from salute.hierarchy.models import Section
+from salute.integrations.waiting_list.client import WaitingListEntry as ExternalWaitingListEntry
+from salute.integrations.waiting_list.models import (
+    WaitingListEntry,
+    WaitingListSectionRecord,
+    WaitingListSectionType,
+    WaitingListSectionTypeRecord,
+    WaitingListUnit,
+)
+
+WaitingListEntryUnit = WaitingListEntry.units.through
+
+
+@dataclass(frozen=True)
+class WaitingListSyncResult:
+    created_count: int
+    updated_count: int
+
+
+def sync_waiting_list_entries(entries: list[ExternalWaitingListEntry]) -> WaitingListSyncResult:
+    """Create or update waiting list entries, their units, and the links between them.
+
+    Every table is written with bulk queries, so the number of queries does not depend on the number of entries.
+    """
+    with transaction.atomic():
+        # Create any units that we haven't seen before
+        unit_names = {group_name for entry in entries for group_name in entry.groups_of_interest}
+        WaitingListUnit.objects.bulk_create(
+            [WaitingListUnit(name=name) for name in unit_names],
+            ignore_conflicts=True,
+        )
+        unit_ids_by_name = dict(WaitingListUnit.objects.filter(name__in=unit_names).values_list("name", "id"))
+
+        external_ids = [entry.external_id for entry in entries]
+        existing_external_ids = set(
+            WaitingListEntry.objects.filter(external_id__in=external_ids).values_list("external_id", flat=True)
+        )
+
+        db_entries = []
+        for entry in entries:
+            joined_at = entry.joined_waiting_list_at
+            if timezone.is_naive(joined_at):
+                joined_at = timezone.make_aware(joined_at)
+
+            db_entries.append(
+                WaitingListEntry(
+                    external_id=entry.external_id,
+                    date_of_birth=entry.date_of_birth,
+                    postcode=entry.postcode or "",
+                    joined_waiting_list_at=joined_at,
+                    successfully_transferred=entry.successfully_transferred,
+                )
+            )
+
+        WaitingListEntry.objects.bulk_create(
+            db_entries,
+            update_conflicts=True,
+            unique_fields=["external_id"],
+            update_fields=[
+                "date_of_birth",
+                "postcode",
+                "joined_waiting_list_at",
+                "successfully_transferred",
+                "updated_at",
+            ],
+            batch_size=1000,
+        )
+        entry_ids_by_external_id = dict(
+            WaitingListEntry.objects.filter(external_id__in=external_ids).values_list("external_id", "id")
+        )
+
+        # Work out the links between entries and units, and replace any that have changed
+        wanted_links = {
+            (entry_ids_by_external_id[entry.external_id], unit_ids_by_name[group_name])
+            for entry in entries
+            for group_name in entry.groups_of_interest
+        }
+        existing_links = {
+            (entry_id, unit_id): link_id
+            for link_id, entry_id, unit_id in WaitingListEntryUnit.objects.filter(
+                waitinglistentry_id__in=entry_ids_by_external_id.values()
+            ).values_list("id", "waitinglistentry_id", "waitinglistunit_id")
+        }
+        WaitingListEntryUnit.objects.filter(
+            id__in=[link_id for link, link_id in existing_links.items() if link not in wanted_links]
+        ).delete()
+        WaitingListEntryUnit.objects.bulk_create(
+            [
+                WaitingListEntryUnit(waitinglistentry_id=entry_id, waitinglistunit_id=unit_id)
+                for entry_id, unit_id in wanted_links - existing_links.keys()
+            ],
+            batch_size=1000,
+        )
+
+        WaitingListEntry.objects.filter(id__in=entry_ids_by_external_id.values()).update_target_sections(timezone.now())
+
+    return WaitingListSyncResult(
+        created_count=len(set(external_ids) - existing_external_ids),
+        updated_count=len(existing_external_ids),
+    )
+
+
+def delete_missing_waiting_list_entries(external_ids: set[str]) -> int:
+    """Delete the entries that are no longer in Airtable.
+
+    Incremental syncs can't see deleted records, so this is run after a full sync.
+    """
+    _, deleted_counts = WaitingListEntry.objects.exclude(external_id__in=external_ids).delete()
+    return deleted_counts.get(WaitingListEntry._meta.label, 0)
+
+
+def update_waiting_list_records(now: datetime.datetime) -> None:
+    """Record the number of people waiting for each section and section type."""
+    WaitingListEntry.objects.update_target_sections(now)
+    waiting_entries = WaitingListEntry.objects.filter(successfully_transferred=False)
+
+    # Group sections count the entries for their group, and district sections count the entries for the section
+    unit_counts: Counter[tuple[UUID | None, UUID | None, str]] = Counter()
+    for group_id, section_id, target_section, count in (
+        waiting_entries.filter(units__isnull=False)
+        .values("units__group_id", "units__section_id", "target_section")
+        .annotate(count=Count("id", distinct=True))
+        .values_list("units__group_id", "units__section_id", "target_section", "count")
+        .order_by()
+    ):
+        unit_counts[(group_id, section_id, target_section)] = count
+
+    section_type_counts = Counter(
+        dict(
+            waiting_entries.values("target_section")
+            .annotate(count=Count("id"))
+            .values_list("target_section", "count")
+            .order_by()
+        )
+    )
+
+    section_records = []
+    for section_id, group_id, section_type in Section.objects.values_list("id", "group_id", "section_type"):
+        target_section = section_type.name
+        if group_id is not None:
+            count = unit_counts[(group_id, None, target_section)]
+        else:
+            count = unit_counts[(None, section_id, target_section)]
+        section_records.append(
+            WaitingListSectionRecord(section_id=section_id, date=now.date(), waiting_list_count=count)
+        )
+
+    with transaction.atomic():
+        WaitingListSectionRecord.objects.bulk_create(
+            section_records,
+            update_conflicts=True,
+            unique_fields=["section", "date"],
+            update_fields=["waiting_list_count", "updated_at"],
+        )
+        WaitingListSectionTypeRecord.objects.bulk_create(
+            [
+                WaitingListSectionTypeRecord(
+                    section_type=section_type.value,
+                    date=now.date(),
+                    waiting_list_count=section_type_counts[section_type.value],
+                )
+                for section_type in WaitingListSectionType
+            ],
+            update_conflicts=True,
+            unique_fields=["section_type", "date"],
+            update_fields=["waiting_list_count", "updated_at"],
+        )
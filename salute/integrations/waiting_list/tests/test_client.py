@@ -0,0 +1,67 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+import responses
+from responses import matchers
+
+from salute.integrations.waiting_list.client import AirTableClient
+
+URL = "https://api.airtable.com/v0/base/table"
+FIELDS = [
+    "D.O.B.",
+    "Which group would you like to join",
+    "Postcode",
+    "Created",
+    "14th WL: Joined List",
+    "Transfered to",
+]
+RECORD = {
+    "id": "rec1",
+    "createdTime": "2021-06-01T12:00:00.000Z",
+    "fields": {
+        "D.O.B.": "2016-01-15",
+        "Which group would you like to join": ["1st Example"],
+        "Created": "2021-06-01T12:00:00.000Z",
+    },
+}
+
+
+class TestAirTableClient:
+    @responses.activate
+    def test_get_waiting_list__requests_used_fields(self) -> None:
+        responses.get(
+            URL,
+            match=[matchers.query_param_matcher({"fields[]": FIELDS})],
+            json={"records": [RECORD], "offset": "page2"},
+        )
+        responses.get(
+            URL,
+            match=[matchers.query_param_matcher({"fields[]": FIELDS, "offset": "page2"})],
+            json={"records": [{**RECORD, "id": "rec2"}]},
+        )
+
+        entries = AirTableClient(api_key="key", base_id="base", table_id="table").get_waiting_list()
+
+        assert [entry.external_id for entry in entries] == ["rec1", "rec2"]
+        assert entries[0].date_of_birth == datetime.date(2016, 1, 1)
+
+    @responses.activate
+    def test_get_waiting_list__modified_since(self) -> None:
+        responses.get(
+            URL,
+            match=[
+                matchers.query_param_matcher(
+                    {
+                        "fields[]": FIELDS,
+                        "filterByFormula": "IS_AFTER(LAST_MODIFIED_TIME(), '2022-06-01T11:00:00.000Z')",
+                    }
+                )
+            ],
+            json={"records": [RECORD]},
+        )
+
+        entries = AirTableClient(api_key="key", base_id="base", table_id="table").get_waiting_list(
+            modified_since=datetime.datetime(2022, 6, 1, 12, 0, tzinfo=ZoneInfo("Europe/London"))
+        )
+
+        assert [entry.external_id for entry in entries] == ["rec1"]
@@ -0,0 +1,69 @@
+import pytest
+from django.core.cache import cache
+
+from salute.core.data_epoch import bump_data_epoch
+from salute.integrations.waiting_list.demand import (
+    PostcodeAreaDemand,
+    get_outward_code,
+    get_postcode_area_demand,
+    update_postcode_area_records,
+)
+from salute.integrations.waiting_list.factories import WaitingListEntryFactory
+from salute.integrations.waiting_list.models import WaitingListPostcodeAreaRecord
+
+
+@pytest.mark.parametrize(
+    "postcode, expected",
+    [
+        ("SO17 1BJ", "SO17"),
+        ("so171bj", "SO17"),
+        (" SO5 3AB ", "SO5"),
+        ("EC1A 1BB", "EC1A"),
+        ("M1 1AE", "M1"),
+        ("", None),
+        ("Southampton", None),
+    ],
+)
+def test_get_outward_code(postcode: str, expected: str | None) -> None:
+    assert get_outward_code(postcode) == expected
+
+
+@pytest.mark.django_db
+class TestPostcodeAreaDemand:
+    def test_update_postcode_area_records(self) -> None:
+        WaitingListPostcodeAreaRecord.objects.create(outward_code="SO99", target_section="CUBS", waiting_list_count=1)
+        for postcode, target_section, transferred in [
+            ("SO17 1BJ", "BEAVERS", False),
+            ("so17 3ab", "BEAVERS", False),
+            ("SO17 1BJ", "CUBS", False),
+            ("SO16 1AA", "BEAVERS", False),
+            ("SO16 1AA", "BEAVERS", True),
+            ("unknown", "BEAVERS", False),
+        ]:
+            WaitingListEntryFactory(
+                postcode=postcode, target_section=target_section, successfully_transferred=transferred
+            )
+
+        update_postcode_area_records()
+
+        assert list(
+            WaitingListPostcodeAreaRecord.objects.values_list("outward_code", "target_section", "waiting_list_count")
+        ) == [
+            ("SO16", "BEAVERS", 1),
+            ("SO17", "BEAVERS", 2),
+            ("SO17", "CUBS", 1),
+        ]
+
+    def test_get_postcode_area_demand__cached_until_data_epoch_changes(self) -> None:
+        cache.clear()
+        WaitingListPostcodeAreaRecord.objects.create(outward_code="SO17", target_section="CUBS", waiting_list_count=1)
+
+        assert get_postcode_area_demand() == [
+            PostcodeAreaDemand(outward_code="SO17", target_section="CUBS", waiting_list_count=1)
+        ]
+
+        WaitingListPostcodeAreaRecord.objects.update(waiting_list_count=2)
+        assert get_postcode_area_demand()[0].waiting_list_count == 1
+
+        bump_data_epoch()
+        assert get_postcode_area_demand()[0].waiting_list_count == 2
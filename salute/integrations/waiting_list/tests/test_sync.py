@@ -0,0 +1,110 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from pytest_django import DjangoAssertNumQueries
+
+from salute.hierarchy.constants import SectionType
+from salute.hierarchy.factories import DistrictSectionFactory, GroupFactory, GroupSectionFactory
+from salute.integrations.waiting_list.client import WaitingListEntry as ExternalWaitingListEntry
+from salute.integrations.waiting_list.factories import WaitingListEntryFactory
+from salute.integrations.waiting_list.models import (
+    WaitingListEntry,
+    WaitingListSectionRecord,
+    WaitingListSectionTypeRecord,
+    WaitingListUnit,
+)
+from salute.integrations.waiting_list.sync import (
+    delete_missing_waiting_list_entries,
+    sync_waiting_list_entries,
+    update_waiting_list_records,
+)
+
+NOW = datetime.datetime(2022, 1, 1, tzinfo=ZoneInfo("Europe/London"))
+
+
+def _external_entry(external_id: str, *groups_of_interest: str, transferred: bool = False) -> ExternalWaitingListEntry:
+    return ExternalWaitingListEntry(
+        external_id=external_id,
+        date_of_birth=datetime.date(2016, 1, 1),
+        groups_of_interest=list(groups_of_interest),
+        postcode="SO17 1BJ",
+        joined_waiting_list_at=datetime.datetime(2021, 6, 1, 12, 0, tzinfo=ZoneInfo("Europe/London")),
+        successfully_transferred=transferred,
+    )
+
+
+@pytest.mark.django_db
+class TestSyncWaitingListEntries:
+    def test_create_and_update(self, django_assert_max_num_queries: DjangoAssertNumQueries) -> None:
+        WaitingListUnit.objects.create(name="1st Example")
+        existing_entry = WaitingListEntryFactory(external_id="rec1")
+        existing_entry.units.set([WaitingListUnit.objects.create(name="2nd Example")])
+
+        entries = [
+            _external_entry("rec1", "1st Example", "3rd Example", transferred=True),
+            _external_entry("rec2", "3rd Example"),
+            _external_entry("rec3"),
+        ]
+        with django_assert_max_num_queries(12):
+            result = sync_waiting_list_entries(entries)
+
+        assert (result.created_count, result.updated_count) == (2, 1)
+        assert {
+            entry.external_id: (entry.successfully_transferred, sorted(unit.name for unit in entry.units.all()))
+            for entry in WaitingListEntry.objects.prefetch_related("units")
+        } == {
+            "rec1": (True, ["1st Example", "3rd Example"]),
+            "rec2": (False, ["3rd Example"]),
+            "rec3": (False, []),
+        }
+        assert WaitingListEntry.objects.get(external_id="rec1").id == existing_entry.id
+        assert WaitingListUnit.objects.count() == 3
+
+
+@pytest.mark.django_db
+class TestDeleteMissingWaitingListEntries:
+    def test_delete_missing(self) -> None:
+        WaitingListEntryFactory(external_id="rec1")
+        removed_entry = WaitingListEntryFactory(external_id="rec2")
+        removed_entry.units.set([WaitingListUnit.objects.create(name="1st Example")])
+
+        assert delete_missing_waiting_list_entries({"rec1", "rec3"}) == 1
+        assert list(WaitingListEntry.objects.values_list("external_id", flat=True)) == ["rec1"]
+        assert WaitingListUnit.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestUpdateWaitingListRecords:
+    def test_update_records(self) -> None:
+        group = GroupFactory()
+        beavers = GroupSectionFactory(group=group, section_type=SectionType.BEAVERS)
+        cubs = GroupSectionFactory(group=group, section_type=SectionType.CUBS)
+        explorers = DistrictSectionFactory(section_type=SectionType.EXPLORERS)
+        group_unit = WaitingListUnit.objects.create(name="Group", group=group)
+        section_unit = WaitingListUnit.objects.create(name="Section", section=explorers)
+
+        for date_of_birth, units, transferred in [
+            (datetime.date(2016, 1, 1), [group_unit, section_unit], False),  # Beavers
+            (datetime.date(2007, 1, 1), [group_unit, section_unit], False),  # Explorers
+            (datetime.date(2015, 9, 1), [group_unit], False),  # Beavers
+            (datetime.date(2015, 9, 1), [group_unit], True),  # Beavers, but transferred
+            (datetime.date(2013, 1, 1), [], False),  # Cubs, with no units
+        ]:
+            WaitingListEntryFactory(date_of_birth=date_of_birth, successfully_transferred=transferred).units.set(units)
+
+        update_waiting_list_records(NOW)
+        # Updating again on the same day replaces the records
+        update_waiting_list_records(NOW)
+
+        assert dict(WaitingListSectionRecord.objects.values_list("section_id", "waiting_list_count")) == {
+            beavers.id: 2,
+            cubs.id: 0,
+            explorers.id: 1,
+        }
+        section_type_counts = dict(
+            WaitingListSectionTypeRecord.objects.values_list("section_type", "waiting_list_count")
+        )
+        assert section_type_counts["BEAVERS"] == 2
+        assert section_type_counts["CUBS"] == 1
+        assert section_type_counts["SCOUTS"] == 0
@@ -0,0 +1,72 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
+
+from salute.integrations.waiting_list.factories import WaitingListEntryFactory
+from salute.integrations.waiting_list.models import WaitingListEntry, WaitingListSyncLog
+
+from .test_sync import _external_entry
+
+
+@pytest.fixture(autouse=True)
+def airtable_settings(settings: SettingsWrapper) -> None:
+    settings.AIRTABLE_API_KEY = "key"
+    settings.AIRTABLE_BASE_ID = "base"
+    settings.AIRTABLE_TABLE_ID = "table"
+
+
+@pytest.mark.django_db
+@mock.patch("salute.integrations.waiting_list.management.commands.sync_waiting_list.AirTableClient.get_waiting_list")
+class TestSyncWaitingListCommand:
+    def test_first_sync_is_full(self, mock_get_waiting_list: mock.Mock) -> None:
+        WaitingListEntryFactory(external_id="deleted")
+        mock_get_waiting_list.return_value = [_external_entry("rec1")]
+
+        call_command("sync_waiting_list", stdout=StringIO())
+
+        mock_get_waiting_list.assert_called_once_with()
+        assert list(WaitingListEntry.objects.values_list("external_id", flat=True)) == ["rec1"]
+        sync_log = WaitingListSyncLog.objects.get()
+        assert (sync_log.is_full_sync, sync_log.entry_count, sync_log.deleted_count) == (True, 1, 1)
+
+    def test_incremental_sync(self, mock_get_waiting_list: mock.Mock) -> None:
+        last_started_at = timezone.now() - datetime.timedelta(hours=1)
+        WaitingListSyncLog.objects.create(
+            started_at=timezone.now() - datetime.timedelta(days=1), is_full_sync=True, entry_count=1
+        )
+        WaitingListSyncLog.objects.create(started_at=last_started_at, is_full_sync=False, entry_count=1)
+        WaitingListEntryFactory(external_id="unchanged")
+        mock_get_waiting_list.return_value = [_external_entry("rec1")]
+
+        call_command("sync_waiting_list", stdout=StringIO())
+
+        mock_get_waiting_list.assert_called_once_with(modified_since=last_started_at)
+        assert set(WaitingListEntry.objects.values_list("external_id", flat=True)) == {"rec1", "unchanged"}
+        assert WaitingListSyncLog.objects.first().is_full_sync is False  # type: ignore[union-attr]
+
+    def test_full_sync_when_last_full_sync_is_old(self, mock_get_waiting_list: mock.Mock) -> None:
+        WaitingListSyncLog.objects.create(
+            started_at=timezone.now() - datetime.timedelta(days=8), is_full_sync=True, entry_count=1
+        )
+        WaitingListSyncLog.objects.create(
+            started_at=timezone.now() - datetime.timedelta(hours=1), is_full_sync=False, entry_count=1
+        )
+        mock_get_waiting_list.return_value = []
+
+        call_command("sync_waiting_list", stdout=StringIO())
+
+        mock_get_waiting_list.assert_called_once_with()
+        assert WaitingListSyncLog.objects.first().is_full_sync is True  # type: ignore[union-attr]
+
+    def test_dry_run(self, mock_get_waiting_list: mock.Mock) -> None:
+        mock_get_waiting_list.return_value = [_external_entry("rec1")]
+
+        call_command("sync_waiting_list", "--dry-run", stdout=StringIO())
+
+        assert not WaitingListEntry.objects.exists()
+        assert not WaitingListSyncLog.objects.exists()
@@ -0,0 +1,44 @@
+import datetime
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from salute.core.data_epoch import get_data_epoch
+from salute.integrations.waiting_list.factories import WaitingListEntryFactory
+from salute.integrations.waiting_list.models import WaitingListEntry, WaitingListPostcodeAreaRecord
+
+
+@pytest.mark.django_db
+class TestUpdateWaitingListTargetSectionsCommand:
+    def test_updates_target_sections_and_postcode_areas(self) -> None:
+        entry = WaitingListEntryFactory(
+            postcode="SO17 1BJ",
+            date_of_birth=timezone.localdate() - datetime.timedelta(days=365 * 13),
+            successfully_transferred=False,
+        )
+        WaitingListEntry.objects.filter(id=entry.id).update(target_section="CUBS")
+        WaitingListPostcodeAreaRecord.objects.create(outward_code="SO17", target_section="CUBS", waiting_list_count=1)
+        epoch = get_data_epoch()
+
+        output = StringIO()
+        call_command("update_waiting_list_target_sections", stdout=output)
+
+        assert "Updated the target section of 1 entries" in output.getvalue()
+        assert WaitingListEntry.objects.get().target_section == "SCOUTS"
+        assert list(
+            WaitingListPostcodeAreaRecord.objects.values_list("outward_code", "target_section", "waiting_list_count")
+        ) == [("SO17", "SCOUTS", 1)]
+        assert get_data_epoch() == epoch + 1
+
+    def test_no_changes(self) -> None:
+        WaitingListPostcodeAreaRecord.objects.create(outward_code="SO17", target_section="CUBS", waiting_list_count=1)
+        epoch = get_data_epoch()
+
+        output = StringIO()
+        call_command("update_waiting_list_target_sections", stdout=output)
+
+        assert "Updated the target section of 0 entries" in output.getvalue()
+        assert WaitingListPostcodeAreaRecord.objects.count() == 1
+        assert get_data_epoch() == epoch
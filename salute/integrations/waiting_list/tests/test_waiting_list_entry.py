@@ -31,10 +31,23 @@ class TestWaitingListEntry:
             (datetime.date(1996, 1, 1), "TOO_OLD"),  # Age 26
         ],
     )
-    def test_with_target_section(self, date_of_birth: datetime.date, expected_target_section: str) -> None:
+    def test_update_target_sections(self, date_of_birth: datetime.date, expected_target_section: str) -> None:
         WaitingListEntryFactory(date_of_birth=date_of_birth)
-        entry = WaitingListEntry.objects.with_target_section(
-            datetime.datetime(2022, 1, 1, tzinfo=ZoneInfo("Europe/London"))
-        ).first()
-        assert entry is not None
+        now = datetime.datetime(2022, 1, 1, tzinfo=ZoneInfo("Europe/London"))
+
+        assert WaitingListEntry.objects.update_target_sections(now) == 1
+        entry = WaitingListEntry.objects.get()
         assert entry.target_section == expected_target_section
+
+        # Entries that haven't changed are not updated again
+        assert WaitingListEntry.objects.update_target_sections(now) == 0
+
+    def test_update_target_sections__crosses_age_boundary(self) -> None:
+        WaitingListEntryFactory(date_of_birth=datetime.date(2013, 1, 1))
+        WaitingListEntry.objects.update_target_sections(datetime.datetime(2021, 12, 15, tzinfo=ZoneInfo("UTC")))
+        assert WaitingListEntry.objects.get().target_section == "BEAVERS"
+
+        assert (
+            WaitingListEntry.objects.update_target_sections(datetime.datetime(2022, 1, 15, tzinfo=ZoneInfo("UTC"))) == 1
+        )
+        assert WaitingListEntry.objects.get().target_section == "CUBS"
@@ -5,6 +5,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from tqdm import tqdm
 
+from salute.core.data_epoch import bump_data_epoch
 from salute.integrations.workspace.models import (
     WorkspaceAccount,
     WorkspaceGroup,
@@ -40,6 +41,8 @@ class Command(BaseCommand):
 
         self.sync_workspace_groups(service)
 
+        bump_data_epoch()
+
     def audit_workspace_user(self, account: WorkspaceAccount) -> None:
         # Attempt to link to user
         external_ids_by_type = {external_id["type"]: external_id["value"] for external_id in account.external_ids}
@@ -166,6 +166,9 @@ class MailGroupAdmin(admin.ModelAdmin):
                         description="",
                         system_mailing_group=mailing_group,
                     )
+                    # The group is created outside of the admin's save, so log it here. This also bumps the data
+                    # epoch, as the mailing group is only visible in the API once it has a workspace group.
+                    self.log_addition(request, workspace_group, [{"added": {}}])
 
                     messages.success(
                         request,
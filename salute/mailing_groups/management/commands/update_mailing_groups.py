@@ -3,6 +3,7 @@ from typing import Any
 from django.core.management.base import BaseCommand
 from django.db import models
 
+from salute.core.data_epoch import bump_data_epoch
 from salute.hierarchy.constants import GROUP_SECTION_TYPES, SectionType
 from salute.hierarchy.models import District, Group, Section
 from salute.mailing_groups.models import (
@@ -536,4 +537,5 @@ class Command(BaseCommand):
         for mail_group in SystemMailingGroup.objects.all():
             mail_group.update_members()
 
+        bump_data_epoch()
         print("Done")
@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import Client as DjangoTestClient
+from django.test import override_settings
+from django.urls import reverse
+from strawberry_django.test.client import Response, TestClient
+
+from salute.accounts.factories import UserFactory
+from salute.accounts.models import User
+from salute.integrations.workspace.models import WorkspaceGroup
+from salute.mailing_groups.factories import SystemMailingGroupFactory
+from salute.people.factories import PersonFactory
+
+
+@pytest.mark.django_db
+class TestCreateWorkspaceGroupView:
+    QUERY = """
+    query {
+        systemMailingGroups {
+            totalCount
+        }
+    }
+    """
+
+    def _query_total_count(self, user: User) -> int:
+        client = TestClient(reverse("graphql"))
+        with client.login(user):
+            result = client.query(self.QUERY)
+
+        assert isinstance(result, Response)
+        assert result.errors is None
+        return result.data["systemMailingGroups"]["totalCount"]  # type: ignore[index]
+
+    @override_settings(GOOGLE_DOMAIN="example.com")
+    @mock.patch("googleapiclient.discovery.build")
+    @mock.patch("google.oauth2.service_account.Credentials.from_service_account_file")
+    def test_create_invalidates_cached_responses(
+        self, mock_credentials: mock.Mock, mock_build: mock.Mock, client: DjangoTestClient, admin_user: User
+    ) -> None:
+        cache.clear()
+        mailing_group = SystemMailingGroupFactory()
+        mock_build.return_value.groups.return_value.insert.return_value.execute.return_value = {"id": "google-id"}
+        user = UserFactory(person=PersonFactory())
+
+        assert self._query_total_count(user) == 0
+
+        client.force_login(admin_user)
+        client.post(reverse("admin:create-workspace-group", args=[mailing_group.id]))
+
+        assert WorkspaceGroup.objects.get().system_mailing_group == mailing_group
+        assert self._query_total_count(user) == 1
@@ -119,10 +119,10 @@ class Person(sb.relay.Node):
                 fail_silently=True,
             )
         ],
-        only="id",
+        only="is_member",
     )
-    async def is_member(self, info: sb.Info) -> bool | None:
-        return await info.context.people_dataloaders["latest_is_member_for_people"].load(self.id)  # type: ignore[attr-defined]
+    def is_member(self) -> bool | None:
+        return self.is_member
 
     @sd.field(
         description="Whether the person is included in the census as an adult volunteer.",
@@ -133,10 +133,10 @@ class Person(sb.relay.Node):
                 fail_silently=True,
             )
         ],
-        only="id",
+        only="is_included_in_census",
     )
-    async def is_included_in_census(self, info: sb.Info) -> bool | None:
-        return await info.context.people_dataloaders["latest_is_included_in_census_for_people"].load(self.id)  # type: ignore[attr-defined]
+    def is_included_in_census(self) -> bool | None:
+        return self.is_included_in_census
 
     @sd.field(
         description="WiFi account",
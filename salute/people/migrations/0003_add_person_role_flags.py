@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:56
+
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+
+def populate_role_flags(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    Person = apps.get_model("people", "Person")
+    Role = apps.get_model("roles", "Role")
+    Person.objects.update(
+        **{
+            person_field: models.Exists(
+                Role.objects.filter(person=models.OuterRef("pk"), **{f"role_type__{role_type_field}": True})
+            )
+            for person_field, role_type_field in [
+                ("is_member", "is_member_role"),
+                ("is_included_in_census", "included_in_census"),
+                ("is_youth_member", "is_youth_member"),
+            ]
+        }
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("people", "0002_fix_tsa_email_priority"),
+        ("roles", "0011_add_mailing_list_filterable"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="person",
+            name="is_included_in_census",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="person",
+            name="is_member",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="person",
+            name="is_youth_member",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+        migrations.RunPython(
+            populate_role_flags,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -13,6 +13,14 @@ if TYPE_CHECKING:
     from salute.accounts.models import User
 
 
+# The flags stored on each person, and the role type flag that one of their roles must have for it to be set
+ROLE_FLAG_FIELDS = {
+    "is_member": "is_member_role",
+    "is_included_in_census": "included_in_census",
+    "is_youth_member": "is_youth_member",
+}
+
+
 class PersonQuerySet(models.QuerySet):
     def for_user(self, user: User) -> PersonQuerySet:
         if user.district_role_list:
@@ -20,35 +28,18 @@ class PersonQuerySet(models.QuerySet):
 
         return self.filter(id=user.person_id)
 
-    def annotate_is_member(self) -> PersonQuerySet:
-        return self.annotate(
-            is_member=models.Exists(
-                Role.objects.filter(
-                    person=models.OuterRef("pk"),
-                    role_type__is_member_role=True,
-                ).only("id")
-            )
-        )
-
-    def annotate_is_included_in_census(self) -> PersonQuerySet:
-        return self.annotate(
-            is_included_in_census=models.Exists(
-                Role.objects.filter(
-                    person=models.OuterRef("pk"),
-                    role_type__included_in_census=True,
-                ).only("id")
-            )
-        )
-
-    def annotate_is_youth_member(self) -> PersonQuerySet:
-        return self.annotate(
-            is_youth_member=models.Exists(
-                Role.objects.filter(
-                    person=models.OuterRef("pk"),
-                    role_type__is_youth_member=True,
-                ).only("id")
+    def update_role_flags(self) -> int:
+        """Recalculate the stored role flags, returning the number of people that have changed.
+
+        Only people whose flags have changed are written, so this is cheap to run after every sync.
+        """
+        role_flags = {
+            person_field: models.Exists(
+                Role.objects.filter(person=models.OuterRef("pk"), **{f"role_type__{role_type_field}": True})
             )
-        )
+            for person_field, role_type_field in ROLE_FLAG_FIELDS.items()
+        }
+        return self.exclude(**role_flags).update(**role_flags)
 
 
 PersonManager = models.Manager.from_queryset(PersonQuerySet)
@@ -66,6 +57,11 @@ class Person(TSAObject):
     phone_number = PhoneNumberField(null=True, editable=False)
     alternate_phone_number = PhoneNumberField(null=True, editable=False)
 
+    # Calculated from the person's roles by update_role_flags
+    is_member = models.BooleanField(default=False, editable=False, db_index=True)
+    is_included_in_census = models.BooleanField(default=False, editable=False, db_index=True)
+    is_youth_member = models.BooleanField(default=False, editable=False, db_index=True)
+
     # Generated Fields
     first_name = models.GeneratedField(
         expression=models.Case(
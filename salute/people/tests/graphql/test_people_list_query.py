@@ -375,6 +375,7 @@ class TestPersonMemberStatusQuery:
 
         RoleFactory.create(person=user_with_person.person, role_type=RoleTypeFactory.create(included_in_census=True))
         RoleFactory.create(person=user_with_person.person, role_type=RoleTypeFactory.create(is_member_role=True))
+        Person.objects.update_role_flags()
 
         client = TestClient(self.url)
         with client.login(user_with_person):
@@ -408,6 +409,7 @@ class TestPersonMemberStatusQuery:
             person=user_with_person.person,
             role_type=RoleTypeFactory.create(included_in_census=False, is_member_role=True),
         )
+        Person.objects.update_role_flags()
 
         client = TestClient(self.url)
         with client.login(user_with_person):
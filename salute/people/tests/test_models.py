@@ -5,6 +5,8 @@ from salute.accounts.models import DistrictUserRole, DistrictUserRoleType, User
 from salute.hierarchy.factories import DistrictFactory
 from salute.people.factories import PersonFactory
 from salute.people.models import Person
+from salute.roles.factories import RoleFactory, RoleTypeFactory
+from salute.roles.models import RoleType
 
 
 @pytest.mark.django_db
@@ -84,3 +86,35 @@ class TestPersonQueryset:
         user.save()
 
         assert Person.objects.for_user(user).count() == 5
+
+
+@pytest.mark.django_db
+class TestPersonRoleFlags:
+    def test_update_role_flags(self) -> None:
+        member_role_type = RoleTypeFactory(is_member_role=True, included_in_census=True)
+        youth_member_role_type = RoleTypeFactory(is_youth_member=True)
+        member = PersonFactory()
+        youth_member = PersonFactory()
+        non_member = PersonFactory()
+        RoleFactory(person=member, role_type=member_role_type)
+        RoleFactory(person=youth_member, role_type=youth_member_role_type)
+
+        assert Person.objects.update_role_flags() == 2
+        assert Person.objects.update_role_flags() == 0
+
+        flags = Person.objects.values_list("id", "is_member", "is_included_in_census", "is_youth_member")
+        assert set(flags) == {
+            (member.id, True, True, False),
+            (youth_member.id, False, False, True),
+            (non_member.id, False, False, False),
+        }
+
+    def test_update_role_flags__role_type_changed(self) -> None:
+        role = RoleFactory(role_type__is_member_role=True)
+        Person.objects.update_role_flags()
+        RoleType.objects.filter(id=role.role_type_id).update(is_member_role=False)
+
+        assert Person.objects.update_role_flags() == 1
+
+        role.person.refresh_from_db()
+        assert not role.person.is_member
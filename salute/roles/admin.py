@@ -1,9 +1,11 @@
 from django.contrib import admin
+from django.forms import ModelForm
 from django.http import HttpRequest
 
 from salute.core.admin import BaseModelAdminMixin
 from salute.core.models import BaseModel
 from salute.integrations.tsa.admin import TSAObjectModelAdminMixin
+from salute.people.models import ROLE_FLAG_FIELDS, Person
 
 from .models import Accreditation, AccreditationType, Role, RoleStatus, RoleType, Team, TeamType
 
@@ -103,6 +105,13 @@ class RoleTypeAdmin(BaseModelAdminMixin, admin.ModelAdmin):
     def has_change_permission(self, request: HttpRequest, obj: BaseModel | None = None) -> bool:
         return request.user.is_superuser
 
+    def save_model(self, request: HttpRequest, obj: RoleType, form: ModelForm, change: bool) -> None:  # noqa: FBT001
+        super().save_model(request, obj, form, change)
+
+        # The role flags stored on each person depend on the flags of their role types
+        if set(form.changed_data) & set(ROLE_FLAG_FIELDS.values()):
+            Person.objects.filter(roles__role_type=obj).update_role_flags()
+
 
 @admin.register(RoleStatus)
 class RoleStatusAdmin(BaseModelAdminMixin, admin.ModelAdmin):
@@ -18,6 +18,8 @@ from salute.mailing_groups import models as mailing_groups_models
 from salute.mailing_groups.graphql.graph_types import SystemMailingGroup
 from salute.people.graphql.graph_types import Person
 from salute.roles import models
+from salute.stats.graphql.graphql_types import SummaryDataPoint
+from salute.stats.graphql.resolvers import summary_history_field
 
 from .graph_filters import (
     AccreditationFilter,
@@ -106,6 +108,8 @@ class TeamInterface(sb.relay.Node):
         # See https://github.com/strawberry-graphql/strawberry-django/issues/549
         return await info.context.roles["person_count"].load(self.pk)  # type: ignore[attr-defined]
 
+    summary_history: list[SummaryDataPoint] = summary_history_field("team")
+
     @sd.field(
         description="The system mailing groups that this team belongs to. Only returns fully configured mailing groups.",  # noqa: E501
         deprecation_reason="Use system_mailing_groups with a filter instead.",
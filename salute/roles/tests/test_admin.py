@@ -0,0 +1,22 @@
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from salute.accounts.models import User
+from salute.roles.factories import RoleFactory
+
+
+@pytest.mark.django_db
+class TestRoleTypeAdmin:
+    def test_changing_flags_updates_people(self, admin_user: User, client: Client) -> None:
+        role = RoleFactory(role_type__is_member_role=False)
+        client.force_login(admin_user)
+
+        resp = client.post(
+            reverse("admin:roles_roletype_change", args=[role.role_type_id]),
+            {"display_priority": 100, "is_member_role": "on", "mailing_list_filterable": "on"},
+        )
+
+        assert resp.status_code == 302
+        role.person.refresh_from_db()
+        assert role.person.is_member
@@ -129,6 +129,22 @@ PHONENUMBER_DEFAULT_FORMAT = "INTERNATIONAL"
 PHONENUMBER_DEFAULT_REGION = "GB"
 PHONENUMBER_DB_FORMAT = "E164"
 
+# GraphQL
+# Responses are also invalidated whenever the data epoch is bumped
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60 * 60
+GRAPHQL_PERSISTED_QUERY_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+GRAPHQL_DOCUMENT_CACHE_SIZE = 256
+# Queries with a higher estimated cost are rejected, see salute.api.query_cost
+GRAPHQL_MAX_QUERY_COST = 50_000
+
+# Stats
+# Census trends and district statistics are also invalidated whenever the data epoch is bumped
+CENSUS_TRENDS_CACHE_TIMEOUT = 60 * 60 * 24
+DISTRICT_STATISTICS_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Waiting List
+WAITING_LIST_DEMAND_CACHE_TIMEOUT = 60 * 60 * 24
+
 # Birdbath
 BIRDBATH_REQUIRED = True
 BIRDBATH_PROCESSORS = [
@@ -1,8 +1,12 @@
 from django.contrib import admin
+from django.forms import ModelForm
+from django.http import HttpRequest
 
+from salute.stats.census import update_census_facts
 from salute.stats.models import (
     DistrictSummaryRecord,
     GroupSummaryRecord,
+    SectionCensusFact,
     SectionCensusReturn,
     SectionSummaryRecord,
     TeamSummaryRecord,
@@ -24,6 +28,27 @@ class SectionCensusReturnAdmin(admin.ModelAdmin):
     search_fields = ("section__shortcode", "section__unit_name")
     ordering = ("-year",)
 
+    def save_model(self, request: HttpRequest, obj: SectionCensusReturn, form: ModelForm, change: bool) -> None:  # noqa: FBT001
+        super().save_model(request, obj, form, change)
+
+        # The facts are derived from the data of the census return
+        update_census_facts([obj])
+
+
+@admin.register(SectionCensusFact)
+class SectionCensusFactAdmin(admin.ModelAdmin):
+    list_display = ("census_return", "category", "age", "volunteer_role", "gender", "count")
+    list_filter = ("category", "census_return__year", "gender")
+    search_fields = ("census_return__section__shortcode", "census_return__section__unit_name")
+    list_select_related = ("census_return__section",)
+
+    # The facts are derived from the census returns, so edits would be overwritten by the next import
+    def has_add_permission(self, request: HttpRequest, obj: SectionCensusFact | None = None) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: SectionCensusFact | None = None) -> bool:
+        return False
+
 
 @admin.register(TeamSummaryRecord)
 class TeamSummaryRecordAdmin(admin.ModelAdmin):
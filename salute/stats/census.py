@@ -0,0 +1,207 @@
+"""Normalisation and analysis of section census returns."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from operator import itemgetter
+from typing import Any
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Func, IntegerField, Q, QuerySet, Sum, Window
+from django.db.models.functions import Cast, Lag, Rank
+
+from salute.core.data_epoch import get_data_epoch
+from salute.stats.models import SectionCensusFact, SectionCensusFactCategory, SectionCensusReturn
+
+# These match the keys summed by the generated columns on SectionCensusReturn
+YOUNG_PERSON_KEY_RE = re.compile(r"^y_(?P<age>[0-9]+)_(?P<gender>m|f|p|s)$")
+VOLUNTEER_KEY_RE = re.compile(r"^l_(?P<volunteer_role>[a-z]+)_(?P<gender>m|f|p|s|xm|xf|xp|xs)$")
+COUNT_RE = re.compile(r"^[0-9]+$")
+
+
+def get_census_facts(census_return: SectionCensusReturn) -> list[SectionCensusFact]:
+    """Get the facts for the young person and volunteer counts in a census return.
+
+    Zero counts and values that are not whole numbers are skipped.
+    """
+    facts = []
+    for key, value in census_return.data.items():
+        value = str(value)
+        if not COUNT_RE.match(value) or int(value) == 0:
+            continue
+
+        if match := YOUNG_PERSON_KEY_RE.match(key):
+            facts.append(
+                SectionCensusFact(
+                    census_return=census_return,
+                    category=SectionCensusFactCategory.YOUNG_PERSON,
+                    age=int(match["age"]),
+                    gender=match["gender"],
+                    count=int(value),
+                )
+            )
+        elif match := VOLUNTEER_KEY_RE.match(key):
+            facts.append(
+                SectionCensusFact(
+                    census_return=census_return,
+                    category=SectionCensusFactCategory.VOLUNTEER,
+                    volunteer_role=match["volunteer_role"],
+                    gender=match["gender"],
+                    count=int(value),
+                )
+            )
+    return facts
+
+
+def update_census_facts(census_returns: Iterable[SectionCensusReturn]) -> None:
+    """Replace the facts for the given census returns."""
+    census_returns = list(census_returns)
+    with transaction.atomic():
+        SectionCensusFact.objects.filter(census_return__in=census_returns).delete()
+        SectionCensusFact.objects.bulk_create(
+            [fact for census_return in census_returns for fact in get_census_facts(census_return)],
+            batch_size=1000,
+        )
+
+
+@dataclass(frozen=True)
+class CensusTotals:
+    """Census totals for a district or group in a single year.
+
+    The changes are from the previous year, and are None if there were no returns in the previous year.
+    The rank is the position of a group within its district by number of young people.
+    """
+
+    group_id: UUID | None
+    section_count: int
+    total_young_people: int
+    total_volunteers: int
+    ratio_young_people_to_volunteers: Decimal
+    young_people_change: int | None
+    volunteers_change: int | None
+    young_people_rank: int | None = None
+
+
+@dataclass(frozen=True)
+class CensusYearTrend:
+    year: int
+    district: CensusTotals
+    groups: list[CensusTotals]
+
+
+def _get_census_trends_cache_key(district_id: UUID, year: int, *, epoch: int) -> str:
+    return f"CENSUS_TRENDS__{epoch}__{district_id}__{year}"
+
+
+def _annotate_census_totals(census_returns: QuerySet[SectionCensusReturn], *fields: str) -> QuerySet:
+    """Group the census returns by the fields, and annotate the totals and the totals for the previous row."""
+    # Sum returns a bigint, but the ratio function takes integers
+    total_young_people = Cast(Sum("total_young_people"), IntegerField())
+    total_volunteers = Cast(Sum("total_volunteers"), IntegerField())
+    partition_by = [F(field) for field in fields if field != "year"] or None
+    return (
+        census_returns.values(*fields)
+        .annotate(
+            section_count=Count("id"),
+            young_people=total_young_people,
+            volunteers=total_volunteers,
+            ratio=Func(
+                total_young_people,
+                total_volunteers,
+                function="ratio",
+                output_field=DecimalField(max_digits=6, decimal_places=2),
+            ),
+        )
+        .annotate(
+            previous_year=Window(Lag("year"), partition_by=partition_by, order_by=F("year").asc()),
+            previous_young_people=Window(Lag("young_people"), partition_by=partition_by, order_by=F("year").asc()),
+            previous_volunteers=Window(Lag("volunteers"), partition_by=partition_by, order_by=F("year").asc()),
+        )
+        .order_by(*fields)
+    )
+
+
+def _get_census_totals(row: dict[str, Any], *, group_id: UUID | None = None) -> CensusTotals:
+    has_previous_year = row["previous_year"] == row["year"] - 1
+    return CensusTotals(
+        group_id=group_id,
+        section_count=row["section_count"],
+        total_young_people=row["young_people"],
+        total_volunteers=row["volunteers"],
+        ratio_young_people_to_volunteers=row["ratio"],
+        young_people_change=row["young_people"] - row["previous_young_people"] if has_previous_year else None,
+        volunteers_change=row["volunteers"] - row["previous_volunteers"] if has_previous_year else None,
+        young_people_rank=row.get("young_people_rank"),
+    )
+
+
+def calculate_census_trends(district_id: UUID, *, start_year: int, end_year: int) -> dict[int, CensusYearTrend]:
+    """Calculate the district and group census totals for each year with returns.
+
+    The totals, year-on-year changes and rankings are all calculated by the database, using one
+    query for the district and one for its groups.
+    """
+    census_returns = SectionCensusReturn.objects.filter(
+        Q(section__district_id=district_id) | Q(section__group__district_id=district_id),
+        # Include the previous year so that the changes for the start year can be calculated
+        year__gte=start_year - 1,
+        year__lte=end_year,
+    )
+
+    trends = {
+        row["year"]: CensusYearTrend(year=row["year"], district=_get_census_totals(row), groups=[])
+        for row in _annotate_census_totals(census_returns, "year")
+        if row["year"] >= start_year
+    }
+
+    group_rows = _annotate_census_totals(
+        census_returns.filter(section__group__isnull=False), "year", "section__group_id"
+    ).annotate(
+        young_people_rank=Window(Rank(), partition_by=[F("year")], order_by=F("young_people").desc()),
+    )
+    for row in sorted(group_rows, key=itemgetter("year", "young_people_rank")):
+        if row["year"] >= start_year:
+            trends[row["year"]].groups.append(_get_census_totals(row, group_id=row["section__group_id"]))
+
+    return trends
+
+
+def get_census_trends(
+    district_id: UUID, *, start_year: int | None = None, end_year: int | None = None
+) -> list[CensusYearTrend]:
+    """Get the census trends for a district, ordered by year.
+
+    Census returns rarely change after they have been imported, so the trends for each year are cached
+    until the data epoch is bumped.
+    """
+    years_query = SectionCensusReturn.objects.filter(
+        Q(section__district_id=district_id) | Q(section__group__district_id=district_id)
+    )
+    if start_year is not None:
+        years_query = years_query.filter(year__gte=start_year)
+    if end_year is not None:
+        years_query = years_query.filter(year__lte=end_year)
+    years = sorted(years_query.values_list("year", flat=True).distinct())
+
+    epoch = get_data_epoch()
+    cache_keys = {year: _get_census_trends_cache_key(district_id, year, epoch=epoch) for year in years}
+    cached_trends = cache.get_many(cache_keys.values())
+    trends = {year: cached_trends[key] for year, key in cache_keys.items() if key in cached_trends}
+
+    if missing_years := [year for year in years if year not in trends]:
+        calculated_trends = calculate_census_trends(
+            district_id, start_year=min(missing_years), end_year=max(missing_years)
+        )
+        trends |= calculated_trends
+        cache.set_many(
+            {cache_keys[year]: trend for year, trend in calculated_trends.items()},
+            timeout=settings.CENSUS_TRENDS_CACHE_TIMEOUT,  # type: ignore[misc]
+        )
+
+    return [trends[year] for year in years]
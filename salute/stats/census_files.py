@@ -0,0 +1,49 @@
+"""Parsing of census return files.
+
+The files are parsed in worker processes, which may be started without setting up Django
+(e.g. with the spawn start method), so this module must not import Django or any models.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ParsedCensusFile:
+    file_name: str
+    reg_no: str
+    year: int
+    data: dict[str, Any]
+
+
+def parse_census_file(file_path: Path) -> ParsedCensusFile | str:
+    """Read and validate a census return file.
+
+    This runs in a worker process, so errors are returned as a message rather than raised.
+    """
+    try:
+        with file_path.open("r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+
+        # Basic validation
+        for key in ("data", "reg_no", "year"):
+            if key not in payload:
+                raise ValueError(f"Missing required key '{key}' in {file_path}")
+
+        reg_no = str(payload["reg_no"]).strip()
+        try:
+            year = int(payload["year"])
+        except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
+            raise ValueError(f"Invalid 'year' value in {file_path}: {payload['year']}") from exc
+
+        data = payload["data"]
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid 'data' value in {file_path}: expected object, got {type(data).__name__}")
+    except Exception as exc:  # noqa: BLE001
+        return f"Error processing {file_path}: {exc}"
+
+    return ParsedCensusFile(file_name=file_path.name, reg_no=reg_no, year=year, data=data)
@@ -0,0 +1,75 @@
+"""District-wide counts of people and roles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from salute.core.data_epoch import get_data_epoch
+from salute.people.models import Person
+from salute.roles.models import Role
+
+
+@dataclass(frozen=True)
+class DistrictStatistics:
+    """The number of people and roles in the district, including in groups."""
+
+    # The number of people for each combination of (is_member, is_included_in_census)
+    people_counts: dict[tuple[bool, bool], int]
+    youth_member_count: int
+    total_roles_count: int
+
+    def count_people(self, *, is_member: bool | None = None, is_included_in_census: bool | None = None) -> int:
+        return sum(
+            count
+            for (person_is_member, person_is_included_in_census), count in self.people_counts.items()
+            if is_member in (None, person_is_member) and is_included_in_census in (None, person_is_included_in_census)
+        )
+
+
+def get_district_statistics() -> DistrictStatistics:
+    """Count the people and roles in the district with a single aggregate query.
+
+    The counts only change when the data is synced, so they are cached until the data epoch is bumped.
+
+    Assumes only one district in the database.
+    """
+    cache_key = f"DISTRICT_STATISTICS__{get_data_epoch()}"
+    statistics: DistrictStatistics | None = cache.get(cache_key)
+    if statistics is not None:
+        return statistics
+
+    role_count = (
+        Role.objects.filter(person=OuterRef("pk"))
+        .order_by()
+        .values("person")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    counts = Person.objects.annotate(role_count=Subquery(role_count, output_field=IntegerField())).aggregate(
+        **{
+            f"people_{is_member}_{is_included_in_census}": Count(
+                "id", filter=Q(is_member=is_member, is_included_in_census=is_included_in_census)
+            )
+            for is_member in (True, False)
+            for is_included_in_census in (True, False)
+        },
+        youth_member_count=Count("id", filter=Q(is_youth_member=True)),
+        total_roles_count=Coalesce(Sum("role_count"), Value(0)),
+    )
+
+    statistics = DistrictStatistics(
+        people_counts={
+            (is_member, is_included_in_census): counts[f"people_{is_member}_{is_included_in_census}"]
+            for is_member in (True, False)
+            for is_included_in_census in (True, False)
+        },
+        youth_member_count=counts["youth_member_count"],
+        total_roles_count=counts["total_roles_count"],
+    )
+    cache.set(cache_key, statistics, timeout=settings.DISTRICT_STATISTICS_CACHE_TIMEOUT)  # type: ignore[misc]
+    return statistics
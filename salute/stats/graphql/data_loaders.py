@@ -1,13 +1,30 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from datetime import date
+from functools import partial
+from typing import Any
 from uuid import UUID
 
 from asgiref.sync import sync_to_async
-from django.db.models import Max
+from django.db.models import DateField, F, IntegerField, Value
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast, Coalesce, Trunc
 from strawberry.dataloader import DataLoader
 
-from salute.stats.models import SectionCensusReturn
+from salute.stats.district_statistics import DistrictStatistics, get_district_statistics
+from salute.stats.graphql.graphql_types import SummaryAggregationPeriod
+from salute.stats.models import (
+    BaseSummaryRecord,
+    DistrictSummaryRecord,
+    GroupSummaryRecord,
+    SectionCensusReturn,
+    SectionSummaryRecord,
+    TeamSummaryRecord,
+)
+
+# (unit_id, start_date, end_date, period, role_type_ids, include_sub_units)
+type SummaryHistoryKey = tuple[UUID, date | None, date | None, SummaryAggregationPeriod, tuple[UUID, ...], bool]
 
 
 async def load_latest_annual_subs_cost_for_sections(pks: list[UUID]) -> list[int | None]:
@@ -15,25 +32,12 @@ async def load_latest_annual_subs_cost_for_sections(pks: list[UUID]) -> list[int
 
     # Get the latest records using sync_to_async since distinct() is sync-only
     def _get_section_costs(pks: list[UUID]) -> dict[UUID, int]:
-        # Get the latest records for each section
-        latest_dates = (
+        section_costs = (
             SectionCensusReturn.objects.filter(section_id__in=pks)
-            .values("section_id")
-            .annotate(latest_date=Max("year"))
-        )
-
-        # Get the latest count for each section
-        section_counts = (
-            SectionCensusReturn.objects.filter(section_id__in=pks)
-            .filter(
-                id__in=SectionCensusReturn.objects.filter(section_id__in=latest_dates.values("section_id")).filter(
-                    year__in=latest_dates.values("latest_date")
-                )
-            )
+            .latest_per_parent("section_id", "year")
             .values_list("section_id", "annual_subs_cost")
         )
-
-        return dict(section_counts)
+        return dict(section_costs)
 
     count_dict = await sync_to_async(lambda: _get_section_costs(pks))()
 
@@ -48,49 +52,189 @@ async def load_census_returns_for_sections(
 
     Args:
         keys: List of tuples containing (section_id, start_year, end_year).
-            All keys in a batch are expected to have the same start_year and end_year.
-            start_year and end_year can be None.
+            start_year and end_year can be None. Keys in a batch may have different
+            year ranges, and are loaded with one query per distinct (start_year, end_year).
 
     Returns:
         A list of lists, where each inner list contains SectionCensusReturn objects
         for that section, ordered by year ascending.
     """
-    # Extract section IDs and parameters (all keys have the same year range)
-    if not keys:
-        return []
-    section_ids = [section_id for section_id, _, _ in keys]
-    _, start_year, end_year = keys[0]
-
-    def _get_census_returns(
-        pks: list[UUID], start_year: int | None, end_year: int | None
-    ) -> dict[UUID, list[SectionCensusReturn]]:
-        query = SectionCensusReturn.objects.filter(section_id__in=pks)
-        if start_year is not None:
-            query = query.filter(year__gte=start_year)
-        if end_year is not None:
-            query = query.filter(year__lte=end_year)
-
-        # Order by year ascending
-        census_returns = query.order_by("year")
-
-        # Group by section_id
-        result: defaultdict[UUID, list[SectionCensusReturn]] = defaultdict(list)
-        for census_return in census_returns:
-            result[census_return.section_id].append(census_return)
+    # Group the section IDs by the year range they were requested with
+    section_ids_by_range: defaultdict[tuple[int | None, int | None], list[UUID]] = defaultdict(list)
+    for section_id, start_year, end_year in keys:
+        section_ids_by_range[(start_year, end_year)].append(section_id)
+
+    def _get_census_returns() -> dict[tuple[UUID, int | None, int | None], list[SectionCensusReturn]]:
+        result: defaultdict[tuple[UUID, int | None, int | None], list[SectionCensusReturn]] = defaultdict(list)
+        for (start_year, end_year), pks in section_ids_by_range.items():
+            query = SectionCensusReturn.objects.filter(section_id__in=pks)
+            if start_year is not None:
+                query = query.filter(year__gte=start_year)
+            if end_year is not None:
+                query = query.filter(year__lte=end_year)
+
+            # Order by year ascending, and group by section_id
+            for census_return in query.order_by("year"):
+                result[(census_return.section_id, start_year, end_year)].append(census_return)
         return dict(result)
 
-    census_returns_dict = await sync_to_async(lambda: _get_census_returns(section_ids, start_year, end_year))()
+    census_returns_dict = await sync_to_async(_get_census_returns)()
 
     # Return results in the same order as input keys
-    return [census_returns_dict.get(section_id, []) for section_id, _, _ in keys]
+    return [census_returns_dict.get(key, []) for key in keys]
+
+
+def summary_history_for_units(
+    model: type[BaseSummaryRecord],
+    unit_field: str,
+    unit_ids: list[UUID],
+    *,
+    start_date: date | None,
+    end_date: date | None,
+    period: SummaryAggregationPeriod,
+    role_type_ids: tuple[UUID, ...],
+    include_sub_units: bool,
+) -> dict[UUID, list[dict[str, Any]]]:
+    """Load the summary records for multiple units, downsampled to one record per period.
+
+    The latest record in each period is used. The counts for the requested role types are extracted
+    from the JSON in the database, so the full count dictionaries are never loaded.
+
+    Args:
+        model: The summary record model to query
+        unit_field: The name of the foreign key to the unit on the model
+        unit_ids: List of unit UUIDs to fetch data for
+        start_date: Optional start date filter (inclusive)
+        end_date: Optional end date filter (inclusive)
+        period: Aggregation period (day, week, month or quarter)
+        role_type_ids: The role types to include counts for
+        include_sub_units: Whether to use the counts that include sub-units
+
+    Returns:
+        Dictionary mapping unit_id to a list of data points, ordered by period start
+    """
+    suffix = "_with_sub_units" if include_sub_units else ""
+    unit_id_field = f"{unit_field}_id"
+
+    query = model._default_manager.filter(**{f"{unit_id_field}__in": unit_ids})
+    if start_date is not None:
+        query = query.filter(date__gte=start_date)
+    if end_date is not None:
+        query = query.filter(date__lte=end_date)
+
+    period_start: F | Trunc
+    if period == SummaryAggregationPeriod.DAY:
+        period_start = F("date")
+    else:
+        period_start = Trunc("date", period.value, output_field=DateField())
+
+    role_type_counts = {
+        f"role_type_{index}": Coalesce(
+            Cast(KeyTextTransform(str(role_type_id), f"count_by_role_type{suffix}"), IntegerField()),
+            Value(0),
+        )
+        for index, role_type_id in enumerate(role_type_ids)
+    }
+
+    data = (
+        query.annotate(period_start=period_start)
+        .order_by(unit_id_field, "period_start", "-date")
+        .distinct(unit_id_field, "period_start")
+        .values(
+            unit_id_field, "period_start", "date", total_people_count=F(f"total_people{suffix}"), **role_type_counts
+        )
+    )
+
+    results: dict[UUID, list[dict[str, Any]]] = {unit_id: [] for unit_id in unit_ids}
+    for row in data:
+        results[row[unit_id_field]].append(
+            {
+                "period_start": row["period_start"],
+                "date": row["date"],
+                "total_people": row["total_people_count"],
+                "count_by_role_type": {
+                    role_type_id: row[f"role_type_{index}"] for index, role_type_id in enumerate(role_type_ids)
+                },
+            }
+        )
+    return results
+
+
+async def load_summary_history(
+    model: type[BaseSummaryRecord],
+    unit_field: str,
+    keys: list[SummaryHistoryKey],
+) -> list[list[dict[str, Any]]]:
+    """Load downsampled summary records for each unit.
+
+    Args:
+        model: The summary record model to query
+        unit_field: The name of the foreign key to the unit on the model
+        keys: List of tuples containing (unit_id, start_date, end_date, period, role_type_ids,
+            include_sub_units). Keys in a batch are loaded with one query per distinct set of parameters.
+
+    Returns:
+        A list of lists of data points, in the same order as the keys.
+    """
+    unit_ids_by_params: defaultdict[tuple[Any, ...], list[UUID]] = defaultdict(list)
+    for unit_id, *params in keys:
+        unit_ids_by_params[tuple(params)].append(unit_id)
+
+    def _get_summary_history() -> dict[SummaryHistoryKey, list[dict[str, Any]]]:
+        results = {}
+        for params, unit_ids in unit_ids_by_params.items():
+            start_date, end_date, period, role_type_ids, include_sub_units = params
+            data_dict = summary_history_for_units(
+                model,
+                unit_field,
+                unit_ids,
+                start_date=start_date,
+                end_date=end_date,
+                period=period,
+                role_type_ids=role_type_ids,
+                include_sub_units=include_sub_units,
+            )
+            for unit_id in unit_ids:
+                results[(unit_id, *params)] = data_dict[unit_id]
+        return results
+
+    data_by_key = await sync_to_async(_get_summary_history)()
+
+    return [data_by_key[key] for key in keys]
+
+
+async def load_district_statistics(pks: list[UUID]) -> list[DistrictStatistics]:
+    """Load the people and role counts for each district.
+
+    The counts are for the whole database, as there is only one district.
+    """
+    statistics = await sync_to_async(get_district_statistics)()
+    return [statistics for _ in pks]
 
 
 def create_stats_dataloaders() -> dict[str, DataLoader]:
     """Create a fresh set of data loaders for a new request context."""
     return {
         "latest_annual_subs_cost_for_sections": DataLoader(load_fn=load_latest_annual_subs_cost_for_sections),
+        "statistics_for_districts": DataLoader(load_fn=load_district_statistics),
         "census_returns_for_sections": DataLoader(
             load_fn=load_census_returns_for_sections,
             cache_key_fn=lambda key: key,  # (section_id, start_year, end_year)
         ),
+        "summary_history_for_districts": DataLoader(
+            load_fn=partial(load_summary_history, DistrictSummaryRecord, "district"),
+            cache_key_fn=lambda key: key,
+        ),
+        "summary_history_for_groups": DataLoader(
+            load_fn=partial(load_summary_history, GroupSummaryRecord, "group"),
+            cache_key_fn=lambda key: key,
+        ),
+        "summary_history_for_sections": DataLoader(
+            load_fn=partial(load_summary_history, SectionSummaryRecord, "section"),
+            cache_key_fn=lambda key: key,
+        ),
+        "summary_history_for_teams": DataLoader(
+            load_fn=partial(load_summary_history, TeamSummaryRecord, "team"),
+            cache_key_fn=lambda key: key,
+        ),
     }
@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+from datetime import date
 from decimal import Decimal
+from enum import Enum
+from typing import TYPE_CHECKING, Annotated
 
 import strawberry as sb
 
+if TYPE_CHECKING:
+    from salute.hierarchy.graphql.graph_types import Group
+
 
 @sb.type
 class SectionCensusReturn:
@@ -10,3 +18,58 @@ class SectionCensusReturn:
     total_volunteers: int
     total_young_people: int
     ratio_young_people_to_volunteers: Decimal
+
+
+@sb.enum
+class SummaryAggregationPeriod(Enum):
+    """The period over which to downsample summary records."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+
+
+@sb.type
+class RoleTypeCount:
+    role_type_id: sb.relay.GlobalID = sb.field(description="The ID of the role type")
+    count: int = sb.field(description="The number of roles of that type")
+
+
+@sb.type
+class SummaryDataPoint:
+    """The latest summary record in an aggregation period."""
+
+    period_start: date = sb.field(description="The start date of the aggregation period")
+    record_date: date = sb.field(description="The date of the summary record used for the period")
+    total_people: int = sb.field(description="The number of people on that date")
+    role_type_counts: list[RoleTypeCount] = sb.field(description="The number of roles of each requested role type")
+
+
+@sb.type
+class CensusTotals:
+    """Census totals for a unit in a single year."""
+
+    section_count: int = sb.field(description="The number of sections with a census return")
+    total_young_people: int
+    total_volunteers: int
+    ratio_young_people_to_volunteers: Decimal
+    young_people_change: int | None = sb.field(
+        description="The change in young people from the previous year, if there were returns that year"
+    )
+    volunteers_change: int | None = sb.field(
+        description="The change in volunteers from the previous year, if there were returns that year"
+    )
+
+
+@sb.type
+class GroupCensusTotals(CensusTotals):
+    group: Annotated[Group, sb.lazy("salute.hierarchy.graphql.graph_types")]
+    young_people_rank: int = sb.field(description="The position of the group in the district by young people")
+
+
+@sb.type
+class CensusYearTrend:
+    year: int
+    district: CensusTotals = sb.field(description="The totals for all sections in the district, including groups")
+    groups: list[GroupCensusTotals] = sb.field(description="The totals for each group, ordered by rank")
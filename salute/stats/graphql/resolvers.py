@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+from uuid import UUID
+
+import strawberry as sb
+import strawberry_django as sd
+from asgiref.sync import sync_to_async
+from graphql import GraphQLError
+from strawberry_django.permissions import HasPerm
+
+from salute.hierarchy.models import Group
+from salute.stats import census
+from salute.stats.graphql.graphql_types import CensusTotals as CensusTotalsType
+from salute.stats.graphql.graphql_types import (
+    CensusYearTrend,
+    GroupCensusTotals,
+    RoleTypeCount,
+    SummaryAggregationPeriod,
+    SummaryDataPoint,
+)
+
+
+def _get_role_type_ids(role_types: list[sb.relay.GlobalID]) -> tuple[UUID, ...]:
+    role_type_ids = []
+    for role_type in role_types:
+        if role_type.type_name != "RoleType":
+            raise GraphQLError(f"Expected a RoleType ID, got a {role_type.type_name} ID.")
+        try:
+            role_type_ids.append(UUID(role_type.node_id))
+        except ValueError:
+            raise GraphQLError(f"Invalid RoleType ID: {role_type}") from None
+    return tuple(role_type_ids)
+
+
+async def resolve_summary_history(
+    info: sb.Info,
+    dataloader_name: str,
+    unit_id: UUID,
+    *,
+    period: SummaryAggregationPeriod,
+    start_date: datetime.date | None,
+    end_date: datetime.date | None,
+    role_types: list[sb.relay.GlobalID] | None,
+    include_sub_units: bool = False,
+) -> list[SummaryDataPoint]:
+    """Load the downsampled summary history for a unit using one of the stats dataloaders."""
+    role_type_ids = _get_role_type_ids(role_types or [])
+
+    data = await info.context.stats_dataloaders[dataloader_name].load(
+        (unit_id, start_date, end_date, period, role_type_ids, include_sub_units)
+    )
+    return [
+        SummaryDataPoint(
+            period_start=item["period_start"],
+            record_date=item["date"],
+            total_people=item["total_people"],
+            role_type_counts=[
+                RoleTypeCount(role_type_id=sb.relay.GlobalID("RoleType", str(role_type_id)), count=count)
+                for role_type_id, count in item["count_by_role_type"].items()
+            ],
+        )
+        for item in data
+    ]
+
+
+def summary_history_field(unit_name: str, *, with_sub_units: bool = False) -> Any:
+    """Create the summary history field for a type of unit, or for teams.
+
+    The field uses the summary_history_for_{unit_name}s dataloader, and is empty unless the user has the
+    {unit_name}.view_summary_history permission. The includeSubUnits argument is only added with_sub_units.
+    """
+    dataloader_name = f"summary_history_for_{unit_name}s"
+
+    async def resolve_with_sub_units(
+        root: Any,
+        info: sb.Info,
+        *,
+        period: SummaryAggregationPeriod = SummaryAggregationPeriod.WEEK,
+        start_date: datetime.date | None = sb.UNSET,
+        end_date: datetime.date | None = sb.UNSET,
+        role_types: list[sb.relay.GlobalID] | None = sb.UNSET,
+        include_sub_units: bool = False,
+    ) -> list[SummaryDataPoint]:
+        return await resolve_summary_history(
+            info,
+            dataloader_name,
+            root.pk,
+            period=period,
+            start_date=None if start_date is sb.UNSET else start_date,
+            end_date=None if end_date is sb.UNSET else end_date,
+            role_types=None if role_types is sb.UNSET else role_types,
+            include_sub_units=include_sub_units,
+        )
+
+    async def resolve(
+        root: Any,
+        info: sb.Info,
+        *,
+        period: SummaryAggregationPeriod = SummaryAggregationPeriod.WEEK,
+        start_date: datetime.date | None = sb.UNSET,
+        end_date: datetime.date | None = sb.UNSET,
+        role_types: list[sb.relay.GlobalID] | None = sb.UNSET,
+    ) -> list[SummaryDataPoint]:
+        return await resolve_with_sub_units(
+            root, info, period=period, start_date=start_date, end_date=end_date, role_types=role_types
+        )
+
+    return sd.field(
+        resolver=resolve_with_sub_units if with_sub_units else resolve,
+        description=(
+            f"History of the summary records for the {unit_name}, using the latest record in each period. "
+            "Role counts are only included for the requested role types."
+        ),
+        only=["pk"],
+        extensions=[
+            HasPerm(
+                f"{unit_name}.view_summary_history",
+                message=f"You don't have permission to view the summary history for this {unit_name}.",
+                fail_silently=True,
+            )
+        ],
+    )
+
+
+def _get_census_totals_fields(totals: census.CensusTotals) -> dict[str, Any]:
+    return {
+        "section_count": totals.section_count,
+        "total_young_people": totals.total_young_people,
+        "total_volunteers": totals.total_volunteers,
+        "ratio_young_people_to_volunteers": totals.ratio_young_people_to_volunteers,
+        "young_people_change": totals.young_people_change,
+        "volunteers_change": totals.volunteers_change,
+    }
+
+
+async def resolve_census_trends(
+    district_id: UUID, *, start_year: int | None, end_year: int | None
+) -> list[CensusYearTrend]:
+    """Get the census trends for a district, with the groups loaded in a single query."""
+
+    def _get_census_trends() -> tuple[list[census.CensusYearTrend], dict[UUID, Group]]:
+        trends = census.get_census_trends(district_id, start_year=start_year, end_year=end_year)
+        groups = Group.objects.in_bulk({totals.group_id for trend in trends for totals in trend.groups})
+        return trends, groups
+
+    trends, groups = await sync_to_async(_get_census_trends)()
+    return [
+        CensusYearTrend(
+            year=trend.year,
+            district=CensusTotalsType(**_get_census_totals_fields(trend.district)),
+            groups=[
+                GroupCensusTotals(
+                    group=groups[totals.group_id],  # type: ignore[arg-type,index]
+                    young_people_rank=totals.young_people_rank,  # type: ignore[arg-type]
+                    **_get_census_totals_fields(totals),
+                )
+                for totals in trend.groups
+            ],
+        )
+        for trend in trends
+    ]
@@ -1,12 +1,15 @@
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
-from django.core.exceptions import MultipleObjectsReturned
 from django.core.management.base import BaseCommand, CommandError, CommandParser
 from django.db import transaction
 
+from salute.core.data_epoch import bump_data_epoch
 from salute.hierarchy.models import Section
+from salute.stats.census import update_census_facts
+from salute.stats.census_files import ParsedCensusFile, parse_census_file
 from salute.stats.models import SectionCensusDataFormatVersion, SectionCensusReturn
 
 
@@ -44,12 +47,26 @@ Expected JSON structure per file:
             default=SectionCensusDataFormatVersion.V1,
             help="Data format version for imported records (default: v1)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes used to parse files. Only worth increasing for large imports (default: 1)",
+        )
+
+    def _parse_files(self, files: list[Path], *, workers: int) -> list[ParsedCensusFile | str]:
+        if workers == 1:
+            return [parse_census_file(file_path) for file_path in files]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(parse_census_file, files, chunksize=max(len(files) // (workers * 4), 1)))
 
     def handle(self, *args: str, **options: Any) -> None:
         directory = Path(str(options["directory"]))
         dry_run = bool(options["dry_run"])
         fail_fast = bool(options["fail_fast"])
         data_format_version = int(options["format_version"])
+        workers = max(int(options["workers"]), 1)
 
         if not directory.exists() or not directory.is_dir():
             raise CommandError(f"Directory not found: {directory}")
@@ -60,77 +77,86 @@ Expected JSON structure per file:
             self.stdout.write(self.style.WARNING("No JSON files found to import."))
             return
 
-        created_count = 0
-        updated_count = 0
         error_count = 0
 
+        def _report_error(msg: str) -> None:
+            nonlocal error_count
+            error_count += 1
+            if fail_fast:
+                raise CommandError(msg)
+            self.stderr.write(self.style.ERROR(msg))
+
         self.stdout.write(f"Scanning {len(files)} file(s) in {directory} (dry_run={dry_run})")
 
-        for file_path in files:
-            try:
-                with file_path.open("r", encoding="utf-8") as fh:
-                    payload = json.load(fh)
-
-                # Basic validation
-                for key in ("data", "reg_no", "year"):
-                    if key not in payload:
-                        raise ValueError(f"Missing required key '{key}' in {file_path}")
-
-                reg_no = str(payload["reg_no"]).strip()
-                try:
-                    year = int(payload["year"])
-                except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
-                    raise ValueError(f"Invalid 'year' value in {file_path}: {payload['year']}") from exc
-
-                data = payload["data"]
-                if not isinstance(data, dict):
-                    raise ValueError(f"Invalid 'data' value in {file_path}: expected object, got {type(data).__name__}")
-
-                try:
-                    section = Section.objects.get(shortcode=reg_no)
-                except Section.DoesNotExist:
-                    raise CommandError(
-                        f"No section found with shortcode/reg_no '{reg_no}' (file: {file_path.name})"
-                    ) from None
-                except MultipleObjectsReturned:  # pragma: no cover - should not happen if shortcode is unique
-                    raise CommandError(
-                        f"Multiple sections found with shortcode/reg_no '{reg_no}' (file: {file_path.name})"
-                    ) from None
-
-                if dry_run:
-                    exists = SectionCensusReturn.objects.filter(section=section, year=year).exists()
-                    if exists:
-                        action = "UPDATE"
-                        updated_count += 1
-                    else:
-                        action = "CREATE"
-                        created_count += 1
-                    self.stdout.write(f"{action} section={section.id} year={year} from {file_path.name}")
-                    continue
-
-                with transaction.atomic():
-                    _, created = SectionCensusReturn.objects.update_or_create(
-                        section=section,
-                        year=year,
-                        defaults={
-                            "data_format_version": data_format_version,
-                            "data": data,
-                        },
-                    )
-
-                if created:
-                    created_count += 1
-                    self.stdout.write(self.style.SUCCESS(f"Created census return for {section} ({year})"))
-                else:
-                    updated_count += 1
-                    self.stdout.write(self.style.SUCCESS(f"Updated census return for {section} ({year})"))
-
-            except Exception as exc:  # noqa: BLE001
-                error_count += 1
-                msg = f"Error processing {file_path}: {exc}"
-                if fail_fast:
-                    raise CommandError(msg) from exc
-                self.stderr.write(self.style.ERROR(msg))
+        parsed_files = []
+        for result in self._parse_files(files, workers=workers):
+            if isinstance(result, str):
+                _report_error(result)
+            else:
+                parsed_files.append(result)
+
+        section_ids_by_shortcode = dict(
+            Section.objects.filter(shortcode__in={parsed.reg_no for parsed in parsed_files}).values_list(
+                "shortcode", "id"
+            )
+        )
+
+        # Later files take precedence if there are multiple returns for the same section and year
+        returns_to_import: dict[tuple[UUID, int], ParsedCensusFile] = {}
+        for parsed in parsed_files:
+            section_id = section_ids_by_shortcode.get(parsed.reg_no)
+            if section_id is None:
+                _report_error(
+                    f"Error processing {directory / parsed.file_name}: "
+                    f"No section found with shortcode/reg_no '{parsed.reg_no}' (file: {parsed.file_name})"
+                )
                 continue
+            returns_to_import[(section_id, parsed.year)] = parsed
+
+        existing_keys = set(
+            SectionCensusReturn.objects.filter(
+                section_id__in={section_id for section_id, _ in returns_to_import},
+                year__in={year for _, year in returns_to_import},
+            ).values_list("section_id", "year")
+        )
+
+        created_count = 0
+        updated_count = 0
+        for (section_id, year), parsed in returns_to_import.items():
+            if (section_id, year) in existing_keys:
+                action = "UPDATE"
+                updated_count += 1
+            else:
+                action = "CREATE"
+                created_count += 1
+            self.stdout.write(f"{action} section={section_id} year={year} from {parsed.file_name}")
+
+        if not dry_run:
+            with transaction.atomic():
+                SectionCensusReturn.objects.bulk_create(
+                    [
+                        SectionCensusReturn(
+                            section_id=section_id,
+                            year=year,
+                            data_format_version=data_format_version,
+                            data=parsed.data,
+                        )
+                        for (section_id, year), parsed in returns_to_import.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["section", "year"],
+                    update_fields=["data_format_version", "data", "updated_at"],
+                    batch_size=500,
+                )
+                imported_returns = SectionCensusReturn.objects.filter(
+                    section_id__in={section_id for section_id, _ in returns_to_import},
+                    year__in={year for _, year in returns_to_import},
+                ).only("id", "section_id", "year", "data")
+                update_census_facts(
+                    census_return
+                    for census_return in imported_returns
+                    if (census_return.section_id, census_return.year) in returns_to_import
+                )
+            bump_data_epoch()
 
         self.stdout.write(f"Finished: created={created_count}, updated={updated_count}, errors={error_count}")
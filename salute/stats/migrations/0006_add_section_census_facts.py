@@ -0,0 +1,108 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:03
+
+import re
+import uuid
+
+import django.db.models.deletion
+import django_choices_field.fields
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+import salute.stats.models
+
+YOUNG_PERSON_KEY_RE = re.compile(r"^y_(?P<age>[0-9]+)_(?P<gender>m|f|p|s)$")
+VOLUNTEER_KEY_RE = re.compile(r"^l_(?P<volunteer_role>[a-z]+)_(?P<gender>m|f|p|s|xm|xf|xp|xs)$")
+COUNT_RE = re.compile(r"^[0-9]+$")
+
+
+def populate_census_facts(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    SectionCensusReturn = apps.get_model("stats", "SectionCensusReturn")
+    SectionCensusFact = apps.get_model("stats", "SectionCensusFact")
+
+    facts = []
+    for census_return in SectionCensusReturn.objects.only("id", "data").iterator():
+        for key, value in census_return.data.items():
+            value = str(value)
+            if not COUNT_RE.match(value) or int(value) == 0:
+                continue
+
+            if match := YOUNG_PERSON_KEY_RE.match(key):
+                facts.append(
+                    SectionCensusFact(
+                        census_return=census_return,
+                        category="young_person",
+                        age=int(match["age"]),
+                        gender=match["gender"],
+                        count=int(value),
+                    )
+                )
+            elif match := VOLUNTEER_KEY_RE.match(key):
+                facts.append(
+                    SectionCensusFact(
+                        census_return=census_return,
+                        category="volunteer",
+                        volunteer_role=match["volunteer_role"],
+                        gender=match["gender"],
+                        count=int(value),
+                    )
+                )
+
+    SectionCensusFact.objects.bulk_create(facts, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("stats", "0005_remove_unneeded_fields_from_team_summary_records"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SectionCensusFact",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                        verbose_name="Salute ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "category",
+                    django_choices_field.fields.TextChoicesField(  # type: ignore[call-overload]
+                        choices=[("young_person", "Young person"), ("volunteer", "Volunteer")],
+                        choices_enum=salute.stats.models.SectionCensusFactCategory,
+                        max_length=12,
+                    ),
+                ),
+                ("age", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("volunteer_role", models.CharField(blank=True, max_length=16)),
+                ("gender", models.CharField(max_length=2)),
+                ("count", models.PositiveIntegerField()),
+                (
+                    "census_return",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facts",
+                        to="stats.sectioncensusreturn",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["category", "age"], name="idx_censusfact_category_age"),
+                    models.Index(fields=["category", "gender"], name="idx_censusfact_category_gender"),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            populate_census_facts,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hierarchy", "0006_add_osm_id_field"),
+        ("stats", "0006_add_section_census_facts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sectioncensusreturn",
+            index=models.Index(fields=["section", "-year"], name="idx_censusreturn_latest"),
+        ),
+    ]
@@ -1,8 +1,9 @@
 from django.db import models
 from django.db.models.fields.json import KeyTextTransform
 from django.db.models.functions import Cast
+from django_choices_field import TextChoicesField
 
-from salute.core.models import BaseModel
+from salute.core.models import BaseModel, LatestPerParentManager
 
 
 class SectionCensusDataFormatVersion(models.IntegerChoices):
@@ -70,6 +71,8 @@ class SectionCensusReturn(BaseModel):
         db_persist=True,
     )
 
+    objects = LatestPerParentManager()
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -80,12 +83,45 @@ class SectionCensusReturn(BaseModel):
         ordering = ["-year"]
         indexes = [
             models.Index(fields=["year"], name="idx_sectioncensusreturn_year"),
+            models.Index(fields=["section", "-year"], name="idx_censusreturn_latest"),
         ]
 
     def __str__(self) -> str:
         return f"{self.section} - {self.year}"
 
 
+class SectionCensusFactCategory(models.TextChoices):
+    YOUNG_PERSON = "young_person", "Young person"
+    VOLUNTEER = "volunteer", "Volunteer"
+
+
+class SectionCensusFact(BaseModel):
+    """A single count from a census return, in long format.
+
+    Young person counts have an age, and volunteer counts have a volunteer role.
+    """
+
+    census_return = models.ForeignKey(
+        SectionCensusReturn,
+        on_delete=models.CASCADE,
+        related_name="facts",
+    )
+    category = TextChoicesField(choices_enum=SectionCensusFactCategory)
+    age = models.PositiveSmallIntegerField(null=True, blank=True)
+    volunteer_role = models.CharField(max_length=16, blank=True)
+    gender = models.CharField(max_length=2)
+    count = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["category", "age"], name="idx_censusfact_category_age"),
+            models.Index(fields=["category", "gender"], name="idx_censusfact_category_gender"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.census_return} - {self.category} {self.age or self.volunteer_role} {self.gender}"
+
+
 class BaseSummaryRecord(BaseModel):
     date = models.DateField()
     total_people = models.IntegerField()
@@ -0,0 +1,170 @@
+"""Calculation of the daily summary records for teams and units."""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+from django.db import transaction
+
+from salute.hierarchy.models import District, Group, Section
+from salute.roles.models import Accreditation, Role, Team
+from salute.stats.models import DistrictSummaryRecord, GroupSummaryRecord, SectionSummaryRecord, TeamSummaryRecord
+
+SUMMARY_FIELDS = ["total_people", "count_by_role_type", "count_by_role_status", "count_by_accreditation_type"]
+SUB_UNIT_SUMMARY_FIELDS = [f"{field_name}_with_sub_units" for field_name in SUMMARY_FIELDS]
+
+
+@dataclass
+class Summary:
+    """The people, roles and accreditations in a set of teams."""
+
+    people: set[UUID] = field(default_factory=set)
+    count_by_role_type: Counter[UUID] = field(default_factory=Counter)
+    count_by_role_status: Counter[UUID] = field(default_factory=Counter)
+    count_by_accreditation_type: Counter[UUID] = field(default_factory=Counter)
+
+    @classmethod
+    def combine(cls, summaries: Iterable[Summary]) -> Summary:
+        combined = cls()
+        for summary in summaries:
+            combined.people |= summary.people
+            combined.count_by_role_type += summary.count_by_role_type
+            combined.count_by_role_status += summary.count_by_role_status
+            combined.count_by_accreditation_type += summary.count_by_accreditation_type
+        return combined
+
+    def get_record_data(self, *, key_suffix: str = "") -> dict[str, Any]:
+        return {
+            f"total_people{key_suffix}": len(self.people),
+            f"count_by_role_type{key_suffix}": {str(pk): count for pk, count in self.count_by_role_type.items()},
+            f"count_by_role_status{key_suffix}": {str(pk): count for pk, count in self.count_by_role_status.items()},
+            f"count_by_accreditation_type{key_suffix}": {
+                str(pk): count for pk, count in self.count_by_accreditation_type.items()
+            },
+        }
+
+
+def get_team_summaries() -> dict[UUID, Summary]:
+    """Get the summary for every team, using a single query for roles and one for accreditations."""
+    summaries: defaultdict[UUID, Summary] = defaultdict(Summary)
+
+    for team_id, person_id, role_type_id, status_id in Role.objects.values_list(
+        "team_id", "person_id", "role_type_id", "status_id"
+    ).order_by():
+        summary = summaries[team_id]
+        summary.people.add(person_id)
+        summary.count_by_role_type[role_type_id] += 1
+        summary.count_by_role_status[status_id] += 1
+
+    for team_id, accreditation_type_id in Accreditation.objects.values_list(
+        "team_id", "accreditation_type_id"
+    ).order_by():
+        summaries[team_id].count_by_accreditation_type[accreditation_type_id] += 1
+
+    return summaries
+
+
+def update_summary_records(day: date) -> None:
+    """Create or update the team, section, group and district summary records for a day.
+
+    The roles and accreditations are loaded once and rolled up through the hierarchy in memory.
+    """
+    team_summaries = get_team_summaries()
+
+    # Work out which teams belong to each unit
+    district_teams: defaultdict[UUID, list[UUID]] = defaultdict(list)
+    group_teams: defaultdict[UUID, list[UUID]] = defaultdict(list)
+    group_section_teams: defaultdict[UUID, list[UUID]] = defaultdict(list)
+    section_teams: defaultdict[UUID, list[UUID]] = defaultdict(list)
+    all_team_ids = []
+
+    for team_id, district_id, group_id, section_id, section_group_id, parent_team_group_id in Team.objects.values_list(
+        "id", "district_id", "group_id", "section_id", "section__group_id", "parent_team__group_id"
+    ).order_by():
+        all_team_ids.append(team_id)
+        if district_id is not None:
+            district_teams[district_id].append(team_id)
+        if group_id is not None:
+            group_teams[group_id].append(team_id)
+        if parent_team_group_id is not None:
+            group_teams[parent_team_group_id].append(team_id)
+        if section_id is not None:
+            section_teams[section_id].append(team_id)
+        if section_group_id is not None:
+            group_section_teams[section_group_id].append(team_id)
+
+    def summarise(team_ids: Iterable[UUID]) -> Summary:
+        return Summary.combine(team_summaries[team_id] for team_id in team_ids if team_id in team_summaries)
+
+    empty_sub_unit_data = Summary().get_record_data(key_suffix="_with_sub_units")
+    district_summary_with_sub_units = summarise(all_team_ids)
+
+    district_records = [
+        DistrictSummaryRecord(
+            district_id=district_id,
+            date=day,
+            **summarise(district_teams[district_id]).get_record_data(),
+            **district_summary_with_sub_units.get_record_data(key_suffix="_with_sub_units"),
+        )
+        for district_id in District.objects.values_list("id", flat=True)
+    ]
+
+    group_records = []
+    for group_id in Group.objects.values_list("id", flat=True):
+        group_summary = summarise(group_teams[group_id])
+        group_records.append(
+            GroupSummaryRecord(
+                group_id=group_id,
+                date=day,
+                **group_summary.get_record_data(),
+                **Summary.combine([group_summary, summarise(group_section_teams[group_id])]).get_record_data(
+                    key_suffix="_with_sub_units"
+                ),
+            )
+        )
+
+    section_records = [
+        SectionSummaryRecord(
+            section_id=section_id,
+            date=day,
+            **summarise(section_teams[section_id]).get_record_data(),
+            **empty_sub_unit_data,
+        )
+        for section_id in Section.objects.values_list("id", flat=True)
+    ]
+
+    team_records = [
+        TeamSummaryRecord(team_id=team_id, date=day, **summarise([team_id]).get_record_data())
+        for team_id in all_team_ids
+    ]
+
+    with transaction.atomic():
+        DistrictSummaryRecord.objects.bulk_create(
+            district_records,
+            update_conflicts=True,
+            unique_fields=["district", "date"],
+            update_fields=[*SUMMARY_FIELDS, *SUB_UNIT_SUMMARY_FIELDS, "updated_at"],
+        )
+        GroupSummaryRecord.objects.bulk_create(
+            group_records,
+            update_conflicts=True,
+            unique_fields=["group", "date"],
+            update_fields=[*SUMMARY_FIELDS, *SUB_UNIT_SUMMARY_FIELDS, "updated_at"],
+        )
+        SectionSummaryRecord.objects.bulk_create(
+            section_records,
+            update_conflicts=True,
+            unique_fields=["section", "date"],
+            update_fields=[*SUMMARY_FIELDS, *SUB_UNIT_SUMMARY_FIELDS, "updated_at"],
+        )
+        TeamSummaryRecord.objects.bulk_create(
+            team_records,
+            update_conflicts=True,
+            unique_fields=["team", "date"],
+            update_fields=[*SUMMARY_FIELDS, "updated_at"],
+        )
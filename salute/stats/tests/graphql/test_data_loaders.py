@@ -0,0 +1,134 @@
+from datetime import date
+from decimal import Decimal
+from functools import partial
+from uuid import uuid4
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from salute.hierarchy.factories import DistrictSectionFactory, GroupFactory
+from salute.hierarchy.models import Group
+from salute.stats.graphql.data_loaders import (
+    load_census_returns_for_sections,
+    load_latest_annual_subs_cost_for_sections,
+    load_summary_history,
+    summary_history_for_units,
+)
+from salute.stats.graphql.graphql_types import SummaryAggregationPeriod
+from salute.stats.models import GroupSummaryRecord, SectionCensusReturn
+
+
+@pytest.mark.django_db
+class TestLoadCensusReturnsForSections:
+    def test_keys_with_different_year_ranges(self) -> None:
+        section1 = DistrictSectionFactory()
+        section2 = DistrictSectionFactory()
+        for year in (2022, 2023, 2024):
+            SectionCensusReturn.objects.create(section=section1, year=year, data={})
+        SectionCensusReturn.objects.create(section=section2, year=2022, data={})
+
+        keys = [
+            (section1.id, None, None),
+            (section1.id, 2023, None),
+            (section1.id, None, 2022),
+            (section2.id, 2023, None),
+        ]
+        result = async_to_sync(load_census_returns_for_sections)(keys)
+
+        assert [[census_return.year for census_return in returns] for returns in result] == [
+            [2022, 2023, 2024],
+            [2023, 2024],
+            [2022],
+            [],
+        ]
+
+
+def _group_summary_record(group: Group, day: date, *, total_people: int, count_by_role_type: dict) -> None:
+    GroupSummaryRecord.objects.create(
+        group=group,
+        date=day,
+        total_people=total_people,
+        count_by_role_type=count_by_role_type,
+        count_by_role_status={},
+        count_by_accreditation_type={},
+        total_people_with_sub_units=total_people * 2,
+        count_by_role_type_with_sub_units={key: count * 2 for key, count in count_by_role_type.items()},
+        count_by_role_status_with_sub_units={},
+        count_by_accreditation_type_with_sub_units={},
+    )
+
+
+@pytest.mark.django_db
+class TestLoadSummaryHistory:
+    def test_downsample_to_latest_record_in_period(self) -> None:
+        group = GroupFactory()
+        role_type_id = uuid4()
+        _group_summary_record(group, date(2025, 1, 10), total_people=3, count_by_role_type={str(role_type_id): 1})
+        _group_summary_record(group, date(2025, 1, 20), total_people=4, count_by_role_type={str(role_type_id): 2})
+        _group_summary_record(group, date(2025, 2, 1), total_people=5, count_by_role_type={})
+
+        result = summary_history_for_units(
+            GroupSummaryRecord,
+            "group",
+            [group.id],
+            start_date=None,
+            end_date=None,
+            period=SummaryAggregationPeriod.MONTH,
+            role_type_ids=(role_type_id,),
+            include_sub_units=False,
+        )
+
+        assert result == {
+            group.id: [
+                {
+                    "period_start": date(2025, 1, 1),
+                    "date": date(2025, 1, 20),
+                    "total_people": 4,
+                    "count_by_role_type": {role_type_id: 2},
+                },
+                {
+                    "period_start": date(2025, 2, 1),
+                    "date": date(2025, 2, 1),
+                    "total_people": 5,
+                    "count_by_role_type": {role_type_id: 0},
+                },
+            ]
+        }
+
+    def test_keys_with_different_parameters(self) -> None:
+        group1 = GroupFactory()
+        group2 = GroupFactory()
+        role_type_id = uuid4()
+        for day in (date(2025, 1, 10), date(2025, 4, 10), date(2025, 4, 11)):
+            _group_summary_record(group1, day, total_people=day.day, count_by_role_type={str(role_type_id): 1})
+
+        keys = [
+            (group1.id, None, None, SummaryAggregationPeriod.DAY, (), False),
+            (group1.id, None, None, SummaryAggregationPeriod.QUARTER, (role_type_id,), True),
+            (group1.id, date(2025, 4, 1), None, SummaryAggregationPeriod.WEEK, (), False),
+            (group2.id, None, None, SummaryAggregationPeriod.DAY, (), False),
+        ]
+        result = async_to_sync(partial(load_summary_history, GroupSummaryRecord, "group"))(keys)
+
+        assert [[(item["date"], item["total_people"]) for item in data] for data in result] == [
+            [(date(2025, 1, 10), 10), (date(2025, 4, 10), 10), (date(2025, 4, 11), 11)],
+            [(date(2025, 1, 10), 20), (date(2025, 4, 11), 22)],
+            [(date(2025, 4, 11), 11)],
+            [],
+        ]
+        assert [item["count_by_role_type"] for item in result[1]] == [{role_type_id: 2}, {role_type_id: 2}]
+
+
+@pytest.mark.django_db
+class TestLoadLatestAnnualSubsCostForSections:
+    def test_sections_with_different_latest_years(self) -> None:
+        section1 = DistrictSectionFactory()
+        section2 = DistrictSectionFactory()
+        section3 = DistrictSectionFactory()
+        SectionCensusReturn.objects.create(section=section1, year=2024, data={"annual_cost": "20"})
+        SectionCensusReturn.objects.create(section=section1, year=2023, data={"annual_cost": "10"})
+        SectionCensusReturn.objects.create(section=section2, year=2023, data={"annual_cost": "30"})
+
+        result = async_to_sync(load_latest_annual_subs_cost_for_sections)([section1.id, section2.id, section3.id])
+
+        assert result == [Decimal("20.00"), Decimal("30.00"), None]
@@ -0,0 +1,40 @@
+import pytest
+from django.contrib import admin
+from django.test import RequestFactory
+
+from salute.accounts.models import User
+from salute.hierarchy.factories import DistrictSectionFactory
+from salute.stats.admin import SectionCensusFactAdmin, SectionCensusReturnAdmin
+from salute.stats.models import SectionCensusFact, SectionCensusFactCategory, SectionCensusReturn
+
+
+@pytest.mark.django_db
+class TestSectionCensusReturnAdmin:
+    def test_save_model_updates_facts(self, admin_user: User) -> None:
+        census_return = SectionCensusReturn.objects.create(
+            section=DistrictSectionFactory(), year=2020, data={"y_4_m": "4"}
+        )
+        census_return.data = {"y_4_m": "6", "l_asl_m": "2"}
+        request = RequestFactory().post("/")
+        request.user = admin_user
+
+        model_admin = SectionCensusReturnAdmin(SectionCensusReturn, admin.site)
+        form = model_admin.get_form(request, census_return)(instance=census_return)
+        model_admin.save_model(request, census_return, form, change=True)
+
+        assert set(census_return.facts.values_list("category", "count")) == {
+            (SectionCensusFactCategory.YOUNG_PERSON, 6),
+            (SectionCensusFactCategory.VOLUNTEER, 2),
+        }
+
+
+@pytest.mark.django_db
+class TestSectionCensusFactAdmin:
+    def test_read_only(self, admin_user: User) -> None:
+        request = RequestFactory().get("/")
+        request.user = admin_user
+
+        model_admin = SectionCensusFactAdmin(SectionCensusFact, admin.site)
+
+        assert not model_admin.has_add_permission(request)
+        assert not model_admin.has_change_permission(request)
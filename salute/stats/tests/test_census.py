@@ -0,0 +1,124 @@
+from decimal import Decimal
+
+import pytest
+from django.db.models import Sum
+from pytest_django import DjangoAssertNumQueries
+
+from salute.core.data_epoch import bump_data_epoch
+from salute.hierarchy.factories import DistrictFactory, DistrictSectionFactory, GroupFactory, GroupSectionFactory
+from salute.hierarchy.models import District, Group
+from salute.stats.census import (
+    CensusTotals,
+    calculate_census_trends,
+    get_census_facts,
+    get_census_trends,
+    update_census_facts,
+)
+from salute.stats.models import SectionCensusFact, SectionCensusFactCategory, SectionCensusReturn
+
+
+@pytest.mark.django_db
+class TestCensusFacts:
+    def test_get_census_facts(self) -> None:
+        census_return = SectionCensusReturn(
+            section=DistrictSectionFactory(),
+            year=2020,
+            data={
+                "y_4_m": "4",
+                "y_5_f": "0",
+                "y_6_x": "1",
+                "l_asl_xm": "3",
+                "l_sl_f": "n/a",
+                "annual_cost": "100",
+            },
+        )
+
+        facts = get_census_facts(census_return)
+
+        assert [(fact.category, fact.age, fact.volunteer_role, fact.gender, fact.count) for fact in facts] == [
+            (SectionCensusFactCategory.YOUNG_PERSON, 4, "", "m", 4),
+            (SectionCensusFactCategory.VOLUNTEER, None, "asl", "xm", 3),
+        ]
+
+    def test_update_census_facts__matches_generated_fields(self) -> None:
+        census_return = SectionCensusReturn.objects.create(
+            section=DistrictSectionFactory(),
+            year=2020,
+            data={"y_4_m": "4", "y_4_f": "2", "y_5_s": "1", "l_asl_m": "3", "l_sl_f": "4"},
+        )
+        SectionCensusFact.objects.create(
+            census_return=census_return, category=SectionCensusFactCategory.VOLUNTEER, gender="m", count=100
+        )
+
+        update_census_facts([census_return])
+
+        totals = dict(
+            census_return.facts.values("category").annotate(total=Sum("count")).values_list("category", "total")
+        )
+        census_return.refresh_from_db()
+        assert totals == {
+            SectionCensusFactCategory.YOUNG_PERSON: census_return.total_young_people,
+            SectionCensusFactCategory.VOLUNTEER: census_return.total_volunteers,
+        }
+
+
+@pytest.mark.django_db
+class TestCensusTrends:
+    def _create_returns(self) -> tuple[District, Group, Group]:
+        district = DistrictFactory()
+        group1 = GroupFactory(district=district)
+        group2 = GroupFactory(district=district)
+        section1 = GroupSectionFactory(group=group1)
+        section2 = GroupSectionFactory(group=group2)
+        district_section = DistrictSectionFactory(district=district)
+        for section, year, young_people in [
+            (section1, 2020, 5),
+            (section1, 2021, 7),
+            (section2, 2021, 10),
+            (district_section, 2021, 2),
+            (section2, 2023, 3),
+        ]:
+            SectionCensusReturn.objects.create(
+                section=section, year=year, data={"y_8_m": str(young_people), "l_sl_m": "1"}
+            )
+        return district, group1, group2
+
+    def test_calculate_census_trends(self) -> None:
+        district, group1, group2 = self._create_returns()
+
+        trends = calculate_census_trends(district.id, start_year=2021, end_year=2023)
+
+        assert list(trends) == [2021, 2023]
+        assert trends[2021].district == CensusTotals(
+            group_id=None,
+            section_count=3,
+            total_young_people=19,
+            total_volunteers=3,
+            ratio_young_people_to_volunteers=Decimal("6.33"),
+            young_people_change=14,
+            volunteers_change=2,
+        )
+        assert [
+            (totals.group_id, totals.young_people_rank, totals.young_people_change) for totals in trends[2021].groups
+        ] == [
+            (group2.id, 1, None),
+            (group1.id, 2, 2),
+        ]
+        # There were no returns in 2022
+        assert trends[2023].district.young_people_change is None
+        assert [totals.group_id for totals in trends[2023].groups] == [group2.id]
+
+    def test_get_census_trends__cached(self, django_assert_num_queries: DjangoAssertNumQueries) -> None:
+        district, _, _ = self._create_returns()
+
+        with django_assert_num_queries(4):
+            trends = get_census_trends(district.id)
+        assert [trend.year for trend in trends] == [2020, 2021, 2023]
+
+        with django_assert_num_queries(2):
+            assert get_census_trends(district.id, start_year=2021) == trends[1:]
+
+        # Imports bump the data epoch, which invalidates the trends in every process
+        bump_data_epoch()
+        with django_assert_num_queries(4):
+            assert get_census_trends(district.id) == trends
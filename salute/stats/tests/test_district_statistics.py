@@ -0,0 +1,57 @@
+import pytest
+from django.core.cache import cache
+from pytest_django import DjangoAssertNumQueries
+
+from salute.core.data_epoch import bump_data_epoch
+from salute.people.factories import PersonFactory
+from salute.people.models import Person
+from salute.roles.factories import RoleFactory, RoleTypeFactory
+from salute.stats.district_statistics import DistrictStatistics, get_district_statistics
+
+
+@pytest.mark.django_db
+class TestDistrictStatistics:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        cache.clear()
+
+    def test_get_district_statistics(self, django_assert_num_queries: DjangoAssertNumQueries) -> None:
+        member_role_type = RoleTypeFactory(is_member_role=True, included_in_census=True)
+        non_census_member_role_type = RoleTypeFactory(is_member_role=True, included_in_census=False)
+        youth_member_role_type = RoleTypeFactory(is_youth_member=True)
+        other_role_type = RoleTypeFactory()
+
+        member = PersonFactory()
+        RoleFactory.create_batch(2, person=member, role_type=member_role_type)
+        RoleFactory(person=member, role_type=youth_member_role_type)
+        RoleFactory(role_type=non_census_member_role_type)
+        RoleFactory(role_type=youth_member_role_type)
+        RoleFactory(role_type=other_role_type)
+        PersonFactory()
+        Person.objects.update_role_flags()
+
+        with django_assert_num_queries(2):  # Data epoch and aggregate
+            statistics = get_district_statistics()
+
+        assert statistics == DistrictStatistics(
+            people_counts={(True, True): 1, (True, False): 1, (False, True): 0, (False, False): 3},
+            youth_member_count=2,
+            total_roles_count=6,
+        )
+        assert statistics.count_people() == 5
+        assert statistics.count_people(is_member=True) == 2
+        assert statistics.count_people(is_included_in_census=True) == 1
+        assert statistics.count_people(is_member=False, is_included_in_census=False) == 3
+
+    def test_get_district_statistics__cached_until_epoch_bumped(
+        self, django_assert_num_queries: DjangoAssertNumQueries
+    ) -> None:
+        PersonFactory()
+        assert get_district_statistics().count_people() == 1
+
+        PersonFactory()
+        with django_assert_num_queries(1):  # Data epoch
+            assert get_district_statistics().count_people() == 1
+
+        bump_data_epoch()
+        assert get_district_statistics().count_people() == 2
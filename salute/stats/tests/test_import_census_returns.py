@@ -0,0 +1,90 @@
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from salute.hierarchy.factories import DistrictSectionFactory
+from salute.stats.census_files import ParsedCensusFile, parse_census_file
+from salute.stats.models import SectionCensusFact, SectionCensusFactCategory, SectionCensusReturn
+
+
+def _write_return(directory: Path, name: str, *, reg_no: str, year: int, data: dict) -> None:
+    (directory / name).write_text(json.dumps({"data": data, "reg_no": reg_no, "year": str(year)}))
+
+
+class TestParseCensusFile:
+    def test_parse__spawned_process(self, tmp_path: Path) -> None:
+        # Spawned workers import the parsing module without setting up Django
+        _write_return(tmp_path, "a-2024.json", reg_no=" S100 ", year=2024, data={"y_8_m": "5"})
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            result = executor.submit(parse_census_file, tmp_path / "a-2024.json").result()
+
+        assert result == ParsedCensusFile(file_name="a-2024.json", reg_no="S100", year=2024, data={"y_8_m": "5"})
+
+
+@pytest.mark.django_db
+class TestImportCensusReturnsCommand:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_import(self, tmp_path: Path, workers: int) -> None:
+        section = DistrictSectionFactory()
+        SectionCensusReturn.objects.create(section=section, year=2023, data={"old": "1"})
+        _write_return(tmp_path, "a-2023.json", reg_no=section.shortcode, year=2023, data={"new": "1"})
+        _write_return(tmp_path, "a-2024.json", reg_no=section.shortcode, year=2024, data={"new": "2"})
+        _write_return(tmp_path, "b-2024.json", reg_no="UNKNOWN", year=2024, data={})
+        (tmp_path / "c-2024.json").write_text("{}")
+
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_census_returns", str(tmp_path), workers=workers, stdout=stdout, stderr=stderr)
+
+        assert "Finished: created=1, updated=1, errors=2" in stdout.getvalue()
+        assert "No section found with shortcode/reg_no 'UNKNOWN'" in stderr.getvalue()
+        assert "Missing required key 'data'" in stderr.getvalue()
+        assert dict(SectionCensusReturn.objects.filter(section=section).values_list("year", "data")) == {
+            2023: {"new": "1"},
+            2024: {"new": "2"},
+        }
+
+    def test_import__census_facts(self, tmp_path: Path) -> None:
+        section = DistrictSectionFactory()
+        census_return = SectionCensusReturn.objects.create(section=section, year=2023, data={"y_8_m": "5"})
+        SectionCensusFact.objects.create(
+            census_return=census_return, category=SectionCensusFactCategory.YOUNG_PERSON, age=8, gender="m", count=5
+        )
+        _write_return(tmp_path, "a-2023.json", reg_no=section.shortcode, year=2023, data={"y_8_f": "2", "l_sl_m": "1"})
+
+        call_command("import_census_returns", str(tmp_path), workers=1, stdout=StringIO())
+
+        assert set(
+            SectionCensusFact.objects.values_list("census_return__year", "category", "age", "gender", "count")
+        ) == {
+            (2023, SectionCensusFactCategory.YOUNG_PERSON, 8, "f", 2),
+            (2023, SectionCensusFactCategory.VOLUNTEER, None, "m", 1),
+        }
+
+    def test_import__dry_run(self, tmp_path: Path) -> None:
+        section = DistrictSectionFactory()
+        SectionCensusReturn.objects.create(section=section, year=2023, data={"old": "1"})
+        _write_return(tmp_path, "a-2023.json", reg_no=section.shortcode, year=2023, data={"new": "1"})
+        _write_return(tmp_path, "a-2024.json", reg_no=section.shortcode, year=2024, data={"new": "2"})
+
+        stdout = StringIO()
+        call_command("import_census_returns", str(tmp_path), dry_run=True, workers=1, stdout=stdout)
+
+        assert f"UPDATE section={section.id} year=2023 from a-2023.json" in stdout.getvalue()
+        assert f"CREATE section={section.id} year=2024 from a-2024.json" in stdout.getvalue()
+        assert dict(SectionCensusReturn.objects.filter(section=section).values_list("year", "data")) == {
+            2023: {"old": "1"},
+        }
+
+    def test_import__fail_fast(self, tmp_path: Path) -> None:
+        _write_return(tmp_path, "b-2024.json", reg_no="UNKNOWN", year=2024, data={})
+
+        with pytest.raises(CommandError, match="No section found"):
+            call_command("import_census_returns", str(tmp_path), fail_fast=True, workers=1, stdout=StringIO())
+
+        assert not SectionCensusReturn.objects.exists()
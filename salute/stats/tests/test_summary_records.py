@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+
+from salute.hierarchy.factories import DistrictFactory, GroupFactory, GroupSectionFactory
+from salute.roles.factories import (
+    AccreditationFactory,
+    GroupSectionTeamFactory,
+    GroupSubTeamFactory,
+    GroupTeamFactory,
+    RoleFactory,
+    RoleStatusFactory,
+    RoleTypeFactory,
+    TeamFactory,
+)
+from salute.stats.models import DistrictSummaryRecord, GroupSummaryRecord, SectionSummaryRecord, TeamSummaryRecord
+from salute.stats.summary_records import update_summary_records
+
+
+@pytest.mark.django_db
+class TestUpdateSummaryRecords:
+    def test_rolls_up_through_hierarchy(self) -> None:
+        district = DistrictFactory()
+        group = GroupFactory(district=district)
+        section = GroupSectionFactory(group=group)
+
+        district_team = TeamFactory(district=district)
+        group_team = GroupTeamFactory(group=group)
+        group_sub_team = GroupSubTeamFactory(parent_team=group_team)
+        section_team = GroupSectionTeamFactory(section=section)
+
+        leader = RoleTypeFactory()
+        helper = RoleTypeFactory()
+        full = RoleStatusFactory()
+
+        RoleFactory(team=district_team, role_type=leader, status=full)
+        RoleFactory(team=group_team, role_type=leader, status=full)
+        # The same person has a role in the sub-team and the section
+        sub_team_role = RoleFactory(team=group_sub_team, role_type=helper, status=full)
+        RoleFactory(team=section_team, person=sub_team_role.person, role_type=helper, status=full)
+        accreditation = AccreditationFactory(team=section_team, person=sub_team_role.person)
+
+        update_summary_records(date(2024, 1, 1))
+
+        district_record = DistrictSummaryRecord.objects.get(district=district)
+        assert district_record.total_people == 1
+        assert district_record.count_by_role_type == {str(leader.id): 1}
+        assert district_record.total_people_with_sub_units == 3
+        assert district_record.count_by_role_type_with_sub_units == {str(leader.id): 2, str(helper.id): 2}
+        assert district_record.count_by_role_status_with_sub_units == {str(full.id): 4}
+        assert district_record.count_by_accreditation_type_with_sub_units == {
+            str(accreditation.accreditation_type_id): 1
+        }
+
+        group_record = GroupSummaryRecord.objects.get(group=group)
+        assert group_record.total_people == 2
+        assert group_record.count_by_role_type == {str(leader.id): 1, str(helper.id): 1}
+        assert group_record.count_by_accreditation_type == {}
+        assert group_record.total_people_with_sub_units == 2
+        assert group_record.count_by_role_type_with_sub_units == {str(leader.id): 1, str(helper.id): 2}
+        assert group_record.count_by_accreditation_type_with_sub_units == {str(accreditation.accreditation_type_id): 1}
+
+        section_record = SectionSummaryRecord.objects.get(section=section)
+        assert section_record.total_people == 1
+        assert section_record.count_by_role_type == {str(helper.id): 1}
+        assert section_record.total_people_with_sub_units == 0
+        assert section_record.count_by_role_type_with_sub_units == {}
+
+        team_records = {record.team_id: record for record in TeamSummaryRecord.objects.all()}
+        assert team_records[district_team.id].total_people == 1
+        assert team_records[group_sub_team.id].count_by_role_type == {str(helper.id): 1}
+        assert {team_records[team.id].total_people for team in (group_team, section_team)} == {1}
+
+    def test_updates_existing_records(self) -> None:
+        team = GroupTeamFactory()
+        update_summary_records(date(2024, 1, 1))
+        assert TeamSummaryRecord.objects.get(team=team).total_people == 0
+
+        RoleFactory(team=team)
+        update_summary_records(date(2024, 1, 1))
+
+        assert TeamSummaryRecord.objects.get(team=team).total_people == 1
+        assert GroupSummaryRecord.objects.get(group=team.group).total_people == 1